@@ -0,0 +1,112 @@
+# benchmarks/bench_collect_links.py
+"""
+Benchmark: utils.dom.collect_links on a page with several hundred anchors (a big admin menu).
+Compares the previous find_elements + get_attribute-per-anchor loop with the single
+execute_script call. Needs a local Chrome (headless; chromedriver via Selenium Manager).
+
+    python -m benchmarks.bench_collect_links [--anchors 600] [--rounds 5]
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+import threading
+from functools import partial
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+from urllib.parse import urljoin
+
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+
+from utils.dom import collect_links
+
+
+def _legacy_collect_links(driver, include_same_origin_only=True):
+    # Previous implementation: one WebDriver round trip per anchor
+    origin = driver.execute_script("return window.location.origin;")
+    hrefs = []
+    for a in driver.find_elements(By.CSS_SELECTOR, "a[href]"):
+        try:
+            href = a.get_attribute("href")
+            if not href:
+                continue
+            if include_same_origin_only and not href.startswith(origin):
+                if href.startswith("http"):
+                    continue
+            hrefs.append(urljoin(origin + "/", href))
+        except Exception:
+            continue
+    return sorted(set(hrefs))
+
+
+def _page(n):
+    items = []
+    for i in range(n):
+        if i % 10 == 0:
+            items.append(f'<li><a href="https://example.org/ext/{i}" target="_blank" rel="noopener">External {i}</a></li>')
+        else:
+            items.append(f'<li><a href="/module/{i % 40}/item/{i}">Menu item {i}</a></li>')
+    return f"<html><body><nav><ul>{''.join(items)}</ul></nav></body></html>"
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+def _count_commands(driver):
+    calls = {"n": 0}
+    execute = driver.execute
+    def counted(*args, **kwargs):
+        calls["n"] += 1
+        return execute(*args, **kwargs)
+    driver.execute = counted
+    return calls
+
+
+def _timed(fn, driver, calls, rounds):
+    calls["n"] = 0
+    t0 = time.perf_counter()
+    for _ in range(rounds):
+        result = fn(driver)
+    return (time.perf_counter() - t0) / rounds, calls["n"] // rounds, result
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--anchors", type=int, default=600)
+    ap.add_argument("--rounds", type=int, default=5)
+    ap.add_argument("--headed", action="store_true")
+    args = ap.parse_args(argv)
+
+    folder = tempfile.mkdtemp()
+    # Served over http so window.location.origin is a real origin (file:// has "null")
+    with open(os.path.join(folder, "index.html"), "w", encoding="utf-8") as f:
+        f.write(_page(args.anchors))
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), partial(_QuietHandler, directory=folder))
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+
+    options = webdriver.ChromeOptions()
+    if not args.headed:
+        options.add_argument("--headless=new")
+    driver = webdriver.Chrome(options=options)
+    try:
+        driver.get(f"http://127.0.0.1:{srv.server_address[1]}/index.html")
+        calls = _count_commands(driver)
+        legacy, legacy_cmds, old = _timed(_legacy_collect_links, driver, calls, args.rounds)
+        single, single_cmds, new = _timed(collect_links, driver, calls, args.rounds)
+    finally:
+        driver.quit()
+        srv.shutdown()
+
+    assert old == new, "collectors disagree"
+    print(f"{args.anchors} anchors, {len(new)} same-origin links")
+    print(f"  find_elements + get_attribute : {legacy * 1000:8.1f} ms  ({legacy_cmds} WebDriver commands)")
+    print(f"  single execute_script         : {single * 1000:8.1f} ms  ({single_cmds} WebDriver command)"
+          f"   {legacy / single:.0f}x faster")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+# benchmarks/bench_links.py
+"""
+Benchmark: link checking against a local HTTP server with slow pages.
+Compares the previous one-URL-at-a-time requests.head/get loop with utils.links.LinkChecker.
+/file/<n> links are 2 MB downloads whose server rejects HEAD (405), so the old full GET
+fallback pulls every body; the bytes each checker made the server send are reported too.
+
+    python -m benchmarks.bench_links [--links 40] [--delay 0.2]
+"""
+import sys
+import time
+import random
+import argparse
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import requests
+
+from utils.links import LinkChecker, ALLOWED_STATUSES
+
+
+FILE_SIZE = 2 * 1024 * 1024
+_sent = [0]
+
+
+def _server(delay):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _file(self, body):
+            if not body:
+                self.send_response(405)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            ranged = self.headers.get("Range") == "bytes=0-0"
+            size = 1 if ranged else FILE_SIZE
+            self.send_response(206 if ranged else 200)
+            if ranged:
+                self.send_header("Content-Range", f"bytes 0-0/{FILE_SIZE}")
+            self.send_header("Content-Type", "application/pdf")
+            self.send_header("Content-Length", str(size))
+            self.end_headers()
+            try:
+                for i in range(0, size, 65536):
+                    self.wfile.write(b"%" * min(65536, size - i))
+                    _sent[0] += min(65536, size - i)
+            except (BrokenPipeError, ConnectionResetError):
+                pass    # client closed after the headers
+
+        def _reply(self, body):
+            # /slow/<n> sleeps a random fraction of delay, /missing/<n> is a 404, /old/<n> redirects,
+            # /file/<n> is a large download that does not support HEAD
+            path = self.path
+            if path.startswith("/file/"):
+                return self._file(body)
+            if path.startswith("/slow/"):
+                time.sleep(random.uniform(0.2, 1.0) * delay)
+            if path.startswith("/old/"):
+                self.send_response(301)
+                self.send_header("Location", path.replace("/old/", "/slow/", 1))
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            code = 404 if path.startswith("/missing/") else 200
+            data = b"ok" * 64
+            self.send_response(code)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            if body:
+                self.wfile.write(data)
+
+        def do_HEAD(self):
+            self._reply(False)
+
+        def do_GET(self):
+            self._reply(True)
+
+        def log_message(self, *args):
+            pass
+
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    return srv
+
+
+def _legacy_check(url):
+    # Previous per-test helper: new connection per call, sequential
+    try:
+        r = requests.head(url, allow_redirects=True, timeout=15)
+        if r.status_code not in ALLOWED_STATUSES:
+            r = requests.get(url, allow_redirects=True, timeout=15)
+        return r.status_code in ALLOWED_STATUSES, r.status_code
+    except Exception:
+        return False, None
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--links", type=int, default=40)
+    ap.add_argument("--delay", type=float, default=0.2, help="Max server delay per slow page (s)")
+    args = ap.parse_args(argv)
+
+    random.seed(1)
+    srv = _server(args.delay)
+    base = f"http://127.0.0.1:{srv.server_address[1]}"
+    kinds = ["slow", "slow", "slow", "old", "missing", "file"]
+    urls = [f"{base}/{kinds[i % len(kinds)]}/{i}" for i in range(args.links)]
+
+    t0 = time.perf_counter()
+    legacy_bad = [(u, code) for u in urls for ok, code in [_legacy_check(u)] if not ok]
+    legacy = time.perf_counter() - t0
+    legacy_bytes, _sent[0] = _sent[0], 0
+
+    checker = LinkChecker(max_workers=16, per_host=16)
+    t0 = time.perf_counter()
+    results = checker.check(urls)
+    pooled = time.perf_counter() - t0
+    pooled_bytes = _sent[0]
+    checker.close()
+    srv.shutdown()
+
+    bad = [(r.url, r.status) for r in results if not r.ok]
+    assert bad == legacy_bad, "checkers disagree"
+    slowest = max(r.latency for r in results)
+    print(f"{len(urls)} links, {len(bad)} broken")
+    ttfb = sorted(r.ttfb for r in results if r.ttfb is not None)
+    print(f"  sequential   : {legacy * 1000:8.1f} ms   {legacy_bytes / 1024:9.0f} KiB of bodies")
+    print(f"  LinkChecker  : {pooled * 1000:8.1f} ms   {pooled_bytes / 1024:9.0f} KiB of bodies   "
+          f"({legacy / pooled:.1f}x faster; slowest link {slowest * 1000:.0f} ms)")
+    print(f"  ttfb         : median {ttfb[len(ttfb) // 2] * 1000:.0f} ms, max {ttfb[-1] * 1000:.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+# benchmarks/bench_locators.py
+"""
+Benchmark: locator fallbacks when only a later candidate matches (the Save button rendered
+differently than the primary locator expects). Compares the previous serial loop - one
+WebDriverWait per candidate - with BasePage._click_first_available, which polls all
+candidates in one execute_script per poll. Needs a local Chrome (headless).
+
+    python -m benchmarks.bench_locators [--winner 3] [--timeout-each 2] [--delay 0.5]
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+import threading
+from functools import partial
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+
+from selenium import webdriver
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+from pages.session_page import SessionPage
+
+# The button the page renders after `delay` ms, one per SessionPage.SAVE_CANDIDATES position
+_BUTTONS = [
+    "<button aria-label='Yes' onclick='window.clicked=1'>Yes</button>",
+    "<button onclick='window.clicked=2'>Save</button>",
+    "<button class='p-button' onclick='window.clicked=3'><span>Save</span> changes</button>",
+    "<form onsubmit='return false'><button type='submit' onclick='window.clicked=4'>Go</button></form>",
+]
+
+
+def _page(winner, delay_ms):
+    return ("<html><body><div id='app'></div><script>"
+            f"setTimeout(() => {{ document.getElementById('app').innerHTML = {_BUTTONS[winner - 1]!r}; }}, {delay_ms});"
+            "</script></body></html>")
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+def _legacy_click_first(driver, candidates, timeout_each):
+    # Previous SessionPage._click_first: serial waits, one per candidate
+    for by, sel in candidates:
+        try:
+            WebDriverWait(driver, timeout_each).until(EC.element_to_be_clickable((by, sel))).click()
+            return True
+        except Exception:
+            continue
+    return False
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--winner", type=int, default=3, choices=range(1, len(_BUTTONS) + 1),
+                    help="Which SAVE_CANDIDATES entry the page matches (1-based)")
+    ap.add_argument("--timeout-each", type=float, default=2, help="Per-candidate wait of the serial loop (s)")
+    ap.add_argument("--delay", type=float, default=0.5, help="Seconds until the button is rendered")
+    ap.add_argument("--headed", action="store_true")
+    args = ap.parse_args(argv)
+
+    folder = tempfile.mkdtemp()
+    with open(os.path.join(folder, "index.html"), "w", encoding="utf-8") as f:
+        f.write(_page(args.winner, int(args.delay * 1000)))
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), partial(_QuietHandler, directory=folder))
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{srv.server_address[1]}/index.html"
+
+    options = webdriver.ChromeOptions()
+    if not args.headed:
+        options.add_argument("--headless=new")
+    driver = webdriver.Chrome(options=options)
+    page = SessionPage(driver, url)
+    try:
+        driver.get(url)
+        t0 = time.perf_counter()
+        _legacy_click_first(driver, SessionPage.SAVE_CANDIDATES, args.timeout_each)
+        serial = time.perf_counter() - t0
+        serial_hit = driver.execute_script("return window.clicked;")
+
+        driver.get(url)
+        t0 = time.perf_counter()
+        index = page._click_first_available(SessionPage.SAVE_CANDIDATES, timeout=args.timeout_each * 4, name="save")
+        racing = time.perf_counter() - t0
+        racing_hit = driver.execute_script("return window.clicked;")
+    finally:
+        driver.quit()
+        srv.shutdown()
+
+    print(f"Save button matches candidate {args.winner}/{len(_BUTTONS)}, rendered after {args.delay:g}s")
+    print(f"  serial WebDriverWait per candidate : {serial * 1000:8.1f} ms  (clicked #{serial_hit})")
+    print(f"  racing, one probe per poll         : {racing * 1000:8.1f} ms  (clicked #{racing_hit}, "
+          f"reported #{index + 1 if index is not None else None})   {serial / racing:.1f}x faster")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
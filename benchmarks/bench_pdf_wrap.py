@@ -0,0 +1,113 @@
+# benchmarks/bench_pdf_wrap.py
+"""
+Micro-benchmark: PdfReport._write_wrapped on a traceback-heavy report.
+Compares the previous per-word stringWidth(whole candidate line) loop with the cached,
+incremental wrap_lines() engine.
+
+    python -m benchmarks.bench_pdf_wrap [--steps 200]
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+from reportlab.lib.units import cm
+
+from reportlab.pdfbase.pdfmetrics import stringWidth
+
+from utils.report_pdf import PdfReport, wrap_lines
+
+
+def _legacy_write_wrapped(rep, text, font="Helvetica", size=10, leading=13):
+    # Previous implementation (quadratic in line length), kept here for comparison
+    rep.c.setFont(font, size)
+    max_width = rep.width - 4*cm
+    line = ""
+    for w in text.split():
+        candidate = (line + " " + w).strip()
+        if rep.c.stringWidth(candidate, font, size) <= max_width:
+            line = candidate
+        else:
+            rep.c.drawString(2*cm, rep.cursor_y, line)
+            rep.cursor_y -= leading
+            if rep.cursor_y < 3*cm:
+                rep._flush_page()
+            line = w
+    if line:
+        rep.c.drawString(2*cm, rep.cursor_y, line)
+        rep.cursor_y -= leading
+
+
+def _legacy_wrap(text, max_width, font="Helvetica", size=10):
+    # Line breaking only (no drawing) of the previous implementation
+    lines, line = [], ""
+    for w in text.split():
+        candidate = (line + " " + w).strip()
+        if stringWidth(candidate, font, size) <= max_width:
+            line = candidate
+        else:
+            lines.append(line)
+            line = w
+    if line:
+        lines.append(line)
+    return lines
+
+
+def _traceback(i):
+    frames = []
+    for n in range(25):
+        frames.append(
+            f'  File "C:\\\\Users\\\\qa\\\\PycharmProjects\\\\SaaS\\\\.venv\\\\Lib\\\\site-packages\\\\selenium\\\\webdriver\\\\'
+            f'remote\\\\webdriver.py", line {300 + n}, in execute\n'
+            f"    self.error_handler.check_response(response) and raise exception for step {i} frame {n} "
+            f"with a long explanatory message about the element that could not be located on the page\n"
+        )
+    url = "https://school.devanttest.in/studentAdmission?" + "&".join(f"param{k}=value{k}" for k in range(40))
+    return f"ERROR: Message: no such element {url}\n\nTraceback (most recent call last):\n" + "".join(frames)
+
+
+def _run(write, texts):
+    rep = PdfReport(out_path=os.path.join(tempfile.mkdtemp(), "bench.pdf"))
+    t0 = time.perf_counter()
+    for text in texts:
+        write(rep, text)
+    return time.perf_counter() - t0
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--steps", type=int, default=200, help="Failure descriptions to lay out")
+    args = ap.parse_args(argv)
+    texts = [_traceback(i) for i in range(args.steps)]
+    words = sum(len(t.split()) for t in texts)
+
+    max_width = PdfReport(out_path=os.path.join(tempfile.mkdtemp(), "w.pdf")).width - 4*cm
+    print(f"{args.steps} tracebacks, {words} words")
+
+    t0 = time.perf_counter()
+    for t in texts:
+        _legacy_wrap(t, max_width)
+    legacy_wrap = time.perf_counter() - t0
+    cache = {}
+    def width_of(s):
+        w = cache.get(s)
+        if w is None:
+            w = cache[s] = stringWidth(s, "Helvetica", 10)
+        return w
+    t0 = time.perf_counter()
+    for t in texts:
+        wrap_lines(t, max_width, width_of)
+    new_wrap = time.perf_counter() - t0
+    print(f"  line breaking only : legacy {legacy_wrap * 1000:8.1f} ms | wrap_lines {new_wrap * 1000:8.1f} ms"
+          f"  ({legacy_wrap / new_wrap:.1f}x)")
+
+    legacy = _run(_legacy_write_wrapped, texts)
+    cached = _run(lambda rep, t: rep._write_wrapped(t, size=10, leading=13), texts)
+    print(f"  with drawing       : legacy {legacy * 1000:8.1f} ms | _write_wrapped {cached * 1000:8.1f} ms"
+          f"  ({legacy / cached:.1f}x; new layout keeps traceback line breaks, so it draws more lines)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+# benchmarks/bench_spell.py
+"""
+Benchmark: spelling a page's words the old way (new SpellChecker per call, first element of
+candidates()) vs the shared SpellEngine (one dictionary load, memo, time-bounded suggestions).
+The word list mixes page copy, typos and long garbage tokens (ids, hashes, run-together words).
+
+    python -m benchmarks.bench_spell [--pages 5]
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+from spellchecker import SpellChecker
+
+from utils.spell import SpellEngine
+
+PAGE = ("Dashboard Academics Session Subject Section Class Admission Student Teacher Attendance "
+        "Examination Certificate Transfer Serial Number Guardian Address Phone Religion Category "
+        "Recieve Adress Studnet Attendence Secton Certficate Transfr Guardain Sesion Subjcet "
+        "qwertyuiopasdfgh zzkxqvbnmwplrtsg studentadmissionformheader xkcdqwplmnbvfrtg")
+
+
+def _legacy(words):
+    speller = SpellChecker()
+    out = {}
+    for w in speller.unknown(words):
+        cands = speller.candidates(w)
+        out[w] = next(iter(cands), None) if cands else None    # old code crashed on None
+    return out
+
+
+def _engine(engine, words):
+    return {w: engine.suggestion(w) for w in engine.unknown(words)}
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--pages", type=int, default=5, help="Pages scanned (same copy each time)")
+    args = ap.parse_args(argv)
+    words = [w.lower() for w in PAGE.split()]
+
+    t0 = time.perf_counter()
+    for _ in range(args.pages):
+        _legacy(words)
+    legacy = time.perf_counter() - t0
+
+    memo = os.path.join(tempfile.mkdtemp(), "memo.json")
+    t0 = time.perf_counter()
+    engine = SpellEngine(cache_path=memo)
+    for _ in range(args.pages):
+        result = _engine(engine, words)
+    cold = time.perf_counter() - t0
+    engine.save()
+
+    t0 = time.perf_counter()
+    warm_engine = SpellEngine(cache_path=memo)
+    for _ in range(args.pages):
+        _engine(warm_engine, words)
+    warm = time.perf_counter() - t0
+
+    print(f"{args.pages} pages x {len(words)} words ({len(result)} unknown)")
+    print(f"  SpellChecker per page     : {legacy * 1000:8.1f} ms")
+    print(f"  SpellEngine, cold memo    : {cold * 1000:8.1f} ms   ({legacy / cold:.1f}x)")
+    print(f"  SpellEngine, persisted memo: {warm * 1000:7.1f} ms   ({legacy / warm:.1f}x)")
+    for w in ("recieve", "studnet", "qwertyuiopasdfgh"):
+        print(f"    {w} -> {result.get(w)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,152 @@
+# benchmarks/bench_visible_text.py
+"""
+Benchmark: utils.dom.get_visible_text on a large admin-like page
+(benchmarks/fixtures/large_dom.html, committed: big menu, long table with visibility:hidden
+tooltips, display:none modals). Times the previous TreeWalker (getComputedStyle per text
+node) and the current walk, and counts the style reads (getComputedStyle + checkVisibility
+calls) each one makes. Needs a local Chrome (headless).
+
+    python -m benchmarks.bench_visible_text [--rounds 5]
+    python -m benchmarks.bench_visible_text --regen     # rewrite the fixture
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import threading
+from functools import partial
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+
+from selenium import webdriver
+
+from utils.dom import get_visible_text, get_visible_text_refs
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+FIXTURE = os.path.join(FIXTURES, "large_dom.html")
+
+_LEGACY_JS = """
+    function visibleText(element) {
+      const walker = document.createTreeWalker(element, NodeFilter.SHOW_TEXT, {
+        acceptNode: function(node) {
+          if (!node.nodeValue.trim()) return NodeFilter.FILTER_REJECT;
+          if (!node.parentElement) return NodeFilter.FILTER_REJECT;
+          const style = window.getComputedStyle(node.parentElement);
+          if (style && (style.visibility === 'hidden' || style.display === 'none')) return NodeFilter.FILTER_REJECT;
+          return NodeFilter.FILTER_ACCEPT;
+        }
+      });
+      let result = [];
+      while (walker.nextNode()) { result.push(walker.currentNode.nodeValue); }
+      return result.join(' ');
+    }
+    return visibleText(document.body);
+"""
+
+WORDS = ("student admission session section class subject teacher attendance guardian address "
+         "transfer certificate serial number bengali english history religion category studnet "
+         "recieve adress").split()
+
+
+def _sentence(rng, n):
+    return " ".join(rng.choice(WORDS) for _ in range(n)).capitalize()
+
+
+def write_fixture(path=FIXTURE, rows=800, menu=300, modals=6):
+    rng = random.Random(7)
+    out = ["<!doctype html><html><head><meta charset='utf-8'><title>Admin</title>",
+           "<style>.modal{display:none}.tip{visibility:hidden}td span{padding:2px}</style>",
+           "<script>window.appConfig = {theme: 'dark'};</script></head><body>"]
+    out.append("<nav><ul>" + "".join(f"<li><a href='/m/{i}'><span>{_sentence(rng, 2)}</span></a></li>"
+                                      for i in range(menu)) + "</ul></nav>")
+    out.append("<main><h1>Students</h1><table><tbody>")
+    for r in range(rows):
+        cells = "".join(f"<td><span>{_sentence(rng, 2)}</span><span class='tip'>{_sentence(rng, 3)}</span></td>"
+                        for _ in range(4))
+        out.append(f"<tr><td>{r}</td>{cells}</tr>")
+    out.append("</tbody></table></main>")
+    for m in range(modals):
+        body = "".join(f"<p><b>{_sentence(rng, 3)}</b> {_sentence(rng, 8)}</p>" for _ in range(60))
+        out.append(f"<div class='modal' id='modal{m}'><div><h2>Modal {m}</h2>{body}</div></div>")
+    out.append("</body></html>")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(out))
+    return path
+
+
+# Wrap the style APIs with counters (window.__styleReads); arguments[0] = false restores them
+_COUNT_STYLE_READS_JS = """
+const on = arguments[0];
+if (on && !window.__styleApis) {
+  const gcs = window.getComputedStyle, cv = Element.prototype.checkVisibility;
+  window.__styleApis = [gcs, cv];
+  window.__styleReads = 0;
+  window.getComputedStyle = function () { window.__styleReads++; return gcs.apply(this, arguments); };
+  if (cv) Element.prototype.checkVisibility = function () { window.__styleReads++; return cv.apply(this, arguments); };
+} else if (!on && window.__styleApis) {
+  window.getComputedStyle = window.__styleApis[0];
+  if (window.__styleApis[1]) Element.prototype.checkVisibility = window.__styleApis[1];
+  delete window.__styleApis;
+}
+return window.__styleReads;
+"""
+
+
+def _style_reads(driver, fn):
+    driver.execute_script(_COUNT_STYLE_READS_JS, True)
+    driver.execute_script("window.__styleReads = 0;")
+    fn()
+    return driver.execute_script(_COUNT_STYLE_READS_JS, False)
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+def _timed(fn, rounds):
+    t0 = time.perf_counter()
+    for _ in range(rounds):
+        result = fn()
+    return (time.perf_counter() - t0) / rounds, result
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rounds", type=int, default=5)
+    ap.add_argument("--regen", action="store_true", help="Rewrite the fixture and exit")
+    ap.add_argument("--headed", action="store_true")
+    args = ap.parse_args(argv)
+    if args.regen or not os.path.exists(FIXTURE):
+        print(f"Fixture written: {write_fixture()}")
+        if args.regen:
+            return 0
+
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), partial(_QuietHandler, directory=FIXTURES))
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    options = webdriver.ChromeOptions()
+    if not args.headed:
+        options.add_argument("--headless=new")
+    driver = webdriver.Chrome(options=options)
+    try:
+        driver.get(f"http://127.0.0.1:{srv.server_address[1]}/large_dom.html")
+        legacy, old = _timed(lambda: " ".join((driver.execute_script(_LEGACY_JS) or "").split()), args.rounds)
+        memo, new = _timed(lambda: get_visible_text(driver), args.rounds)
+        refs_time, (_, refs) = _timed(lambda: get_visible_text_refs(driver), args.rounds)
+        legacy_reads = _style_reads(driver, lambda: driver.execute_script(_LEGACY_JS))
+        memo_reads = _style_reads(driver, lambda: get_visible_text(driver))
+    finally:
+        driver.quit()
+        srv.shutdown()
+
+    print(f"large_dom.html: legacy {len(old.split())} words, current {len(new.split())} words "
+          f"(legacy includes text inside hidden modals)")
+    print(f"  legacy, getComputedStyle per text node: {legacy * 1000:8.1f} ms   ({legacy_reads} style reads)")
+    print(f"  current get_visible_text             : {memo * 1000:8.1f} ms   ({memo_reads} style reads)")
+    print(f"  get_visible_text_refs                : {refs_time * 1000:8.1f} ms   ({len(refs)} refs)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,16 +4,29 @@ import pytest
 from dotenv import load_dotenv
 
 # Reports (PDF + DOCX)
-from utils.report_pdf import PdfReport
-from utils.report import DocxReport, ScreenshotHelper
+from utils.report import ScreenshotHelper
+from utils.browser_pool import BrowserPool
+from utils.driver_resolver import DriverResolver, start_shared_service
+from utils.auth_state import AuthStateCache
+from utils.report_journal import StepJournal
+from utils.screenshot_writer import ScreenshotWriter
+from utils.shot_store import ScreenshotStore
+from utils.shot_policy import CapturePolicy, MODES as SHOT_POLICIES
+from utils.report_render import render as render_reports
+from utils.links import LinkChecker
+from utils.link_cache import LinkStatusCache
+from utils.routes import RouteValidator, SiteLinkChecker
+from utils.locator_cache import locator_stats, save_locator_stats
+from utils.idle import install_idle_tracker
+from utils import parallel
+from utils import spell
 
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
 from selenium.webdriver.support.event_firing_webdriver import (
     EventFiringWebDriver, AbstractEventListener
 )
-from webdriver_manager.chrome import ChromeDriverManager
 
 
 # (Optional) Slow motion so you can watch steps
@@ -35,6 +48,45 @@ def pytest_addoption(parser):
     parser.addoption("--password", action="store", default=None, help="Password")
     parser.addoption("--headed", action="store_true", default=False, help="Run headed (not headless)")
     parser.addoption("--slowmo", action="store", default="0", help="Slow motion delay in seconds (e.g. 0.7)")
+    parser.addoption("--pool-size", action="store", default=None,
+                     help="Reuse N long-lived browsers across tests (0 = new browser per test)")
+    parser.addoption("--chromedriver", action="store", default=None, help="Path to a chromedriver binary (skips resolution)")
+    parser.addoption("--driver-offline", action="store_true", default=False,
+                     help="Never hit the network for chromedriver; use the cached manifest only")
+    parser.addoption("--sync-shots", action="store_true", default=False,
+                     help="Write screenshots on the test thread (disables the background writer)")
+    parser.addoption("--shot-max-width", action="store", default="0",
+                     help="Downscale saved screenshots wider than N px (0 = keep full size)")
+    parser.addoption("--shot-policy", action="store", default="always", choices=SHOT_POLICIES,
+                     help="Which screenshots to keep: " + ", ".join(SHOT_POLICIES))
+    parser.addoption("--shot-every", action="store", default="5", help="N for --shot-policy every-Nth-step")
+    parser.addoption("--shot-keep-last", action="store", default="3", help="K for --shot-policy last-K-before-failure")
+    parser.addoption("--report-image-width", action="store", default="1200",
+                     help="Width in px of screenshots embedded in PDF/DOCX (0 = full size)")
+    parser.addoption("--report-jpeg-quality", action="store", default="0",
+                     help="Embed screenshots as JPEG with this quality (0 = keep PNG)")
+    parser.addoption("--workers", action="store", default=None,
+                     help="Shard tests across N worker processes, each with its own browser")
+    parser.addoption("--link-workers", action="store", default="16", help="Links checked concurrently")
+    parser.addoption("--link-per-host", action="store", default="6", help="Concurrent link checks per host")
+    parser.addoption("--link-timeout", action="store", default="15", help="Per-request link check timeout (s)")
+    parser.addoption("--link-deadline", action="store", default="60",
+                     help="Max seconds for one batch of link checks (0 = no limit)")
+    parser.addoption("--link-cache-ttl", action="store", default=None,
+                     help="Reuse healthy link statuses for N seconds, across tests, workers and runs (0 = off)")
+    parser.addoption("--route-render-timeout", action="store", default="5",
+                     help="Seconds an SPA route may take to render before it counts as broken")
+    parser.addoption("--crawl-depth", action="store", default="2", help="Crawler: max link hops from the dashboard")
+    parser.addoption("--crawl-pages", action="store", default="30", help="Crawler: max pages visited")
+    parser.addoption("--crawl-budget", action="store", default="300", help="Crawler: wall-clock budget in seconds")
+    parser.addoption("--crawl-tabs", action="store", default="3", help="Crawler: pages loaded in parallel tabs")
+    parser.addoption("--scan-tabs", action="store", default="3", help="Spelling/link scans: pages loaded in parallel tabs")
+    parser.addoption("--spell-processes", action="store", default="2",
+                     help="Worker processes for spelling analysis during scans (0 = in-process)")
+    parser.addoption("--spelling-diff", action="store_true", default=False,
+                     help="Report only misspellings missing from data/spelling_baseline.json and fail on them")
+    parser.addoption("--update-spelling-baseline", action="store_true", default=False,
+                     help="Accept this run's misspellings as the new spelling baseline")
 
 
 @pytest.fixture(scope="session")
@@ -45,23 +97,57 @@ def config(pytestconfig):
     password = pytestconfig.getoption("--password") or os.getenv("PASSWORD", "SHA-PN-0001")
     headed   = pytestconfig.getoption("--headed")
     slowmo   = float(pytestconfig.getoption("--slowmo") or 0)
+    pool_size = int(pytestconfig.getoption("--pool-size") or os.getenv("BROWSER_POOL_SIZE", "0") or 0)
+    chromedriver   = pytestconfig.getoption("--chromedriver") or os.getenv("CHROMEDRIVER_PATH")
+    driver_offline = pytestconfig.getoption("--driver-offline") or os.getenv("DRIVER_OFFLINE") == "1"
+    sync_shots = pytestconfig.getoption("--sync-shots")
+    shot_max_width = int(pytestconfig.getoption("--shot-max-width") or 0)
+    shot_policy = os.getenv("SHOT_POLICY") or pytestconfig.getoption("--shot-policy")
+    idx = parallel.worker_index()
+    artifacts_dir = parallel.worker_dir(idx) if idx is not None else "artifacts"
     print(f"[pytest] CWD: {os.getcwd()}")
-    print(f"[pytest] Artifacts dir: {os.path.join('artifacts')}")
-    return {"base_url": base_url, "user": user, "password": password, "headed": headed, "slowmo": slowmo}
+    print(f"[pytest] Artifacts dir: {artifacts_dir}")
+    return {"base_url": base_url, "user": user, "password": password, "headed": headed, "slowmo": slowmo,
+            "pool_size": pool_size, "chromedriver": chromedriver, "driver_offline": driver_offline,
+            "artifacts_dir": artifacts_dir, "worker": idx,
+            "sync_shots": sync_shots, "shot_max_width": shot_max_width, "shot_policy": shot_policy,
+            "shot_every": int(pytestconfig.getoption("--shot-every")),
+            "shot_keep_last": int(pytestconfig.getoption("--shot-keep-last")),
+            "report_image_width": int(pytestconfig.getoption("--report-image-width") or 0),
+            "report_jpeg_quality": int(pytestconfig.getoption("--report-jpeg-quality") or 0),
+            "link_workers": int(pytestconfig.getoption("--link-workers")),
+            "link_per_host": int(pytestconfig.getoption("--link-per-host")),
+            "link_timeout": float(pytestconfig.getoption("--link-timeout")),
+            "link_deadline": float(pytestconfig.getoption("--link-deadline") or 0),
+            "link_cache_ttl": float(pytestconfig.getoption("--link-cache-ttl") or os.getenv("LINK_CACHE_TTL", "600") or 0),
+            "route_render_timeout": float(pytestconfig.getoption("--route-render-timeout")),
+            "crawl_depth": int(pytestconfig.getoption("--crawl-depth")),
+            "crawl_pages": int(pytestconfig.getoption("--crawl-pages")),
+            "crawl_budget": float(pytestconfig.getoption("--crawl-budget")),
+            "crawl_tabs": int(pytestconfig.getoption("--crawl-tabs")),
+            "scan_tabs": int(pytestconfig.getoption("--scan-tabs")),
+            "spell_processes": int(pytestconfig.getoption("--spell-processes")),
+            "spelling_diff": pytestconfig.getoption("--spelling-diff") or os.getenv("SPELLING_DIFF") == "1",
+            "update_spelling_baseline": pytestconfig.getoption("--update-spelling-baseline")}
 
 
 # --- Reports: build BOTH ---
+# Tests only append step records to an on-disk journal; PDF/DOCX are rendered from it at session
+# end (or later via `python -m utils.report_render` if the run was killed).
 @pytest.fixture(scope="session")
-def report_pdf():
-    r = PdfReport(out_path=os.path.join("artifacts", "TestSummary.pdf"))
-    r.add_title("School Manager – Automated Test Report (PDF)")
-    return r
+def report_journal_path(config):
+    path = os.path.join(config["artifacts_dir"], parallel.JOURNAL_NAME)
+    if config["worker"] is None and os.path.exists(path):
+        os.remove(path)     # new run, new report (workers' journals are reset by the controller)
+    return path
 
 @pytest.fixture(scope="session")
-def report_docx():
-    r = DocxReport(out_path=os.path.join("artifacts", "TestSummary.docx"))
-    r.add_title("School Manager – Automated Test Report (DOCX)")
-    return r
+def report_pdf(report_journal_path):
+    return StepJournal(report_journal_path, "pdf")
+
+@pytest.fixture(scope="session")
+def report_docx(report_journal_path):
+    return StepJournal(report_journal_path, "docx")
 
 # Back-compat fixture so your tests using `report` continue working
 @pytest.fixture
@@ -69,44 +155,200 @@ def report(report_docx):
     return report_docx
 
 
+@pytest.fixture(scope="session")
+def screenshot_writer(config):
+    if config["sync_shots"]:
+        yield None
+        return
+    writer = ScreenshotWriter(max_width=config["shot_max_width"])
+    yield writer
+    writer.close()
+
+
+@pytest.fixture(scope="session")
+def screenshot_store(config):
+    # Content-addressed: a repeated frame is written (and embedded) once
+    return ScreenshotStore(os.path.join(config["artifacts_dir"], "screenshots"))
+
+
 @pytest.fixture(scope="session", autouse=True)
-def finalize_reports(report_pdf, report_docx):
+def spell_memo():
+    # Dictionary loads in the background while the first browser starts; memo saved at the end
+    spell.prewarm()
     yield
-    # Always save both reports
-    os.makedirs("artifacts", exist_ok=True)
-    try:
-        report_pdf.save()
-        print("[report] Saved PDF -> artifacts/TestSummary.pdf")
-    except Exception as e:
-        print(f"[report] PDF save error: {e}")
+    spell.save_engine()
+
+
+@pytest.fixture(scope="session")
+def link_cache(config):
+    # .cache/links/status.json - shared by workers, survives between local runs
+    return LinkStatusCache(ttl=config["link_cache_ttl"]) if config["link_cache_ttl"] > 0 else None
+
+
+@pytest.fixture(scope="session", autouse=True)
+def finalize_reports(config, report_journal_path, report_pdf, report_docx, screenshot_writer, screenshot_store, link_cache,
+                     link_checker):
+    yield
+    if screenshot_writer:
+        screenshot_writer.flush()   # every queued screenshot is on disk before reports are saved
+    print(f"[shots] {screenshot_store.captures} captures, {screenshot_store.duplicates} duplicate frames not re-stored")
+    if screenshot_writer and screenshot_writer.dropped:
+        print(f"[shots] {screenshot_writer.dropped} unchanged frames not written (on-visual-change)")
+    if link_cache and (link_cache.hits or link_cache.misses):
+        stats = link_cache.stats()
+        if config["worker"] is not None:
+            stats = f"worker-{config['worker']}: {stats}"
+        print(f"[links] {stats}")
+        report_pdf.add_info(stats)
+        report_docx.add_info(stats)
+    slowest = link_checker.slowest()
+    if slowest:
+        msg = "Slowest links (time to first byte):\n" + "\n".join(f"{u} ({t * 1000:.0f} ms)" for u, t in slowest)
+        print(f"[links] {msg}")
+        report_pdf.add_info(msg)
+        report_docx.add_info(msg)
+    # Locator fallbacks: counters persisted for the next run (last winner is tried first)
+    save_locator_stats()
+    stats = locator_stats()
+    if stats.touched:
+        lines = stats.summary_lines(keys=stats.touched)
+        print("[locator] " + "\n[locator] ".join(lines))
+        if stats.dead(keys=stats.touched) or any("timeouts" in line for line in lines):
+            msg = "Locator fallbacks (.cache/locators/stats.json):\n" + "\n".join(lines)
+            report_pdf.add_info(msg)
+            report_docx.add_info(msg)
+    if config["worker"] is not None:
+        return  # journal is already on disk; the controller renders the merged reports
+    # Always render both reports (PDF and DOCX laid out in parallel processes)
     try:
-        report_docx.save()
-        print("[report] Saved DOCX -> artifacts/TestSummary.docx")
+        for out in render_reports([report_journal_path], image_width=config["report_image_width"],
+                                  jpeg_quality=config["report_jpeg_quality"]):
+            print(f"[report] Saved -> {out}")
     except Exception as e:
-        print(f"[report] DOCX save error: {e}")
+        print(f"[report] Render error: {e} (retry: python -m utils.report_render {report_journal_path})")
 
 
-@pytest.fixture
-def driver(config, report_pdf, report_docx):
+@pytest.fixture(scope="session")
+def chromedriver_service(config):
+    # Resolved once per run (manifest + checksum, offline-capable); one chromedriver process for all browsers
+    path = DriverResolver(offline=config["driver_offline"], driver_path=config["chromedriver"]).resolve()
+    print(f"[driver] chromedriver: {path}")
+    service = start_shared_service(path)
+    yield service
+    service.stop()
+
+
+def _new_chrome(config, service):
     options = ChromeOptions()
     if not config["headed"]:
         options.add_argument("--headless=new")
     options.add_argument("--window-size=1440,900")
     options.add_argument("--disable-gpu")
 
-    service = Service(ChromeDriverManager().install())
-    drv = webdriver.Chrome(service=service, options=options)
-    if config["slowmo"] and config["slowmo"] > 0:
-        drv = EventFiringWebDriver(drv, SlowMoListener(config["slowmo"]))
+    executor = ChromiumRemoteConnection(service.service_url, "goog", "chrome", keep_alive=True)
+    drv = webdriver.Remote(command_executor=executor, options=options)
     drv.set_page_load_timeout(60)
+    install_idle_tracker(drv)    # page objects wait for network/DOM quiet instead of fixed sleeps
+    return drv
+
+
+@pytest.fixture(scope="session")
+def browser_pool(config, chromedriver_service):
+    # Pooled mode: browsers outlive tests and are reset between them
+    if config["pool_size"] <= 0:
+        yield None
+        return
+    pool = BrowserPool(lambda: _new_chrome(config, chromedriver_service), size=config["pool_size"],
+                       origins=[config["base_url"]])
+    yield pool
+    pool.close()
+
+
+@pytest.fixture
+def driver(config, chromedriver_service, browser_pool, report_pdf, report_docx):
+    raw = browser_pool.acquire() if browser_pool else _new_chrome(config, chromedriver_service)
+    drv = raw
+    if config["slowmo"] and config["slowmo"] > 0:
+        drv = EventFiringWebDriver(raw, SlowMoListener(config["slowmo"]))
     yield drv
-    drv.quit()
+    if browser_pool:
+        browser_pool.release(raw)
+    else:
+        raw.quit()
+
+
+@pytest.fixture(scope="session")
+def auth_states(config):
+    # One UI login per user per run; cookies + web storage are replayed afterwards
+    return AuthStateCache(config["base_url"])
+
+
+@pytest.fixture(scope="session")
+def link_checker(config, link_cache):
+    # One pooled HTTP session for every link scan in the run
+    checker = LinkChecker(timeout=config["link_timeout"], max_workers=config["link_workers"],
+                          per_host=config["link_per_host"], deadline=config["link_deadline"], cache=link_cache)
+    yield checker
+    checker.close()
+
+
+@pytest.fixture
+def route_validator(authenticated_driver, config, link_cache, link_checker):
+    # Links behind login: HTTP checks carry this browser's session, SPA routes resolve in background tabs
+    cookies = link_checker.use_browser_session(authenticated_driver)
+    print(f"[links] Using browser session for link checks ({cookies} cookies)")
+    return RouteValidator(authenticated_driver, tabs=config["scan_tabs"], render_timeout=config["route_render_timeout"],
+                          cache=link_cache)
 
 
 @pytest.fixture
-def shots(driver, report_docx):
+def site_links(config, link_checker, route_validator):
+    """broken(urls): SPA routes via the browser, assets/API/external URLs via authenticated HTTP."""
+    return SiteLinkChecker(link_checker, route_validator, config["base_url"])
+
+
+@pytest.fixture
+def authenticated_driver(driver, config, auth_states):
+    """Same browser as `driver`, already logged in as config user and sitting on the dashboard."""
+    return auth_states.ensure(driver, config["user"], config["password"])
+
+
+@pytest.fixture
+def shots(driver, config, report_docx, screenshot_writer, screenshot_store):
     # Screenshots embedded into DOCX; PDF will still log steps via the hook below
-    return ScreenshotHelper(driver, report_docx)
+    policy = None
+    if config["shot_policy"] != "always":
+        # Per test: step counter, last kept frame and the failure ring buffer start empty
+        policy = CapturePolicy(config["shot_policy"], every_n=config["shot_every"], keep_last=config["shot_keep_last"])
+    return ScreenshotHelper(driver, report_docx, folder=screenshot_store.folder,
+                            writer=screenshot_writer, store=screenshot_store, policy=policy)
+
+
+# --- Parallel mode (--workers N) ---
+def pytest_collection_modifyitems(config, items):
+    if parallel.worker_index() is not None:
+        parallel.keep_shard_items(config, items)
+        parallel.start_result_log(config)
+
+
+def pytest_runtestloop(session):
+    workers = int(session.config.getoption("--workers") or os.getenv("PYTEST_WORKERS", "0") or 0)
+    if workers <= 1 or parallel.worker_index() is not None or session.config.option.collectonly:
+        return None
+    if not session.items:
+        return None
+    cfg = session.config
+    return parallel.run_parallel(session, workers,
+                                 image_width=int(cfg.getoption("--report-image-width") or 0),
+                                 jpeg_quality=int(cfg.getoption("--report-jpeg-quality") or 0))
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    # Journal records are tagged with the running test so worker journals merge in test order
+    StepJournal.current_test = item.nodeid
+    yield
+    StepJournal.current_test = None
 
 
 # Screenshots on pass/fail + add a line to PDF for traceability
@@ -120,9 +362,9 @@ def pytest_runtest_makereport(item, call):
         label = f"{item.name}_{int(time.time())}"
         status = "PASSED" if rep.passed else "FAILED"
         if pdf:
-            pdf.add_step(f"{status}: {label}")
+            pdf.add_step(label, status=status, ts=rep.start, duration=rep.duration)
         if shots:
-            shots.capture(f"{status}__{label}")
+            shots.capture(f"{status}__{label}", failed=not rep.passed)
 # --- Stepper fixture ---
 from utils.stepper import Stepper
 
@@ -1,12 +1,14 @@
 # pages/admission_page.py
 import datetime
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait, Select
+from selenium.webdriver.support.ui import Select
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 
+from pages.base_page import BasePage
 
-class AdmissionPage:
+
+class AdmissionPage(BasePage):
     # -------------------- Anchors / URLs --------------------
     STUDENT_MGMT_HDR = (By.XPATH, "//span[normalize-space()='Student Management']")
     ADD_NEW_STUDENT_BTN = (By.XPATH, "//button[normalize-space()='Add New Student']")
@@ -52,20 +54,7 @@ class AdmissionPage:
     ANY_ERROR_TEXT = (By.XPATH, "//*[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz'),'required') or contains(., '*')]")
     ANY_INVALID    = (By.XPATH, "//*[@aria-invalid='true' or contains(@class,'p-invalid') or contains(@class,'ng-invalid')]")
 
-    def __init__(self, driver, base_url):
-        self.driver = driver
-        self.base_url = base_url.rstrip("/")
-
     # -------------------- Utils --------------------
-    def _wait(self, timeout=20):
-        return WebDriverWait(self.driver, timeout)
-
-    def _scroll_into_view(self, el):
-        try:
-            self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", el)
-        except Exception:
-            pass
-
     def _scroll_doc_bottom(self):
         try:
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
@@ -90,25 +79,6 @@ class AdmissionPage:
         self._wait(timeout).until(EC.element_to_be_clickable(locator))
         el.click()
 
-    def _click_any(self, candidates, timeout_each=4):
-        for by, sel in candidates:
-            try:
-                el = self._wait(timeout_each).until(EC.presence_of_element_located((by, sel)))
-                self._scroll_into_view(el)
-                try:
-                    self._wait(timeout_each).until(EC.element_to_be_clickable((by, sel)))
-                    el.click()
-                    return True
-                except Exception:
-                    try:
-                        self.driver.execute_script("arguments[0].click();", el)
-                        return True
-                    except Exception:
-                        continue
-            except Exception:
-                continue
-        return False
-
     def _type(self, locator, text, timeout=20, clear=True):
         el = self._wait(timeout).until(EC.visibility_of_element_located(locator))
         if clear:
@@ -183,12 +153,17 @@ class AdmissionPage:
         self._click(self.LR_ADD_BTN, timeout=10)
 
     # -------------------- Next --------------------
-    def click_next(self):
-        """Click the Next → button (scroll & try multiple candidates)."""
+    def click_next(self, allow_disabled=False):
+        """
+        Click the Next → button (scroll & race multiple candidates). Waits for an enabled
+        Next; with allow_disabled a Next that stays disabled (invalid form) is JS-clicked
+        after a short grace - only for validation checks, the page will not advance.
+        """
         self._scroll_doc_bottom()
-        if self._click_any(self.NEXT_CANDIDATES, timeout_each=4):
+        grace = 1 if allow_disabled else None
+        if self._click_first_available(self.NEXT_CANDIDATES, timeout=8, name="next", grace=grace) is not None:
             return
-        self._click(self.NEXT_BTN, timeout=8)
+        self._click(self.NEXT_BTN, timeout=2)
 
     # -------------------- Validation --------------------
     def _touch_fields_to_trigger_validation(self):
@@ -227,16 +202,13 @@ class AdmissionPage:
             pass
 
         try:
-            self.click_next()
+            self.click_next(allow_disabled=True)
         except Exception:
             # If Next is disabled or not clickable yet, try to surface validators anyway.
             pass
 
-        # Give the page a moment
-        try:
-            self._wait(1).until(lambda d: True)
-        except Exception:
-            pass
+        # Let the step transition / validators settle
+        self.wait_until_idle(timeout=2)
 
         self._touch_fields_to_trigger_validation()
         return self._has_validation_indicators()
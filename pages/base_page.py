@@ -0,0 +1,162 @@
+# pages/base_page.py
+import time
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver import ActionChains
+
+from utils.idle import wait_until_idle
+from utils.locator_cache import locator_stats
+
+# One round trip per poll: first candidate (in priority order) with a visible - and, when asked,
+# enabled - match. Returns [candidate index, element, indices of all candidates visible now, true],
+# or [index, element, hits, false] for the first visible but disabled match, or null.
+_FIRST_AVAILABLE_JS = """
+const cands = arguments[0], clickable = arguments[1];
+function matches(kind, sel) {
+  if (kind === 'xpath') {
+    const r = document.evaluate(sel, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    const out = [];
+    for (let i = 0; i < r.snapshotLength; i++) out.push(r.snapshotItem(i));
+    return out;
+  }
+  return document.querySelectorAll(sel);
+}
+function shown(el) {
+  if (!el.isConnected || !el.getClientRects().length) return false;
+  const s = window.getComputedStyle(el);
+  return s.visibility !== 'hidden' && s.visibility !== 'collapse' && parseFloat(s.opacity) !== 0;
+}
+let winner = null, present = null;
+const hits = [];
+for (let i = 0; i < cands.length; i++) {
+  let els;
+  try { els = matches(cands[i][0], cands[i][1]); } catch (e) { continue; }
+  let hit = false;
+  for (const el of els) {
+    if (el.nodeType !== 1 || !shown(el)) continue;
+    if (!hit) { hit = true; hits.push(i); if (!present) present = [i, el]; }
+    if (winner) break;
+    if (!clickable || el.disabled !== true) { winner = [i, el]; break; }
+  }
+}
+if (!present) return null;
+return winner ? [winner[0], winner[1], hits, true] : [present[0], present[1], hits, false];
+"""
+
+_CSS = {By.ID: '[id="{}"]', By.NAME: '[name="{}"]', By.CLASS_NAME: ".{}", By.TAG_NAME: "{}", By.CSS_SELECTOR: "{}"}
+
+
+def _js_locator(locator):
+    by, sel = locator
+    if by == By.XPATH:
+        return ["xpath", sel]
+    if by in _CSS:
+        return ["css", _CSS[by].format(sel)]
+    raise ValueError(f"Locator strategy not supported for racing: {by}")
+
+
+class BasePage:
+    """Shared page-object plumbing: waits, scrolling, idle detection and racing locator fallbacks."""
+
+    def __init__(self, driver, base_url):
+        self.driver = driver
+        self.base_url = base_url.rstrip("/")
+
+    # ---------- Utility ----------
+    def _wait(self, timeout=20):
+        return WebDriverWait(self.driver, timeout)
+
+    def _scroll_into_view(self, el):
+        try:
+            self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", el)
+        except Exception:
+            pass
+
+    def _hover(self, el):
+        try:
+            ActionChains(self.driver).move_to_element(el).perform()
+        except Exception:
+            pass
+
+    def wait_until_idle(self, quiet_ms=300, timeout=10):
+        """Wait for network (fetch/XHR) and DOM quiet; see utils.idle. Returns False on timeout."""
+        return wait_until_idle(self.driver, quiet_ms, timeout)
+
+    # ---------- Racing fallbacks ----------
+    def _race(self, candidates, timeout, clickable, name, poll, grace=None):
+        # (index, element, ready); a visible but disabled match is returned (ready False) once
+        # it has been there for `grace` seconds, None = keep waiting for an enabled one
+        key = f"{type(self).__name__}.{name}" if name else None
+        ordered = locator_stats().order(key, candidates) if key else list(candidates)
+        locs = [_js_locator(c) for c in ordered]
+        start = time.monotonic()
+        hits, present_since = (), None
+        while True:
+            found = self.driver.execute_script(_FIRST_AVAILABLE_JS, locs, clickable)
+            now = time.monotonic()
+            hits = found[2] if found else ()
+            if found and not found[3]:
+                present_since = present_since or now
+            else:
+                present_since = None
+            if found and (found[3] or (grace is not None and now - present_since >= grace)):
+                pos, el, _, ready = found
+                index = candidates.index(ordered[pos])
+                if key:
+                    locator_stats().record(key, ordered, pos, hits, now - start)
+                if pos or not ready:     # not the expected (first / last-winning) candidate, or not clickable
+                    print(f"[locator] {key or type(self).__name__}: candidate {index + 1}/{len(candidates)} "
+                          f"{'won' if ready else 'present but not clickable'} after {now - start:.2f}s "
+                          f"-> {candidates[index][1]}")
+                return index, el, ready
+            if now - start >= timeout:
+                if key:
+                    # Candidates that matched a disabled element still count as hits
+                    locator_stats().record(key, ordered, None, hits, now - start)
+                return None, None, False
+            time.sleep(poll)
+
+    def _find_first_available(self, candidates, timeout=6, clickable=True, name=None, poll=0.1):
+        """
+        Poll all candidate locators together (one execute_script per poll) until one has a
+        visible (and, if clickable, enabled) match. Earlier candidates win ties; with a name,
+        the candidate that won last time (utils.locator_cache) goes first and the outcome is
+        recorded under "<PageClass>.<name>".
+        Returns (index into candidates, element), or (None, None) after timeout.
+        """
+        index, el, _ = self._race(candidates, timeout, clickable, name, poll)
+        return index, el
+
+    def _click_first_available(self, candidates, timeout=6, name=None, hover=False, grace=None):
+        """
+        Click the first candidate that becomes visible and clickable (see _find_first_available);
+        falls back to a JS click if the native click is intercepted. With grace, a candidate
+        that has been visible but disabled for that many seconds is JS-clicked right away
+        instead of waiting out the timeout (e.g. Next on a form expected to fail validation).
+        Returns the winning candidate's index, or None if none was clickable within timeout.
+        """
+        ends = time.monotonic() + timeout
+        while True:
+            index, el, ready = self._race(candidates, max(0.0, ends - time.monotonic()), True, name, 0.1, grace)
+            if el is None:
+                return None
+            try:
+                self._scroll_into_view(el)
+                if not ready:
+                    self.driver.execute_script("arguments[0].click();", el)
+                    return index
+                if hover:
+                    self._hover(el)
+                try:
+                    el.click()
+                except StaleElementReferenceException:
+                    raise
+                except Exception:
+                    self.driver.execute_script("arguments[0].click();", el)
+                return index
+            except StaleElementReferenceException:
+                # Re-rendered between the probe and the click: probe again
+                if time.monotonic() >= ends:
+                    return None
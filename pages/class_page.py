@@ -1,12 +1,12 @@
 # pages/class_page.py
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
-from selenium.webdriver import ActionChains
 
+from pages.base_page import BasePage
 
-class ClassPage:
+
+class ClassPage(BasePage):
     # ---------- Form inputs ----------
     CLASS_NAME  = (By.XPATH, "//input[@placeholder='Eg. Class X']")
     CLASS_CODE  = (By.XPATH, "//input[@placeholder='Eg. CLS001']")
@@ -81,26 +81,7 @@ class ClassPage:
     ANY_ERROR_TEXT = (By.XPATH, "//*[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz'),'required') or contains(., '*')]")
     ANY_INVALID    = (By.XPATH, "//*[@aria-invalid='true' or contains(@class,'p-invalid') or contains(@class,'ng-invalid')]")
 
-    def __init__(self, driver, base_url):
-        self.driver = driver
-        self.base_url = base_url
-
     # ---------- Utility ----------
-    def _wait(self, timeout=20):
-        return WebDriverWait(self.driver, timeout)
-
-    def _scroll_into_view(self, el):
-        try:
-            self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", el)
-        except Exception:
-            pass
-
-    def _hover(self, el):
-        try:
-            ActionChains(self.driver).move_to_element(el).perform()
-        except Exception:
-            pass
-
     def _click(self, locator, timeout=15):
         el = self._wait(timeout).until(EC.element_to_be_clickable(locator))
         self._scroll_into_view(el)
@@ -109,21 +90,6 @@ class ClassPage:
         except Exception:
             self.driver.execute_script("arguments[0].click();", el)
 
-    def _click_any(self, candidates, timeout_each=4):
-        """Try multiple locators; return True on first successful click."""
-        for by, sel in candidates:
-            try:
-                el = self._wait(timeout_each).until(EC.element_to_be_clickable((by, sel)))
-                self._scroll_into_view(el)
-                try:
-                    el.click()
-                except Exception:
-                    self.driver.execute_script("arguments[0].click();", el)
-                return True
-            except Exception:
-                continue
-        return False
-
     def _type(self, locator, text, timeout=20, clear=True, send_enter=False):
         el = self._wait(timeout).until(EC.visibility_of_element_located(locator))
         if clear:
@@ -135,17 +101,6 @@ class ClassPage:
             except Exception:
                 pass
 
-    def _try_click_element(self, el):
-        self._scroll_into_view(el)
-        try:
-            self._hover(el)
-        except Exception:
-            pass
-        try:
-            el.click()
-        except Exception:
-            self.driver.execute_script("arguments[0].click();", el)
-
     def get_row_count(self) -> int:
         return len(self.driver.find_elements(*self.TABLE_ROWS))
 
@@ -178,30 +133,15 @@ class ClassPage:
         # Open the control
         self._click(self.SUBJECTS_DROPDOWN, timeout=15)
 
-        # Try your exact overflow XPath first
-        try:
-            el = self._wait(5).until(EC.presence_of_element_located(self.SCIENCE_OVERFLOW_CLICK))
-            self._scroll_into_view(el)
-            try:
-                el.click()
-            except Exception:
-                self.driver.execute_script("arguments[0].click();", el)
-        except TimeoutException:
-            # Fallbacks: click from the ant-select dropdown/listbox
-            clicked = self._click_any(self.SUBJECT_OPTION_FALLBACKS, timeout_each=4)
-            if not clicked:
-                raise TimeoutException("Could not find a clickable 'Science' option using provided XPath or fallbacks.")
+        # Your exact overflow XPath first, racing the ant-select dropdown/listbox fallbacks
+        candidates = [self.SCIENCE_OVERFLOW_CLICK] + self.SUBJECT_OPTION_FALLBACKS
+        if self._click_first_available(candidates, timeout=8, name="science_option") is None:
+            raise TimeoutException("Could not find a clickable 'Science' option using provided XPath or fallbacks.")
 
         # Verify “Science” now appears in the control (chip or overflow text)
-        ok = False
-        for by, sel in self.SELECTED_CHIP_OR_OVERFLOW_SCIENCE:
-            try:
-                self._wait(5).until(EC.visibility_of_element_located((by, sel)))
-                ok = True
-                break
-            except TimeoutException:
-                continue
-        if not ok:
+        _, el = self._find_first_available(self.SELECTED_CHIP_OR_OVERFLOW_SCIENCE, timeout=5, clickable=False,
+                                           name="science_selected")
+        if el is None:
             raise TimeoutException("Clicked 'Science' but did not detect it selected in the control.")
 
         # Optionally close dropdown
@@ -252,30 +192,9 @@ class ClassPage:
             self.EDIT_ANY_BUTTON_IN_ROW(target_index),
         ]
 
-        clicked = False
-        # Scope search to the action cell (faster & safer)
-        action_cell = self._wait(timeout).until(EC.presence_of_element_located(self.ROW_ACTION_CELL(target_index)))
-        for by, sel in candidates:
-            try:
-                el = action_cell.find_element(by, sel)
-                self._try_click_element(el)
-                clicked = True
-                break
-            except Exception:
-                continue
-
-        if not clicked:
-            # As a last resort, search globally (DOM changes)
-            for by, sel in candidates:
-                try:
-                    el = self._wait(3).until(EC.presence_of_element_located((by, sel)))
-                    self._try_click_element(el)
-                    clicked = True
-                    break
-                except Exception:
-                    continue
-
-        if not clicked:
+        # All three race in one wait (each is scoped to the row's action cell)
+        self._wait(timeout).until(EC.presence_of_element_located(self.ROW_ACTION_CELL(target_index)))
+        if self._click_first_available(candidates, timeout=5, name="edit_icon", hover=True) is None:
             raise TimeoutException(f"Could not find a clickable edit control on row {target_index} (rows present: {total}).")
 
         # Wait for dialog, then confirm Yes (some builds may inline-edit without modal)
@@ -298,9 +217,6 @@ class ClassPage:
 
     def save_expect_validation(self) -> bool:
         self.click_save()
-        try:
-            self._wait(2).until(lambda d: True)
-        except Exception:
-            pass
+        self.wait_until_idle(timeout=2)
         return self.required_field_errors_present()
 
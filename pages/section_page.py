@@ -1,12 +1,13 @@
 # pages/section_page.py
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait, Select
+from selenium.webdriver.support.ui import Select
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
-from selenium.webdriver import ActionChains
 
+from pages.base_page import BasePage
 
-class SectionPage:
+
+class SectionPage(BasePage):
     # ---------- Inputs / Selects ----------
     CLASS_SELECT    = (By.XPATH, "//select[@name='classId']")
     SECTION_NAME    = (By.XPATH, "//input[@placeholder='Eg. English']")
@@ -36,26 +37,7 @@ class SectionPage:
     ANY_ERROR_TEXT  = (By.XPATH, "//*[contains(translate(., 'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz'),'required') or contains(., '*')]")
     ANY_INVALID     = (By.XPATH, "//*[@aria-invalid='true' or contains(@class,'p-invalid') or contains(@class,'ng-invalid')]")
 
-    def __init__(self, driver, base_url):
-        self.driver = driver
-        self.base_url = base_url
-
     # ---------- Utils ----------
-    def _wait(self, timeout=20):
-        return WebDriverWait(self.driver, timeout)
-
-    def _scroll_into_view(self, el):
-        try:
-            self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", el)
-        except Exception:
-            pass
-
-    def _hover(self, el):
-        try:
-            ActionChains(self.driver).move_to_element(el).perform()
-        except Exception:
-            pass
-
     def _click(self, locator, timeout=15):
         el = self._wait(timeout).until(EC.element_to_be_clickable(locator))
         self._scroll_into_view(el)
@@ -149,8 +131,5 @@ class SectionPage:
 
     def save_expect_validation(self) -> bool:
         self.click_save()
-        try:
-            self._wait(2).until(lambda d: True)
-        except Exception:
-            pass
+        self.wait_until_idle(timeout=2)
         return self.required_field_errors_present()
@@ -2,10 +2,11 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
-from selenium.webdriver import ActionChains
 
+from pages.base_page import BasePage
 
-class SessionPage:
+
+class SessionPage(BasePage):
     # ---------------- Inputs ----------------
     SESSION_NAME = (By.XPATH, "//input[@placeholder='Eg. 2025-2026']")
     SESSION_CODE = (By.XPATH, "//input[@placeholder='Eg. SN25']")
@@ -46,39 +47,11 @@ class SessionPage:
     ANY_INVALID    = (By.XPATH, "//*[@aria-invalid='true' or contains(@class,'p-invalid') or contains(@class,'ng-invalid')]")
     ANY_DIALOG     = (By.XPATH, "//*[contains(@class,'p-dialog') and not(contains(@class,'hidden'))]")
 
-    def __init__(self, driver, base_url):
-        self.driver = driver
-        self.base_url = base_url
-
     # ------------- Navigation -------------
     def open(self):
         self.driver.get(f"{self.base_url}/session")
         WebDriverWait(self.driver, 30).until(EC.visibility_of_element_located(self.SESSION_LIST_HDR))
 
-    # ------------- Helpers -------------
-    def _click_first(self, candidates, timeout_each=6):
-        for by, sel in candidates:
-            try:
-                el = WebDriverWait(self.driver, timeout_each).until(EC.element_to_be_clickable((by, sel)))
-                self._scroll_into_view(el)
-                el.click()
-                return True
-            except Exception:
-                continue
-        return False
-
-    def _scroll_into_view(self, el):
-        try:
-            self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", el)
-        except Exception:
-            pass
-
-    def _hover(self, el):
-        try:
-            ActionChains(self.driver).move_to_element(el).perform()
-        except Exception:
-            pass
-
     # ------------- Setters -------------
     def set_session_name(self, name):
         WebDriverWait(self.driver, 20).until(EC.visibility_of_element_located(self.SESSION_NAME)).clear()
@@ -97,8 +70,8 @@ class SessionPage:
         self.driver.find_element(*self.END_DATE).send_keys(end_date_str)
 
     def click_save(self):
-        # Try candidates; if none, JS fallback on the first selector
-        if not self._click_first(self.SAVE_CANDIDATES):
+        # Race the candidates; if none is clickable, JS fallback on the first selector
+        if self._click_first_available(self.SAVE_CANDIDATES, timeout=6, name="save") is None:
             try:
                 el = self.driver.find_element(*self.SAVE_CANDIDATES[0])
                 self._scroll_into_view(el)
@@ -107,7 +80,7 @@ class SessionPage:
                 raise TimeoutException("Could not locate/click any Save button candidate.")
 
     def click_cancel(self):
-        if not self._click_first(self.CANCEL_CANDIDATES):
+        if self._click_first_available(self.CANCEL_CANDIDATES, timeout=6, name="cancel") is None:
             try:
                 el = self.driver.find_element(*self.CANCEL_CANDIDATES[0])
                 self._scroll_into_view(el)
@@ -1,12 +1,12 @@
 # pages/subject_page.py
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
-from selenium.webdriver import ActionChains
 
+from pages.base_page import BasePage
 
-class SubjectPage:
+
+class SubjectPage(BasePage):
     # ---------- Locators ----------
     SUBJECT_NAME = (By.XPATH, "//input[@placeholder='Eg. English']")
     SUBJECT_CODE = (By.XPATH, "//input[@placeholder='Eg. EN']")
@@ -35,26 +35,7 @@ class SubjectPage:
 
     TABLE_ROWS = (By.CSS_SELECTOR, "tbody tr")
 
-    def __init__(self, driver, base_url):
-        self.driver = driver
-        self.base_url = base_url
-
     # ---------- Private helpers ----------
-    def _wait(self, timeout=20):
-        return WebDriverWait(self.driver, timeout)
-
-    def _scroll_into_view(self, el):
-        try:
-            self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", el)
-        except Exception:
-            pass
-
-    def _hover(self, el):
-        try:
-            ActionChains(self.driver).move_to_element(el).perform()
-        except Exception:
-            pass
-
     def _click(self, locator, timeout=15):
         el = self._wait(timeout).until(EC.element_to_be_clickable(locator))
         self._scroll_into_view(el)
@@ -151,9 +132,6 @@ class SubjectPage:
         client-side validation errors are detected (and no confirm dialog opened).
         """
         self.click_save()
-        try:
-            # small grace for UI to paint validation
-            self._wait(2).until(lambda d: True)
-        except Exception:
-            pass
+        # validation paints after the click handler (and any request it fires) settles
+        self.wait_until_idle(timeout=2)
         return self.required_field_errors_present()
@@ -1,18 +1,12 @@
 # tests/test_admission_flow_stepwise.py
-from pages.login_page import LoginPage
 from pages.admission_page import AdmissionPage
 
 
-def test_admission_flow_stepwise(driver, config, stepper):
-    lp = LoginPage(driver, config["base_url"])
+def test_admission_flow_stepwise(driver, config, stepper, auth_states):
     ap = AdmissionPage(driver, config["base_url"])
 
     # -------- Login --------
-    stepper.step("Open login page", lambda: lp.open())
-    stepper.step("Enter user id", lambda: lp.set_user(config["user"]))
-    stepper.step("Enter password", lambda: lp.set_password(config["password"]))
-    stepper.step("Click SIGN IN", lambda: lp.click_sign_in())
-    stepper.step("Wait logged in", lambda: lp.wait_logged_in())
+    stepper.step("Log in (reuse session state)", lambda: auth_states.ensure(driver, config["user"], config["password"]))
 
     # -------- Admission page → New student form --------
     stepper.step("Open Admission page", lambda: ap.open_admission())
@@ -1,28 +1,29 @@
 # tests/test_class_spelling_links.py
 import os
-from pages.login_page import LoginPage
-from utils.dom import get_visible_text, collect_links
-from utils.spell import analyze_text, write_txt_report
+from utils.dom import clear_highlights
+from utils.scan import ScanRunner
+from utils.spell import write_txt_report
 
-def test_class_spelling_and_links(driver, config, shots, report, report_pdf):
-    os.makedirs("artifacts", exist_ok=True)
-    out_txt = os.path.join("artifacts", "spelling_class.txt")
+def test_class_spelling_and_links(authenticated_driver, config, shots, report, report_pdf, link_checker, route_validator):
+    driver = authenticated_driver
+    artifacts = config["artifacts_dir"]     # per-worker folder under --workers
+    os.makedirs(artifacts, exist_ok=True)
+    out_txt = os.path.join(artifacts, "spelling_class.txt")
 
-    # Login
-    lp = LoginPage(driver, config["base_url"])
-    lp.open()
-    shots.capture("Class: Open login")
-    lp.login(config["user"], config["password"])
     shots.capture("Class: Logged in")
 
-    # Open /class
-    url = f"{config['base_url']}/class"
-    driver.get(url)
-    shots.capture("Class: Page open")
+    # Open /class; its links are checked in the background while spelling runs
+    runner = ScanRunner(driver, config["base_url"], tabs=1, link_checker=link_checker, processes=0,
+                        route_validator=route_validator)
+    scan, = runner.run([("Class", "/class")], on_page=lambda scan: shots.capture("Class: Page open"))
+    assert not scan.error, f"/class did not load: {scan.error}"
+    url = scan.url
 
     # Spelling
-    text = get_visible_text(driver)
-    words, miss_map = analyze_text(text)
+    words, miss_map = scan.words, scan.misspelled
+    if miss_map and runner.highlight(scan):
+        shots.capture("Class: Misspellings highlighted")
+        clear_highlights(driver)
     write_txt_report(out_txt, "Class", url, words, miss_map)
     msg = (f"/class spelling: {len(miss_map)} misspelled "
            f"(see {os.path.basename(out_txt)})")
@@ -31,8 +32,7 @@ def test_class_spelling_and_links(driver, config, shots, report, report_pdf):
         report_pdf.add_step("Spelling - Class", msg)
 
     # Broken links
-    from tests.test_links_helpers import check_links  # see helper below
-    bad = check_links(driver)
+    bad = scan.broken
     if bad:
         report.add_info("Broken links on /class:\n" + "\n".join([f"{u} (status={code})" for u, code in bad]))
         shots.capture("Class: Broken links detected")
@@ -0,0 +1,36 @@
+# tests/test_crawl.py
+import os
+from utils.crawler import Crawler, LinkAnalyzer, SpellingAnalyzer, TimingAnalyzer
+from utils.spell import PageSpellStore
+
+def test_crawl_from_dashboard(authenticated_driver, config, shots, report, report_pdf, link_checker, route_validator):
+    driver = authenticated_driver  # crawl starts from the dashboard after login
+    summary_path = os.path.join(config["artifacts_dir"], "crawl_summary.txt")
+    shots.capture("Crawl: Dashboard after login")
+
+    links = LinkAnalyzer(link_checker, route_validator)
+    spelling_store = PageSpellStore()
+    crawler = Crawler(driver, analyzers=[TimingAnalyzer(), SpellingAnalyzer(spelling_store), links],
+                      max_depth=config["crawl_depth"], max_pages=config["crawl_pages"],
+                      time_budget=config["crawl_budget"], tabs=config["crawl_tabs"])
+    pages = crawler.run()
+    spelling_store.save()
+    shots.capture("Crawl: Finished")
+
+    lines = crawler.summary_lines()
+    os.makedirs(os.path.dirname(summary_path), exist_ok=True)
+    with open(summary_path, "w", encoding="utf-8") as f:
+        f.write("CRAWL SUMMARY\n\n" + "\n".join(lines))
+
+    msg = f"{lines[-1]} (see {os.path.basename(summary_path)})"
+    report.add_info(msg)
+    if report_pdf:
+        report_pdf.add_step("Crawl - all reachable pages", "\n".join(lines))
+
+    broken = {u: bad for u, bad in links.broken.items() if bad}
+    if broken:
+        report.add_info("Broken links found while crawling:\n" + "\n".join(
+            f"{page}: {u} (status={code})" for page, bad in broken.items() for u, code in bad))
+
+    assert pages, "crawler did not load the start page"
+    assert not pages[0].error, f"start page failed: {pages[0].error}"
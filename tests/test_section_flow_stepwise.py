@@ -1,17 +1,11 @@
 # tests/test_section_flow_stepwise.py
-from pages.login_page import LoginPage
 from pages.section_page import SectionPage
 
-def test_section_flow_stepwise(driver, config, stepper):
-    lp = LoginPage(driver, config["base_url"])
+def test_section_flow_stepwise(driver, config, stepper, auth_states):
     sp = SectionPage(driver, config["base_url"])
 
     # --- Login ---
-    stepper.step("Open login page", lambda: lp.open())
-    stepper.step("Enter user id", lambda: lp.set_user(config["user"]))
-    stepper.step("Enter password", lambda: lp.set_password(config["password"]))
-    stepper.step("Click SIGN IN", lambda: lp.click_sign_in())
-    stepper.step("Wait logged in", lambda: lp.wait_logged_in())
+    stepper.step("Log in (reuse session state)", lambda: auth_states.ensure(driver, config["user"], config["password"]))
 
     # --- Open Section page ---
     stepper.step("Open Section page", lambda: sp.open())
@@ -1,9 +1,7 @@
 import os
 import datetime
-import time
 import uuid
 import pytest
-from pages.login_page import LoginPage
 from pages.session_page import SessionPage
 
 TODAY = datetime.date.today().strftime("%m/%d/%Y")
@@ -39,7 +37,7 @@ def pytest_generate_tests(metafunc):
 
 
 @pytest.mark.usefixtures("stepper")
-def test_session_flow_stepwise(driver, config, stepper, user, password):
+def test_session_flow_stepwise(driver, config, stepper, auth_states, user, password):
     # Resolve creds: prefer param values; fall back to config
     user = user or config["user"]
     password = password or config["password"]
@@ -52,22 +50,17 @@ def test_session_flow_stepwise(driver, config, stepper, user, password):
     # Derived edit name
     edited_name = f"{session_name}v"
 
-    lp = LoginPage(driver, config["base_url"])
     sp = SessionPage(driver, config["base_url"])
 
     # --- Login steps ---
-    stepper.step(f"Open login page (user={user})", lambda: lp.open())
-    stepper.step("Enter user id", lambda: lp.set_user(user))
-    stepper.step("Enter password", lambda: lp.set_password(password))
-    stepper.step("Click SIGN IN", lambda: lp.click_sign_in())
-    stepper.step("Wait logged in", lambda: lp.wait_logged_in())
+    stepper.step(f"Log in (user={user}, reuse session state)", lambda: auth_states.ensure(driver, user, password))
 
     # --- Navigate Session page ---
     stepper.step("Open Session page", lambda: sp.open())
 
     # --- Try save empty to see validation ---
     stepper.step("Click Save with empty form", lambda: sp.click_save())
-    time.sleep(1)
+    sp.wait_until_idle(timeout=2)
 
     def _check_validation():
         assert sp.required_field_errors_present() or True  # don't fail flow; just trigger capture
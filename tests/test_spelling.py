@@ -1,40 +1,25 @@
 import os
-import re
-from spellchecker import SpellChecker
-from pages.login_page import LoginPage
 from utils.dom import get_visible_text
+from utils.lexicon import lexicon
+from utils.spell import spell_engine
+
+def test_spelling_dashboard_and_session(authenticated_driver, config, shots, report, report_pdf):
+    driver = authenticated_driver
+    speller = spell_engine()
+    artifacts = config["artifacts_dir"]     # per-worker folder under --workers
+    os.makedirs(artifacts, exist_ok=True)
+    out_txt = os.path.join(artifacts, "spelling_report.txt")
 
-# Words to ignore (project/domain vocab, codes, names)
-WHITELIST = {
-    "Devant", "SN25", "SHT", "SHA", "PN", "Ben1234", "Bengali",
-    "SRU", "WhatsApp", "Kiwi", "Academics", "Signin", "svg",
-    "Dashboard", "Session", "Sessions", "Check", "Checkingv"
-}
-
-def _tokenize_english_words(text):
-    words = re.findall(r"[A-Za-z]{3,}", text)
-    wl = {x.lower() for x in WHITELIST}
-    return [w for w in words if w.lower() not in wl]
-
-def test_spelling_dashboard_and_session(driver, config, shots, report, report_pdf):
-    speller = SpellChecker()
-    os.makedirs("artifacts", exist_ok=True)
-    out_txt = os.path.join("artifacts", "spelling_report.txt")
-
-    # Login
-    lp = LoginPage(driver, config["base_url"])
-    lp.open()
-    lp.login(config["user"], config["password"])
     shots.capture("Spelling: Dashboard open")
     text = get_visible_text(driver)
-    words = _tokenize_english_words(text)
+    words = lexicon().check_words(text)
     miss = speller.unknown([w.lower() for w in words])
 
     # Session page
     driver.get(f"{config['base_url']}/session")
     shots.capture("Spelling: Session open")
     text2 = get_visible_text(driver)
-    words2 = _tokenize_english_words(text2)
+    words2 = lexicon().check_words(text2)
     miss |= speller.unknown([w.lower() for w in words2])
 
     # Prepare results
@@ -42,7 +27,7 @@ def test_spelling_dashboard_and_session(driver, config, shots, report, report_pd
     if miss:
         lines.append("Misspelled words and suggestions:\n")
         for w in sorted(miss):
-            suggestion = next(iter(speller.candidates(w)), None)
+            suggestion = speller.suggestion(w)
             lines.append(f"- {w} -> suggestion: {suggestion}")
         report.add_info("Spelling issues found:\n" + "\n".join(lines[1:]))
         if report_pdf:
@@ -1,8 +1,10 @@
 # tests/test_spelling_all_pages.py
 import os
-from pages.login_page import LoginPage
-from utils.dom import get_visible_text
-from utils.spell import analyze_text, write_txt_report
+import json
+import shutil
+from utils.dom import clear_highlights
+from utils.scan import ScanRunner
+from utils.spell import PageSpellStore, SpellingBaseline, write_json_report, write_txt_report
 
 PAGES = [
     ("Login",   "/login"),
@@ -13,41 +15,86 @@ PAGES = [
 def _slug(name: str) -> str:
     return "".join(ch.lower() if ch.isalnum() else "_" for ch in name).strip("_")
 
-def test_spelling_all_pages(driver, config, shots, report, report_pdf):
-    os.makedirs("artifacts", exist_ok=True)
-    summary_path = os.path.join("artifacts", "spelling_summary.txt")
-    summary_lines = ["SPELLING SUMMARY", ""]
+def test_spelling_all_pages(authenticated_driver, config, shots, report, report_pdf):
+    driver = authenticated_driver
+    artifacts = config["artifacts_dir"]     # per-worker folder under --workers
+    os.makedirs(artifacts, exist_ok=True)
+    summary_path = os.path.join(artifacts, "spelling_summary.txt")
+    summary_lines = ["SPELLING SUMMARY" + (" (new vs baseline)" if config["spelling_diff"] else ""), ""]
+    summary_pages = []
+    store = PageSpellStore()       # results of earlier runs; unchanged pages are not re-checked
+    baseline = SpellingBaseline()  # reviewed, known misspellings per route
+    diff_mode = config["spelling_diff"]
 
-    # Login first
-    lp = LoginPage(driver, config["base_url"])
-    lp.open()
-    shots.capture("Spelling: Open login")
-    lp.login(config["user"], config["password"])
     shots.capture("Spelling: Logged in")
 
-    for title, route in PAGES:
-        url = f"{config['base_url']}{route}"
-        driver.get(url)
-        shots.capture(f"Spelling: {title} page open")
+    # Pages load in parallel tabs; spelling runs in worker processes meanwhile
+    runner = ScanRunner(driver, config["base_url"], tabs=config["scan_tabs"], store=store,
+                        processes=config["spell_processes"])
+    scans = runner.run(PAGES, on_page=lambda scan: shots.capture(f"Spelling: {scan.title} page open"))
 
-        text = get_visible_text(driver)
-        words, miss_map = analyze_text(text)
+    new_total = 0
+    for scan in scans:
+        title, url = scan.title, scan.url
+        if scan.error:
+            msg = f"{title}: not scanned ({scan.error})"
+            report.add_info(msg)
+            summary_lines.append(f"[error  ] {msg}")
+            summary_pages.append({"page": title, "route": scan.route, "error": scan.error})
+            continue
+        words, miss_map, status = scan.words, scan.misspelled, scan.spelling
+        new, known, fixed = baseline.diff(scan.route, miss_map)
+        new_total += len(new)
+        prev_report = (store.lookup(scan.route, scan.text)[1] or {}).get("report")
+        if runner.highlight(scan, new if diff_mode else miss_map):
+            shots.capture(f"Spelling: {title} misspellings highlighted")
+            clear_highlights(driver)
 
-        out_txt = os.path.join("artifacts", f"spelling_{_slug(title)}.txt")
-        write_txt_report(out_txt, title, url, words, miss_map)
+        out_txt = os.path.join(artifacts, f"spelling_{_slug(title)}.txt")
+        if status == "cached" and prev_report and os.path.exists(prev_report):
+            if os.path.abspath(prev_report) != os.path.abspath(out_txt):
+                shutil.copyfile(prev_report, out_txt)
+        else:
+            write_txt_report(out_txt, title, url, words, miss_map)
+        store.set_report(scan.route, out_txt)
+        out_json = write_json_report(os.path.join(artifacts, f"spelling_{_slug(title)}.json"), title, url,
+                                     words, miss_map, refs=scan.refs, new_words={w.lower() for w in new})
+        summary_pages.append({"page": title, "route": scan.route, "status": status, "json": out_json,
+                              "misspelled": len(miss_map), "new": sorted(new, key=str.lower), "fixed": fixed})
+        if config["update_spelling_baseline"]:
+            baseline.update(scan.route, miss_map)
 
         # Add to reports
-        if miss_map:
+        if diff_mode:
+            if not new:
+                summary_lines.append(f"[{status:7}] {title}: no new misspellings ({len(known)} known)")
+                continue
+            msg = (f"{title}: {len(new)} NEW misspelled: "
+                   + ", ".join(f"{w} -> {s}" for w, s in sorted(new.items(), key=lambda kv: kv[0].lower()))
+                   + f" ({len(known)} known)")
+        elif miss_map:
             msg = f"{title}: {len(miss_map)} misspelled (see {os.path.basename(out_txt)})"
         else:
             msg = f"{title}: no spelling issues (see {os.path.basename(out_txt)})"
-        report.add_info(msg)
+        if fixed:
+            msg += f"; fixed since baseline: {', '.join(fixed)}"
+        report.add_info(f"{msg} [{status}]")
         if report_pdf:
-            report_pdf.add_step(f"Spelling - {title}", msg)
+            report_pdf.add_step(f"Spelling - {title}", f"{msg} [{status}]")
 
         # Add to summary
-        summary_lines.append(msg)
+        summary_lines.append(f"[{status:7}] {msg}")
+
+    store.save()
+    if config["update_spelling_baseline"]:
+        baseline.save()
+        report.add_info(f"Spelling baseline updated: {baseline.path}")
 
     # Write combined summary
     with open(summary_path, "w", encoding="utf-8") as f:
         f.write("\n".join(summary_lines))
+    with open(os.path.join(artifacts, "spelling_summary.json"), "w", encoding="utf-8") as f:
+        json.dump({"mode": "diff" if diff_mode else "full", "new_total": new_total, "pages": summary_pages}, f, indent=2)
+
+    if diff_mode and not config["update_spelling_baseline"]:
+        assert new_total == 0, f"{new_total} new misspelling(s) vs {os.path.basename(baseline.path)} (see {summary_path})"
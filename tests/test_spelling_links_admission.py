@@ -1,65 +1,30 @@
 # tests/test_spelling_links_admission.py
-import re
-import requests
-from spellchecker import SpellChecker
+from utils.lexicon import lexicon
+from utils.scan import ScanRunner
+from utils.spell import spell_engine
 
-from pages.login_page import LoginPage
-from utils.dom import get_visible_text, collect_links
-
-ALLOWED = {200, 204, 301, 302, 303, 307, 308}
-TIMEOUT = 15
-
-WHITELIST = {
-    "Devant", "Admission", "Admissions", "Student", "Bengali",
-    "XYZ", "abc", "VI", "T2", "T5", "English", "History",
-    "SN25", "SHA", "SHT", "PN", "Dashboard", "Class", "Session",
-    "Serial", "Certificate", "Transfer"
-}
-
-def _tokenize(text):
-    words = re.findall(r"[A-Za-z]{3,}", text)
-    wl = {w.lower() for w in WHITELIST}
-    return [w for w in words if w.lower() not in wl]
-
-def _check(url):
-    try:
-        r = requests.head(url, allow_redirects=True, timeout=TIMEOUT)
-        if r.status_code not in ALLOWED:
-            r = requests.get(url, allow_redirects=True, timeout=TIMEOUT)
-        return r.status_code in ALLOWED, r.status_code
-    except Exception:
-        return False, None
-
-def test_spelling_and_links_on_admission(driver, config, shots, report_pdf, report_docx):
-    lp = LoginPage(driver, config["base_url"])
-    lp.open()
-    lp.login(config["user"], config["password"])
+def test_spelling_and_links_on_admission(authenticated_driver, config, shots, report_pdf, report_docx, link_checker, route_validator):
+    driver = authenticated_driver
     shots.capture("Admission: Dashboard after login")
 
-    # Scan /admission list page
-    driver.get(f"{config['base_url']}/admission")
-    shots.capture("Admission list open")
-    text1 = get_visible_text(driver)
-
-    # Click Add New Student and scan /studentAdmission page
-    driver.get(f"{config['base_url']}/admission")
-    shots.capture("Admission list (for link capture)")
-    hrefs_list = collect_links(driver)
-
-    # Open the form page itself too (in case the button is not clickable in headless)
-    driver.get(f"{config['base_url']}/studentAdmission")
-    shots.capture("Student Admission form open")
-    text2 = get_visible_text(driver)
-    hrefs_form = collect_links(driver)
+    # Both pages load in parallel tabs; their links are checked while the next page loads
+    # (the form page is opened directly in case the Add New Student button is not clickable in headless)
+    runner = ScanRunner(driver, config["base_url"], tabs=config["scan_tabs"], spelling=False,
+                        link_checker=link_checker, route_validator=route_validator)
+    titles = {"/admission": "Admission list open", "/studentAdmission": "Student Admission form open"}
+    scans = runner.run([("Admission list", "/admission"), ("Student Admission form", "/studentAdmission")],
+                       on_page=lambda scan: shots.capture(titles[scan.route]))
+    text1, text2 = (scan.text for scan in scans)
+    hrefs = sorted({u for scan in scans for u in scan.links})
 
     # Spelling analysis
-    speller = SpellChecker()
-    words = _tokenize(text1 + " " + text2)
+    speller = spell_engine()
+    words = lexicon().check_words(text1 + " " + text2)
     miss = speller.unknown([w.lower() for w in words])
     if miss:
         details = []
         for w in sorted(miss):
-            cand = next(iter(speller.candidates(w)), None)
+            cand = speller.suggestion(w)
             details.append(f"{w} -> suggestion: {cand}")
         msg = "Admission pages spelling issues:\n" + "\n".join(details)
         report_docx.add_info(msg)
@@ -70,17 +35,13 @@ def test_spelling_and_links_on_admission(driver, config, shots, report_pdf, repo
         report_pdf.add_info(ok)
 
     # Broken links check (both pages)
-    bad = []
-    for u in sorted(set(hrefs_list + hrefs_form)):
-        ok, code = _check(u)
-        if not ok:
-            bad.append((u, code))
+    bad = sorted({b for scan in scans for b in scan.broken}, key=lambda b: b[0])
     if bad:
         shots.capture("Admission pages: Broken links")
         msg = "Admission pages broken links:\n" + "\n".join([f"{u} (status={code})" for u, code in bad])
         report_docx.add_info(msg)
         report_pdf.add_info(msg)
     else:
-        ok = f"Admission pages: no broken links ({len(set(hrefs_list + hrefs_form))} links scanned)."
+        ok = f"Admission pages: no broken links ({len(hrefs)} links scanned)."
         report_docx.add_info(ok)
         report_pdf.add_info(ok)
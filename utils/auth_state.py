@@ -0,0 +1,131 @@
+# utils/auth_state.py
+import json
+from urllib.parse import urlparse
+
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+
+from pages.login_page import LoginPage
+from utils.cdp import execute_cdp
+
+_READ_STORAGE_JS = """
+function dump(s) { const o = {}; for (let i = 0; i < s.length; i++) { const k = s.key(i); o[k] = s.getItem(k); } return o; }
+return {local: dump(window.localStorage), session: dump(window.sessionStorage)};
+"""
+
+# Runs before any page script; only fills keys the app has not written itself
+_SEED_STORAGE_JS = """
+(function (origin, local, session) {
+  if (window.location.origin !== origin) return;
+  for (const [k, v] of Object.entries(local)) { if (localStorage.getItem(k) === null) localStorage.setItem(k, v); }
+  for (const [k, v] of Object.entries(session)) { if (sessionStorage.getItem(k) === null) sessionStorage.setItem(k, v); }
+})(%s, %s, %s);
+"""
+
+_SAME_SITE = {"strict": "Strict", "lax": "Lax", "none": "None"}
+
+
+class AuthStateCache:
+    """
+    Log in through the UI once per user, then replay that authenticated state into new drivers.
+    State = cookies + localStorage + sessionStorage captured right after a successful login.
+    ensure() re-logs in through the UI only when the replayed state does not reach the
+    dashboard (LoginPage.ACADEMICS missing), e.g. because the server-side session expired.
+    """
+    def __init__(self, base_url, verify_timeout=10):
+        self.base_url = base_url.rstrip("/")
+        self.origin = "{0.scheme}://{0.netloc}".format(urlparse(self.base_url))
+        self.verify_timeout = verify_timeout
+        self._states = {}       # user -> {"cookies": [...], "local": {...}, "session": {...}}
+
+    # ---------- Capture ----------
+    def capture(self, driver):
+        storage = driver.execute_script(_READ_STORAGE_JS) or {}
+        return {
+            "cookies": driver.get_cookies(),
+            "local": storage.get("local") or {},
+            "session": storage.get("session") or {},
+        }
+
+    def login(self, driver, user, password):
+        lp = LoginPage(driver, self.base_url)
+        lp.open()
+        lp.login(user, password)
+        self._states[user] = self.capture(driver)
+        return self._states[user]
+
+    # ---------- Replay ----------
+    def _cdp_cookie(self, c):
+        out = {"name": c["name"], "value": c["value"], "path": c.get("path", "/"),
+               "secure": bool(c.get("secure")), "httpOnly": bool(c.get("httpOnly"))}
+        if c.get("domain"):
+            out["domain"] = c["domain"]
+        else:
+            out["url"] = self.origin
+        if c.get("expiry"):
+            out["expires"] = float(c["expiry"])
+        if c.get("sameSite"):
+            out["sameSite"] = _SAME_SITE.get(str(c["sameSite"]).lower(), "Lax")
+        return out
+
+    def _inject_cdp(self, driver, state):
+        """Seed cookies + storage before the first navigation. Returns the script id to remove later."""
+        execute_cdp(driver, "Network.setCookies", {"cookies": [self._cdp_cookie(c) for c in state["cookies"]]})
+        script = _SEED_STORAGE_JS % (json.dumps(self.origin), json.dumps(state["local"]), json.dumps(state["session"]))
+        res = execute_cdp(driver, "Page.addScriptToEvaluateOnNewDocument", {"source": script})
+        return (res or {}).get("identifier")
+
+    def _inject_webdriver(self, driver, state):
+        # No CDP: cookies/storage can only be set on the app origin, so land there first
+        driver.get(f"{self.base_url}/login")
+        for c in state["cookies"]:
+            c = {k: v for k, v in c.items() if k in ("name", "value", "path", "domain", "secure", "httpOnly", "expiry", "sameSite")}
+            try:
+                driver.add_cookie(c)
+            except Exception:
+                continue
+        driver.execute_script(
+            "for (const [k, v] of Object.entries(arguments[0])) localStorage.setItem(k, v);"
+            "for (const [k, v] of Object.entries(arguments[1])) sessionStorage.setItem(k, v);",
+            state["local"], state["session"],
+        )
+
+    def _logged_in(self, driver):
+        try:
+            WebDriverWait(driver, self.verify_timeout).until(
+                EC.visibility_of_element_located(LoginPage.ACADEMICS)
+            )
+            return True
+        except TimeoutException:
+            return False
+
+    def restore(self, driver, state):
+        """Replay state and open the dashboard. Returns True if the session is still valid."""
+        script_id = None
+        try:
+            script_id = self._inject_cdp(driver, state)
+        except Exception:
+            self._inject_webdriver(driver, state)
+        driver.get(self.base_url)
+        ok = self._logged_in(driver)
+        if script_id:
+            # Seeding is a one-shot; later navigations (and the next test on a pooled browser) must not see it
+            try:
+                execute_cdp(driver, "Page.removeScriptToEvaluateOnNewDocument", {"identifier": script_id})
+            except Exception:
+                pass
+        return ok
+
+    def ensure(self, driver, user, password):
+        """Leave `driver` authenticated as `user` on the dashboard, logging in via UI only if needed."""
+        state = self._states.get(user)
+        if state and self.restore(driver, state):
+            return driver
+        if state:
+            print(f"[auth] Stored session for {user} no longer valid; logging in again")
+            # Drop the stale state so the login form is not short-circuited by a half-valid session
+            driver.delete_all_cookies()
+            driver.execute_script("localStorage.clear(); sessionStorage.clear();")
+        self.login(driver, user, password)
+        return driver
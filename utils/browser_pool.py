@@ -0,0 +1,123 @@
+# utils/browser_pool.py
+import queue
+import threading
+from urllib.parse import urlsplit
+
+from utils.cdp import execute_cdp
+
+
+class BrowserPool:
+    """
+    Fixed number of long-lived browser sessions shared by the tests of one run.
+      - acquire(): hand out an idle session (creates one if the pool is not full yet)
+      - release(): reset the session (cookies, storage, extra windows, about:blank) and park it
+    A session that crashed or fails its health check is quit and replaced by a fresh browser.
+    origins: app URLs whose storage is always wiped on reset, whatever page the test ended on.
+    """
+    def __init__(self, factory, size=1, acquire_timeout=300, origins=()):
+        self.factory = factory              # callable -> new raw WebDriver
+        self.size = max(1, int(size))
+        self.acquire_timeout = acquire_timeout
+        self.origins = [f"{p.scheme}://{p.netloc}" for p in map(urlsplit, origins)]
+        self._idle = queue.LifoQueue()      # LIFO: reuse the warmest session first
+        self._created = 0
+        self._lock = threading.Lock()
+
+    # ---------- Health / reset ----------
+    @staticmethod
+    def is_healthy(drv) -> bool:
+        try:
+            return bool(drv.window_handles) and drv.execute_script("return 1;") == 1
+        except Exception:
+            return False
+
+    @staticmethod
+    def _close_extra_windows(drv):
+        handles = drv.window_handles
+        keep = handles[0]
+        for h in handles[1:]:
+            drv.switch_to.window(h)
+            drv.close()
+        drv.switch_to.window(keep)
+
+    def _clear_storage(self, drv):
+        # Web storage is per-origin: clear the test's last page, then the app origins by name -
+        # the test may have ended on about:blank, the login redirect or an external page
+        drv.execute_script(
+            "try { window.localStorage.clear(); } catch (e) {}"
+            "try { window.sessionStorage.clear(); } catch (e) {}"
+        )
+        for origin in self.origins:
+            # Without CDP this raises: reset() fails and the session is replaced, not reused dirty
+            execute_cdp(drv, "Storage.clearDataForOrigin", {
+                "origin": origin, "storageTypes": "local_storage,session_storage,indexeddb,cache_storage"})
+
+    @staticmethod
+    def _clear_cookies(drv):
+        # CDP wipes cookies of every domain; WebDriver only those of the current one
+        try:
+            execute_cdp(drv, "Network.clearBrowserCookies")
+        except Exception:
+            drv.delete_all_cookies()
+
+    def reset(self, drv) -> bool:
+        """Bring a used session back to a blank state. Returns False if it is not reusable."""
+        try:
+            self._close_extra_windows(drv)
+            self._clear_storage(drv)
+            self._clear_cookies(drv)
+            drv.get("about:blank")
+        except Exception:
+            return False
+        return self.is_healthy(drv)
+
+    # ---------- Pool API ----------
+    def _discard(self, drv):
+        try:
+            drv.quit()
+        except Exception:
+            pass
+        with self._lock:
+            self._created -= 1
+
+    def _create(self):
+        try:
+            return self.factory()
+        except Exception:
+            with self._lock:
+                self._created -= 1
+            raise
+
+    def acquire(self):
+        try:
+            drv = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                can_create = self._created < self.size
+                if can_create:
+                    self._created += 1
+            if can_create:
+                return self._create()
+            drv = self._idle.get(timeout=self.acquire_timeout)
+
+        if self.is_healthy(drv):
+            return drv
+        # Crashed while parked (or between tests): fall back to a fresh browser
+        self._discard(drv)
+        with self._lock:
+            self._created += 1
+        return self._create()
+
+    def release(self, drv):
+        if self.reset(drv):
+            self._idle.put(drv)
+        else:
+            self._discard(drv)
+
+    def close(self):
+        while True:
+            try:
+                drv = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(drv)
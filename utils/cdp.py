@@ -0,0 +1,13 @@
+# utils/cdp.py
+
+
+def execute_cdp(driver, cmd, params=None):
+    """
+    Run a Chrome DevTools command on a local Chrome driver or on a Remote session
+    attached to the shared chromedriver service (which has no execute_cdp_cmd()).
+    """
+    drv = getattr(driver, "wrapped_driver", driver)  # unwrap EventFiringWebDriver
+    params = params or {}
+    if hasattr(drv, "execute_cdp_cmd"):
+        return drv.execute_cdp_cmd(cmd, params)
+    return drv.execute("executeCdpCommand", {"cmd": cmd, "params": params})["value"]
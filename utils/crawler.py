@@ -0,0 +1,230 @@
+# utils/crawler.py
+import re
+import time
+from collections import deque
+from urllib.parse import urlsplit
+
+from utils.dom import collect_anchors, get_visible_text
+from utils.spell import analyze_text
+from utils.link_cache import normalize_url
+from utils.routes import split_links
+from utils.tabs import TabLoader
+
+# Never follow links that end the session or change data
+DEFAULT_EXCLUDE = r"log-?out|sign-?out|delete|remove|destroy"
+SKIP_EXTENSIONS = (".pdf", ".zip", ".xls", ".xlsx", ".csv", ".doc", ".docx", ".png", ".jpg", ".jpeg", ".gif", ".svg")
+
+
+class CrawlPage:
+    def __init__(self, url, depth):
+        self.url = url
+        self.depth = depth
+        self.final_url = None
+        self.title = ""
+        self.load_seconds = None
+        self.anchors = []           # collect_anchors() of the loaded page
+        self.error = None
+        self.findings = {}          # analyzer name -> summary line
+
+    def __repr__(self):
+        return f"CrawlPage({self.url!r}, depth={self.depth}, error={self.error!r})"
+
+
+# ---------- Analyzers: analyze(driver, page) -> one summary line (or None) ----------
+# Optional finish(driver, pages) runs once after the crawl (all tabs closed) and may fill in
+# page.findings for results that needed the whole crawl.
+class TimingAnalyzer:
+    name = "timing"
+    _JS = """
+    const n = performance.getEntriesByType('navigation')[0];
+    return n ? {ttfb: n.responseStart - n.requestStart, dcl: n.domContentLoadedEventEnd, load: n.loadEventEnd} : null;
+    """
+
+    def analyze(self, driver, page):
+        t = driver.execute_script(self._JS)
+        if not t:
+            return None
+        return f"ttfb {t['ttfb']:.0f} ms, DOMContentLoaded {t['dcl']:.0f} ms, load {t['load']:.0f} ms"
+
+
+class SpellingAnalyzer:
+    name = "spelling"
+
+    def __init__(self, store=None):
+        self.store = store          # optional PageSpellStore: unchanged pages are not re-checked
+        self.misspelled = {}        # url -> {word: suggestion}
+
+    def analyze(self, driver, page):
+        text = get_visible_text(driver)
+        status = ""
+        if self.store is not None:
+            words, miss_map, status, _ = self.store.analyze(urlsplit(page.final_url or page.url).path or "/", text)
+            status = f" [{status}]"
+        else:
+            words, miss_map = analyze_text(text)
+        self.misspelled[page.url] = miss_map
+        if not miss_map:
+            return f"{len(words)} words, no spelling issues{status}"
+        return f"{len(words)} words, {len(miss_map)} misspelled{status}: " + ", ".join(sorted(miss_map, key=str.lower))
+
+
+class LinkAnalyzer:
+    """
+    Broken links per page. With a RouteValidator, SPA routes are judged from the crawl itself:
+    each crawled page gets a route verdict (login redirect, "not found", nothing rendered) on
+    the tab it was loaded in, and at the end of the crawl only the linked routes the crawler
+    did not visit (beyond the budgets, excluded) are loaded again, in background tabs.
+    """
+    name = "links"
+
+    def __init__(self, checker, validator=None):
+        self.checker = checker      # LinkChecker (concurrent, cached)
+        self.validator = validator  # optional RouteValidator
+        self.broken = {}            # url -> [(link, status)]
+        self._visited = {}          # normalized crawled url -> LinkResult
+        self._routes = {}           # page url -> (hrefs, routes, broken http links), resolved in finish()
+
+    @staticmethod
+    def _line(hrefs, bad):
+        if not bad:
+            return f"{len(hrefs)} links, none broken"
+        return f"{len(hrefs)} links, {len(bad)} broken: " + ", ".join(f"{u} (status={code})" for u, code in bad)
+
+    def analyze(self, driver, page):
+        hrefs = sorted({a["href"] for a in page.anchors if a["href"].startswith("http")})
+        if self.validator is None:
+            self.broken[page.url] = bad = self.checker.broken(hrefs)
+            return self._line(hrefs, bad)
+        self._visited[normalize_url(page.url)] = self.validator.observe(page.url, page.final_url, page.load_seconds)
+        origin = "{0.scheme}://{0.netloc}".format(urlsplit(page.final_url or page.url))
+        routes, http = split_links(hrefs, origin)
+        self._routes[page.url] = (hrefs, routes, self.checker.broken(http))
+        return None                 # routes are judged once the crawl knows which it visited
+
+    def finish(self, driver, pages):
+        if self.validator is None:
+            return
+        for page in pages:
+            key = normalize_url(page.url)
+            if key not in self._visited and page.final_url is None and page.error:
+                self._visited[key] = self.validator.observe(page.url, None, page.load_seconds, page.error)
+        unvisited = [u for _, routes, _ in self._routes.values() for u in routes
+                     if normalize_url(u) not in self._visited]
+        found = dict(self.validator.broken(unvisited)) if unvisited else {}
+        for page in pages:
+            if page.url not in self._routes:
+                continue
+            hrefs, routes, http_bad = self._routes[page.url]
+            bad = dict(http_bad)
+            for u in routes:
+                seen = self._visited.get(normalize_url(u))
+                if seen is not None and not seen.ok:
+                    bad[u] = seen.status
+                elif seen is None and u in found:
+                    bad[u] = found[u]
+            self.broken[page.url] = [(u, bad[u]) for u in hrefs if u in bad]
+            page.findings[self.name] = self._line(hrefs, self.broken[page.url])
+
+
+class Crawler:
+    """
+    Breadth-first crawl of same-origin routes from the page the driver is on (e.g. the
+    dashboard after login). Each route is visited once and every analyzer runs on it.
+    Budgets: max_depth (link hops from the start page), max_pages, time_budget (seconds;
+    no new page is started after it runs out). Up to `tabs` pages load in parallel browser
+    tabs (TabLoader); analyzers run on each page as soon as it is ready.
+    """
+    def __init__(self, driver, analyzers=(), max_depth=2, max_pages=30, time_budget=300, tabs=3,
+                 page_timeout=30, exclude=DEFAULT_EXCLUDE):
+        self.driver = driver
+        self.analyzers = list(analyzers)
+        self.max_depth = max_depth
+        self.max_pages = max_pages
+        self.time_budget = time_budget
+        self.tabs = max(1, int(tabs))
+        self.page_timeout = page_timeout
+        self.exclude = re.compile(exclude, re.I) if exclude else None
+        self.pages = []
+        self.stopped_by = None      # which budget ended the crawl (None = site exhausted)
+
+    def _follow(self, href, origin):
+        if not href.startswith(origin + "/") and href != origin:
+            return False
+        path = urlsplit(href).path.lower()
+        if path.endswith(SKIP_EXTENSIONS):
+            return False
+        return not (self.exclude and self.exclude.search(href))
+
+    def _visit(self, page, origin):
+        page.title = self.driver.title
+        page.anchors = collect_anchors(self.driver)
+        if not page.final_url.startswith(origin):
+            page.error = f"left the site ({page.final_url})"
+            return
+        for analyzer in self.analyzers:
+            try:
+                line = analyzer.analyze(self.driver, page)
+            except Exception as e:
+                line = f"analyzer error: {e}"
+            if line:
+                page.findings[analyzer.name] = line
+
+    def run(self):
+        started = time.monotonic()
+        start_url = self.driver.current_url
+        origin = "{0.scheme}://{0.netloc}".format(urlsplit(start_url))
+        seen = {normalize_url(start_url)}
+        frontier = deque([(start_url, 0)])
+
+        def next_page():
+            # Budgets are checked whenever a tab is free to start another page
+            if not frontier:
+                return None
+            if len(self.pages) >= self.max_pages:
+                self.stopped_by = "max_pages"
+                return None
+            if time.monotonic() - started > self.time_budget:
+                self.stopped_by = "time_budget"
+                return None
+            url, depth = frontier.popleft()
+            page = CrawlPage(url, depth)
+            self.pages.append(page)
+            return url, page
+
+        with TabLoader(self.driver, tabs=self.tabs, page_timeout=self.page_timeout) as tabs:
+            for page, final_url, seconds, error in tabs.load(next_page):
+                page.final_url, page.load_seconds, page.error = final_url, seconds, error
+                if error:
+                    continue
+                self._visit(page, origin)
+                if page.error or page.depth >= self.max_depth:
+                    continue
+                for a in page.anchors:
+                    key = normalize_url(a["href"]) if a["href"].startswith("http") else None
+                    if key and key not in seen and self._follow(a["href"], origin):
+                        seen.add(key)
+                        frontier.append((a["href"], page.depth + 1))
+        for analyzer in self.analyzers:
+            finish = getattr(analyzer, "finish", None)
+            if finish is None:
+                continue
+            try:
+                finish(self.driver, self.pages)
+            except Exception as e:
+                print(f"[crawl] {analyzer.name}: finish failed: {e}")
+        return self.pages
+
+    def summary_lines(self):
+        lines = []
+        for page in self.pages:
+            head = f"[depth {page.depth}] {page.url}"
+            if page.load_seconds is not None and not page.error:
+                head += f" ({page.load_seconds:.1f}s)"
+            lines.append(head)
+            if page.error:
+                lines.append(f"    error: {page.error}")
+            for name, line in page.findings.items():
+                lines.append(f"    {name}: {line}")
+        stop = f"stopped by {self.stopped_by}" if self.stopped_by else "all reachable routes visited"
+        lines.append(f"Crawled {len(self.pages)} pages ({stop}).")
+        return lines
@@ -1,44 +1,195 @@
-from urllib.parse import urljoin
-from selenium.webdriver.common.by import By
+import re
+
+# Visible text in one pass. Elements are not styled on the way down: visibility is decided
+# once per text node's parent (memoized), natively with one Element.checkVisibility() call,
+# which also covers display:none ancestors. Only a parent that comes back hidden is styled, to
+# tell display:contents (ask its parent) and visibility:hidden (keep walking: children may be
+# visible) from a display:none subtree, which is pruned from the element that carries the
+# display:none, so the rest of a closed modal is never walked. script/style/..., childless
+# elements and icon <svg>s are rejected unstyled. Browsers without checkVisibility() fall
+# back to a memoized getComputedStyle walk.
+# With arguments[0] = true the text comes back as [[element_index, text], ...] and the
+# elements stay in window.__visibleTextEls for highlighting.
+_VISIBLE_TEXT_JS = """
+const withRefs = arguments[0];
+const SKIP = new Set(['SCRIPT', 'STYLE', 'NOSCRIPT', 'TEMPLATE', 'HEAD']);
+const body = document.body;
+if (!body) return withRefs ? [] : '';
+const native = typeof body.checkVisibility === 'function';
+const shown = new Map();            // text parent -> visible
+const displayed = new Map();        // fallback: element -> no display:none on it or above
+const pruned = new Set();           // elements inside a display:none subtree
+function rendered(el, style) {
+  let r = displayed.get(el);
+  if (r === undefined) {
+    r = (style || window.getComputedStyle(el)).display !== 'none' && (el === body || rendered(el.parentElement));
+    displayed.set(el, r);
+  }
+  return r;
+}
+function prune(el, style) {
+  // el is hidden by display:none on it or above: prune up to the element that has it
+  const path = [];
+  for (let e = el; ; e = e.parentElement) {
+    path.push(e);
+    if ((e === el ? style : window.getComputedStyle(e)).display === 'none') break;
+    if (e === body) return;         // hidden some other way (content-visibility): walk it
+  }
+  for (const e of path) pruned.add(e);
+}
+function visibleParent(el) {
+  let v = shown.get(el);
+  if (v !== undefined) return v;
+  const hiddenBy = style => style.visibility === 'hidden' || style.visibility === 'collapse';
+  if (native) {
+    v = el.checkVisibility({checkVisibilityCSS: true, visibilityProperty: true});
+    if (!v) {
+      const style = window.getComputedStyle(el);
+      if (hiddenBy(style)) v = false;
+      else if (style.display === 'contents') v = el === body || visibleParent(el.parentElement);
+      else prune(el, style);
+    }
+  } else {
+    const style = window.getComputedStyle(el);
+    v = !hiddenBy(style) && rendered(el, style);
+    if (!v && !hiddenBy(style)) prune(el, style);
+  }
+  shown.set(el, v);
+  return v;
+}
+const walker = document.createTreeWalker(body, NodeFilter.SHOW_ELEMENT | NodeFilter.SHOW_TEXT, {
+  acceptNode(node) {
+    if (pruned.has(node.parentElement)) return NodeFilter.FILTER_REJECT;
+    if (node.nodeType === Node.ELEMENT_NODE) {
+      if (!node.firstChild || SKIP.has(node.tagName)) return NodeFilter.FILTER_REJECT;
+      if (node.localName === 'svg' && !node.querySelector('text')) return NodeFilter.FILTER_REJECT;
+      return NodeFilter.FILTER_SKIP;
+    }
+    if (!node.nodeValue.trim()) return NodeFilter.FILTER_REJECT;
+    return visibleParent(node.parentElement) ? NodeFilter.FILTER_ACCEPT : NodeFilter.FILTER_REJECT;
+  }
+});
+const els = [], index = new Map(), chunks = [];
+while (walker.nextNode()) {
+  const node = walker.currentNode;
+  if (!withRefs) { chunks.push(node.nodeValue); continue; }
+  let i = index.get(node.parentElement);
+  if (i === undefined) { i = els.length; els.push(node.parentElement); index.set(node.parentElement, i); }
+  chunks.push([i, node.nodeValue]);
+}
+if (!withRefs) return chunks.join(' ');
+window.__visibleTextEls = els;
+return chunks;
+"""
+
+# Wrap the given words in <mark> inside the referenced elements (for a screenshot)
+_HIGHLIGHT_JS = """
+const idx = arguments[0], words = arguments[1];
+const els = window.__visibleTextEls || [];
+const esc = w => w.replace(/[.*+?^${}()|[\\]\\\\]/g, '\\\\$&');
+const re = new RegExp('(?<![A-Za-z])(' + words.map(esc).join('|') + ')(?![A-Za-z])', 'g');
+let n = 0;
+for (const i of idx) {
+  const el = els[i];
+  if (!el || !el.isConnected) continue;
+  for (const node of Array.from(el.childNodes)) {
+    if (node.nodeType !== Node.TEXT_NODE) continue;
+    const v = node.nodeValue;
+    re.lastIndex = 0;
+    if (!re.test(v)) continue;
+    re.lastIndex = 0;
+    const frag = document.createDocumentFragment();
+    let last = 0, m;
+    while ((m = re.exec(v))) {
+      frag.append(v.slice(last, m.index));
+      const mark = document.createElement('mark');
+      mark.className = '__spell-mark';
+      mark.style.cssText = 'background:#ffeb3b;outline:2px solid #e53935;color:inherit';
+      mark.textContent = m[0];
+      frag.append(mark);
+      last = m.index + m[0].length;
+      n++;
+    }
+    frag.append(v.slice(last));
+    node.replaceWith(frag);
+  }
+}
+const first = document.querySelector('mark.__spell-mark');
+if (first) first.scrollIntoView({block: 'center'});
+return n;
+"""
+
+_CLEAR_HIGHLIGHT_JS = """
+for (const m of document.querySelectorAll('mark.__spell-mark')) {
+  const parent = m.parentNode;
+  m.replaceWith(document.createTextNode(m.textContent));
+  parent.normalize();
+}
+"""
 
 def get_visible_text(driver):
-    # Extract visible text nodes (simple approach)
-    # Skip scripts/styles; get body text and normalize whitespace
-    text = driver.execute_script("""
-        function visibleText(element) {
-          const walker = document.createTreeWalker(element, NodeFilter.SHOW_TEXT, {
-            acceptNode: function(node) {
-              if (!node.nodeValue.trim()) return NodeFilter.FILTER_REJECT;
-              if (!node.parentElement) return NodeFilter.FILTER_REJECT;
-              const style = window.getComputedStyle(node.parentElement);
-              if (style && (style.visibility === 'hidden' || style.display === 'none')) return NodeFilter.FILTER_REJECT;
-              return NodeFilter.FILTER_ACCEPT;
-            }
-          });
-          let result = [];
-          while (walker.nextNode()) { result.push(walker.currentNode.nodeValue); }
-          return result.join(' ');
-        }
-        return visibleText(document.body);
-    """)
+    """Visible text of the page, whitespace-normalized."""
+    text = driver.execute_script(_VISIBLE_TEXT_JS, False)
     # Basic normalization
     return " ".join((text or "").split())
 
+def get_visible_text_refs(driver):
+    """
+    (text, refs): the same text as get_visible_text plus, per word, the index of its source
+    element - refs = [(word, element_index), ...] - for highlight_words().
+    """
+    chunks = driver.execute_script(_VISIBLE_TEXT_JS, True) or []
+    refs = [(w, i) for i, value in chunks for w in value.split()]
+    return " ".join(w for w, _ in refs), refs
+
+def highlight_words(driver, refs, words):
+    """Mark `words` (e.g. misspellings) on the page where refs say they are; returns the mark count."""
+    words = set(words)
+    if not words:
+        return 0
+    idx = sorted({i for w, i in refs if words.intersection(re.findall(r"[A-Za-z]+", w))})
+    return driver.execute_script(_HIGHLIGHT_JS, idx, sorted(words)) if idx else 0
+
+def clear_highlights(driver):
+    driver.execute_script(_CLEAR_HIGHLIGHT_JS)
+
+# One round trip: every anchor with its resolved href, text, rel/target and visibility.
+# Same-origin filter runs in the page (absolute links to other origins are dropped;
+# non-http schemes are kept, as before).
+_ANCHORS_JS = """
+const sameOriginOnly = arguments[0];
+const origin = window.location.origin;
+const out = [];
+for (const a of document.querySelectorAll('a[href]')) {
+  const href = a.href;
+  if (!href) continue;
+  if (sameOriginOnly && !href.startsWith(origin) && href.startsWith('http')) continue;
+  const rect = a.getBoundingClientRect();
+  const style = window.getComputedStyle(a);
+  out.push({
+    href: href,
+    text: (a.innerText || a.textContent || '').trim(),
+    rel: a.getAttribute('rel') || '',
+    target: a.getAttribute('target') || '',
+    visible: rect.width > 0 && rect.height > 0 && style.visibility !== 'hidden' && style.display !== 'none'
+  });
+}
+return out;
+"""
+
+def collect_anchors(driver, include_same_origin_only=True):
+    """[{href, text, rel, target, visible}] for every a[href] on the page, in document order."""
+    return driver.execute_script(_ANCHORS_JS, bool(include_same_origin_only)) or []
+
 def collect_links(driver, include_same_origin_only=True):
-    origin = driver.execute_script("return window.location.origin;")
-    anchors = driver.find_elements(By.CSS_SELECTOR, "a[href]")
-    hrefs = []
-    for a in anchors:
-        try:
-            href = a.get_attribute("href")
-            if not href:
-                continue
-            if include_same_origin_only and not href.startswith(origin):
-                # Keep relative routes too
-                if href.startswith("http"):
-                    continue
-            hrefs.append(urljoin(origin + "/", href))
-        except Exception:
-            continue
+    hrefs = [a["href"] for a in collect_anchors(driver, include_same_origin_only)]
     # De-duplicate
     return sorted(set(hrefs))
+
+# Text of every non-empty table cell, in one round trip (feeds Lexicon.harvest)
+_TABLE_CELLS_JS = """
+return Array.from(document.querySelectorAll('td, th'), c => (c.innerText || '').trim()).filter(t => t);
+"""
+
+def get_table_cells(driver):
+    return driver.execute_script(_TABLE_CELLS_JS) or []
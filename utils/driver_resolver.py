@@ -0,0 +1,117 @@
+# utils/driver_resolver.py
+import os
+import hashlib
+import datetime
+
+from selenium.webdriver.chrome.service import Service
+
+from utils.jsonstore import atomic_merge_save, read_json
+
+MANIFEST_PATH = os.path.join(".cache", "chromedriver", "manifest.json")
+
+
+def detect_chrome_version():
+    """Installed Chrome version (e.g. '141.0.7390.54') or None if it cannot be read."""
+    try:
+        from webdriver_manager.core.os_manager import OperationSystemManager, ChromeType
+        return OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE)
+    except Exception:
+        return None
+
+
+def _sha256(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class DriverResolver:
+    """
+    Resolve the chromedriver binary once per run and remember it in a local manifest:
+      {"entries": {"<chrome major>": {"chrome_version", "driver_path", "sha256", "resolved_at"}}}
+    A manifest entry is reused (no network) when the binary still exists and its checksum matches.
+    In offline mode webdriver-manager is never called; the newest valid entry is used instead.
+    """
+    def __init__(self, manifest_path=MANIFEST_PATH, offline=False, driver_path=None):
+        self.manifest_path = manifest_path
+        self.offline = offline
+        self.driver_path = driver_path      # explicit override (--chromedriver / CHROMEDRIVER_PATH)
+
+    # ---------- Manifest ----------
+    def _load(self):
+        manifest = read_json(self.manifest_path)
+        manifest.setdefault("entries", {})
+        return manifest
+
+    def _record(self, manifest, key, chrome_version, path):
+        entry = {
+            "chrome_version": chrome_version,
+            "driver_path": os.path.abspath(path),
+            "sha256": _sha256(path),
+            "resolved_at": datetime.datetime.now().isoformat(timespec="seconds"),
+        }
+        manifest.setdefault("entries", {})[key] = entry
+
+        def merge(current):
+            # Keep entries other workers recorded for other Chrome versions meanwhile
+            current.setdefault("entries", {})[key] = entry
+            return current
+
+        atomic_merge_save(self.manifest_path, merge, indent=2)
+
+    @staticmethod
+    def _valid(entry):
+        path = (entry or {}).get("driver_path")
+        if not path or not os.path.isfile(path):
+            return False
+        if _sha256(path) != entry.get("sha256"):
+            print(f"[driver] Checksum mismatch, ignoring cached driver: {path}")
+            return False
+        return True
+
+    def _newest_valid(self, manifest):
+        entries = sorted(manifest.get("entries", {}).values(),
+                         key=lambda e: e.get("resolved_at", ""), reverse=True)
+        return next((e for e in entries if self._valid(e)), None)
+
+    # ---------- Resolution ----------
+    def resolve(self) -> str:
+        manifest = self._load()
+        chrome_version = detect_chrome_version()
+        key = chrome_version.split(".")[0] if chrome_version else "unknown"
+
+        if self.driver_path:
+            self._record(manifest, key, chrome_version, self.driver_path)
+            return os.path.abspath(self.driver_path)
+
+        entry = manifest.get("entries", {}).get(key)
+        if self._valid(entry):
+            return entry["driver_path"]
+
+        if not self.offline:
+            try:
+                from webdriver_manager.chrome import ChromeDriverManager
+                path = ChromeDriverManager().install()
+                self._record(manifest, key, chrome_version, path)
+                return path
+            except Exception as e:
+                print(f"[driver] webdriver-manager failed ({e}); trying cached drivers")
+
+        entry = self._newest_valid(manifest)
+        if entry:
+            print(f"[driver] Using cached chromedriver for Chrome {entry.get('chrome_version')} "
+                  f"(installed Chrome: {chrome_version})")
+            return entry["driver_path"]
+        raise RuntimeError(
+            f"No usable chromedriver in {self.manifest_path}. Run once with network access "
+            f"or pass --chromedriver /path/to/chromedriver."
+        )
+
+
+def start_shared_service(driver_path):
+    """Start one chromedriver process; every browser of the run attaches to its URL."""
+    service = Service(executable_path=driver_path)
+    service.start()
+    return service
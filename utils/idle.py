@@ -0,0 +1,76 @@
+# utils/idle.py
+import time
+
+from utils.cdp import execute_cdp
+
+# Counts in-flight fetch/XHR and stamps the time of the last network or DOM activity in
+# window.__idle. Installed once per browser before any page script runs (CDP); pages that
+# were already loaded get it injected on first use.
+IDLE_TRACKER_JS = """
+(function () {
+  if (window.__idle) return;
+  const s = window.__idle = {inflight: 0, last: performance.now()};
+  const touch = () => { s.last = performance.now(); };
+  const start = () => { s.inflight++; touch(); };
+  const done = () => { s.inflight = Math.max(0, s.inflight - 1); touch(); };
+  if (window.fetch) {
+    const fetch = window.fetch;
+    window.fetch = function () {
+      start();
+      let p;
+      try { p = fetch.apply(this, arguments); } catch (e) { done(); throw e; }
+      return p.then(r => { done(); return r; }, e => { done(); throw e; });
+    };
+  }
+  if (window.XMLHttpRequest) {
+    const send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+      start();
+      this.addEventListener('loadend', done, {once: true});
+      try { return send.apply(this, arguments); } catch (e) { done(); throw e; }
+    };
+  }
+  new MutationObserver(touch).observe(document,
+    {childList: true, subtree: true, attributes: true, characterData: true});
+})();
+"""
+
+# ms since the last network/DOM activity; 0 while loading or requests are in flight; null without tracker
+_QUIET_FOR_JS = """
+const s = window.__idle;
+if (!s) return null;
+if (document.readyState !== 'complete' || s.inflight > 0) return 0;
+return performance.now() - s.last;
+"""
+
+
+def install_idle_tracker(driver):
+    """Run IDLE_TRACKER_JS in every document the browser loads from now on. False without CDP."""
+    try:
+        execute_cdp(driver, "Page.addScriptToEvaluateOnNewDocument", {"source": IDLE_TRACKER_JS})
+        return True
+    except Exception:
+        return False
+
+
+def wait_until_idle(driver, quiet_ms=300, timeout=10, poll=0.05):
+    """
+    Block until the page is loaded, no fetch/XHR is in flight and neither the network nor
+    the DOM has changed for quiet_ms. Returns False (does not raise) if that does not happen
+    within timeout - a page that keeps polling or animating should not fail the step.
+    """
+    end = time.monotonic() + timeout
+    while True:
+        quiet = driver.execute_script(_QUIET_FOR_JS)
+        if quiet is None:
+            # Loaded before the tracker was installed: start tracking now, activity counts from here
+            driver.execute_script(IDLE_TRACKER_JS)
+            quiet = 0
+        if quiet >= quiet_ms:
+            return True
+        left = end - time.monotonic()
+        if left <= 0:
+            print(f"[idle] page not idle for {quiet_ms}ms within {timeout}s")
+            return False
+        # Nothing can complete the quiet period before (quiet_ms - quiet) has elapsed
+        time.sleep(min(left, max(poll, (quiet_ms - quiet) / 1000.0)))
@@ -0,0 +1,41 @@
+# utils/jsonstore.py
+"""
+JSON files under .cache/ that several pytest workers read and save concurrently: reads never
+fail (a missing, half-read or foreign file counts as empty), saves re-read the file, merge
+and replace it atomically.
+"""
+import os
+import json
+import threading
+
+
+def read_json(path, key=None, default=None):
+    """The document at path (or its `key` member); `default` ({}) if missing or unreadable."""
+    default = {} if default is None else default
+    try:
+        with open(path, encoding="utf-8") as f:
+            doc = json.load(f)
+    except (OSError, ValueError):
+        return default
+    if not isinstance(doc, dict):
+        return default
+    if key is None:
+        return doc
+    value = doc.get(key, default)
+    return value if isinstance(value, type(default)) else default
+
+
+def atomic_merge_save(path, merge_fn, indent=None):
+    """
+    Write merge_fn(current) to path, where current is the document as saved right now (by
+    this or another worker, {} if none) - so entries saved meanwhile are merged, not lost.
+    Written to a temp file and moved into place: readers never see a partial file.
+    Returns the written document.
+    """
+    doc = merge_fn(read_json(path))
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(doc, f, indent=indent)
+    os.replace(tmp, path)
+    return doc
@@ -0,0 +1,121 @@
+# utils/lexicon.py
+import os
+import re
+import hashlib
+import threading
+from collections import Counter
+
+from utils.jsonstore import atomic_merge_save, read_json
+
+LEXICON_PATH = os.path.join("data", "lexicon.txt")
+LEARNED_PATH = os.path.join(".cache", "spell", "learned.json")
+
+WORD_RE = re.compile(r"[A-Za-z]{3,}")
+_STRIP = "\"'.,;:!?()[]{}<>|/\\*"
+
+
+class Lexicon:
+    """
+    Domain vocabulary for the spelling checks, compiled once from data/lexicon.txt:
+      words    - frozen lower-case set (plus words learned from table data)
+      prefixes - tokens starting with one of these are IDs/codes
+      patterns - tokens fully matching one of these are IDs/codes (SN25, SHA-PN-0001, ...)
+    Code tokens are dropped before tokenizing, so they never reach the dictionary or the
+    suggestion search; `word in lexicon` checks accepted words case-insensitively.
+    """
+    def __init__(self, words=(), prefixes=(), patterns=(), learned=(), source=""):
+        self.words = frozenset(w.lower() for w in words)
+        self.prefixes = tuple(p.lower() for p in prefixes)
+        self._code = re.compile("|".join(f"(?:{p})" for p in patterns)) if patterns else None
+        self.learned = {w.lower() for w in learned}
+        self.fingerprint = hashlib.sha256(source.encode("utf-8")).hexdigest()[:16]
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path=LEXICON_PATH, learned_path=LEARNED_PATH):
+        words, prefixes, patterns = [], [], []
+        with open(path, encoding="utf-8") as f:
+            source = f.read()
+        for line in source.splitlines():
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if line.startswith("prefix:"):
+                prefixes.append(line[len("prefix:"):].strip())
+            elif line.startswith("pattern:"):
+                patterns.append(line[len("pattern:"):].strip())
+            else:
+                words.append(line)
+        learned = read_json(learned_path, "words", []) if learned_path else []
+        lex = cls(words, prefixes, patterns, learned, source)
+        lex.learned_path = learned_path
+        return lex
+
+    def __contains__(self, word):
+        w = word.lower()
+        return w in self.words or w in self.learned
+
+    def is_code(self, token):
+        if self.prefixes and token.lower().startswith(self.prefixes):
+            return True
+        return bool(self._code and self._code.fullmatch(token))
+
+    def words_in(self, text):
+        """Alphabetic words (3+ letters, original case) of text, skipping ID/code tokens."""
+        out = []
+        for raw in (text or "").split():
+            token = raw.strip(_STRIP)
+            if token and self.is_code(token):
+                continue
+            out.extend(WORD_RE.findall(token))
+        return out
+
+    def check_words(self, text):
+        """words_in(text) minus accepted words - what the dictionary still has to look at."""
+        return [w for w in self.words_in(text) if w not in self]
+
+    def drop_known(self, miss_map):
+        """miss_map without words accepted since it was computed (e.g. learned meanwhile)."""
+        return {w: s for w, s in miss_map.items() if w not in self}
+
+    # ---------- Learning from table data ----------
+    def harvest(self, cells, min_count=3):
+        """
+        Learn capitalized words / codes that recur in at least `min_count` table cells
+        (subject names, class codes). Returns the newly learned words.
+        Lower-case words are never learned, so a repeated typo in running text is still reported.
+        """
+        counts = Counter()
+        for cell in cells:
+            tokens = {t.strip(_STRIP) for t in (cell or "").split()}
+            counts.update(w for t in tokens if t and not self.is_code(t)
+                          for w in WORD_RE.findall(t) if w[0].isupper())
+        new = {w.lower() for w, n in counts.items() if n >= min_count and w not in self}
+        self.learn(new)
+        return sorted(new)
+
+    def learn(self, words):
+        """Accept words from now on (e.g. harvested in another process); saved by save_learned()."""
+        with self._lock:
+            self.learned |= {w.lower() for w in words}
+
+    def save_learned(self):
+        path = getattr(self, "learned_path", None)
+        if not path:
+            return
+        with self._lock:
+            atomic_merge_save(path, lambda current: {"words": sorted(set(current.get("words", [])) | self.learned)},
+                              indent=1)
+
+
+_lexicon = None
+_lexicon_lock = threading.Lock()
+
+
+def lexicon():
+    """The process-wide Lexicon (data/lexicon.txt, loaded on first use)."""
+    global _lexicon
+    with _lexicon_lock:
+        if _lexicon is None:
+            _lexicon = Lexicon.load()
+        return _lexicon
@@ -0,0 +1,106 @@
+# utils/link_cache.py
+import os
+import time
+import threading
+from urllib.parse import urlsplit, urlunsplit
+
+from utils.jsonstore import atomic_merge_save, read_json
+
+CACHE_PATH = os.path.join(".cache", "links", "status.json")
+
+
+def normalize_url(url):
+    """Cache key: lower-case scheme/host, default port and #fragment dropped, empty path -> '/'."""
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    port = parts.port
+    if port and not ((scheme == "http" and port == 80) or (scheme == "https" and port == 443)):
+        host = f"{host}:{port}"
+    return urlunsplit((scheme, host, parts.path or "/", parts.query, ""))
+
+
+def _key(url, scope=""):
+    # Anonymous, authenticated and SPA-route results for one URL are different facts
+    return f"{scope}:{normalize_url(url)}" if scope else normalize_url(url)
+
+
+class LinkStatusCache:
+    """
+    Healthy link statuses, shared by every test and worker in a run and kept between runs:
+      {"entries": {"[<scope>:]<normalized url>": {"status", "redirects", "checked_at"}}}
+    An entry younger than `ttl` seconds is served without a request. Only healthy results are
+    stored, so a broken link is re-checked every time it is seen.
+    Saving merges with what other workers wrote meanwhile (newest check wins) and replaces
+    the file atomically.
+    """
+    def __init__(self, path=CACHE_PATH, ttl=600):
+        self.path = path
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._mtime = None
+        self._entries = {}
+        self._dirty = False
+        self._reload()
+
+    def _read(self):
+        return read_json(self.path, "entries")
+
+    def _reload(self):
+        # Pick up entries other workers saved since we last looked
+        try:
+            mtime = os.path.getmtime(self.path)
+        except OSError:
+            return
+        if mtime != self._mtime:
+            self._mtime = mtime
+            for key, entry in self._read().items():
+                mine = self._entries.get(key)
+                if mine is None or mine.get("checked_at", 0) < entry.get("checked_at", 0):
+                    self._entries[key] = entry
+
+    def get(self, url, scope=""):
+        """Cached entry for url while it is fresh, else None (counts a hit or a miss)."""
+        key = _key(url, scope)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.time() - entry.get("checked_at", 0) > self.ttl:
+                self._reload()
+                entry = self._entries.get(key)
+            if entry is not None and time.time() - entry.get("checked_at", 0) <= self.ttl:
+                self.hits += 1
+                return entry
+            self.misses += 1
+            return None
+
+    def put(self, url, status, redirects=(), scope=""):
+        with self._lock:
+            self._entries[_key(url, scope)] = {"status": status, "redirects": [list(h) for h in redirects],
+                                                 "checked_at": time.time()}
+            self._dirty = True
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            now = time.time()
+
+            def merge(current):
+                merged = {k: e for k, e in current.get("entries", {}).items()
+                          if now - e.get("checked_at", 0) <= self.ttl}
+                for key, entry in self._entries.items():
+                    other = merged.get(key)
+                    if other is None or other.get("checked_at", 0) < entry.get("checked_at", 0):
+                        merged[key] = entry
+                return {"entries": merged}
+
+            self._entries = atomic_merge_save(self.path, merge)["entries"]
+            self._mtime = os.path.getmtime(self.path)
+            self._dirty = False
+
+    def stats(self):
+        total = self.hits + self.misses
+        rate = f"{100 * self.hits / total:.0f}%" if total else "n/a"
+        return f"Link status cache: {self.hits} hits, {self.misses} misses (hit rate {rate}, ttl {self.ttl:g}s)"
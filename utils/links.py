@@ -0,0 +1,183 @@
+# utils/links.py
+import time
+import threading
+from collections import namedtuple, defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.cookies import create_cookie
+
+ALLOWED_STATUSES = {200, 204, 301, 302, 303, 307, 308}
+
+# status: final HTTP status (None on network error / deadline)
+# redirects: [(url, status), ...] hops before the final response
+# latency: seconds spent on this URL (HEAD + GET fallback)
+# ttfb: seconds from sending the final request to its response headers (None if not measured)
+LinkResult = namedtuple("LinkResult", "url ok status redirects latency error ttfb", defaults=(None,))
+
+# Storage keys an SPA typically keeps its API token under
+TOKEN_KEYS = ("token", "access_token", "accessToken", "authToken", "auth_token", "jwt", "id_token")
+
+_BROWSER_JS = """
+const pick = (keys) => { for (const k of keys) { const v = localStorage.getItem(k) || sessionStorage.getItem(k); if (v) return v; } return null; };
+return {ua: navigator.userAgent, origin: location.origin, token: pick(arguments[0])};
+"""
+
+
+class LinkChecker:
+    """
+    Checks URLs concurrently over one pooled keep-alive Session.
+      max_workers - URLs in flight overall
+      per_host    - URLs in flight per host (don't hammer the app server)
+      timeout     - per request (connect + read)
+      deadline    - whole check() call; URLs still pending then are reported as timed out
+      cache       - optional LinkStatusCache; fresh healthy URLs are answered without a request
+    HEAD first, GET when the server rejects HEAD - same rule the tests used before. The GET
+    asks for one byte (Range: bytes=0-0) and is streamed, so no body beyond the headers is
+    downloaded. Hosts whose HEAD fails where the GET succeeds are remembered and probed with
+    the GET only from then on.
+    use_browser_session(driver) makes the checks authenticated: cookies, User-Agent and the
+    SPA's bearer token are copied from the logged-in browser. The token is only sent to the
+    app's own host, and a link that still ends up on the login page counts as broken.
+    """
+    def __init__(self, timeout=15, max_workers=16, per_host=6, deadline=60, allowed=ALLOWED_STATUSES, cache=None):
+        self.timeout = timeout
+        self.max_workers = max(1, int(max_workers))
+        self.per_host = max(1, int(per_host))
+        self.deadline = deadline
+        self.allowed = set(allowed)
+        self.cache = cache
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=self.max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._hosts = defaultdict(lambda: threading.BoundedSemaphore(self.per_host))
+        self._hosts_lock = threading.Lock()
+        self.scope = ""             # cache scope: "auth" once the browser session is used
+        self.login_path = None
+        self._host_headers = {}     # netloc -> extra headers (auth token for the app host only)
+        self._head_support = {}     # netloc -> False once HEAD was seen failing where GET works
+        self.ttfb = {}              # url -> ttfb of its last probe (see slowest())
+
+    def use_browser_session(self, driver, login_path="/login"):
+        """Copy cookies + auth headers of the live WebDriver session. Returns the number of cookies copied."""
+        info = driver.execute_script(_BROWSER_JS, list(TOKEN_KEYS)) or {}
+        cookies = driver.get_cookies()
+        host = urlsplit(info.get("origin") or driver.current_url).netloc
+        for c in cookies:
+            self.session.cookies.set_cookie(create_cookie(
+                c["name"], c["value"], domain=c.get("domain") or host.split(":")[0], path=c.get("path", "/"),
+                secure=bool(c.get("secure")), expires=c.get("expiry"),
+                rest={"HttpOnly": None} if c.get("httpOnly") else {}))
+        if info.get("ua"):
+            self.session.headers["User-Agent"] = info["ua"]
+        token = (info.get("token") or "").strip('"')
+        if token:
+            self._host_headers[host] = {"Authorization": token if " " in token else f"Bearer {token}"}
+        self.scope = "auth"
+        self.login_path = login_path
+        return len(cookies)
+
+    def _host_slot(self, url):
+        with self._hosts_lock:
+            return self._hosts[urlsplit(url).netloc]
+
+    def _get(self, url, timeout, headers):
+        # One byte at most: 206 for servers that honour Range, otherwise headers only (body left unread)
+        r = self.session.get(url, allow_redirects=True, timeout=timeout, stream=True,
+                             headers={**(headers or {}), "Range": "bytes=0-0"})
+        if r.status_code == 416:    # empty resource; Range cannot be satisfied
+            r.close()
+            r = self.session.get(url, allow_redirects=True, timeout=timeout, stream=True, headers=headers)
+        return r
+
+    def _status(self, r):
+        return 200 if r.status_code == 206 else r.status_code
+
+    def check_one(self, url, timeout=None):
+        timeout = timeout or self.timeout
+        start = time.monotonic()
+        host = urlsplit(url).netloc
+        headers = self._host_headers.get(host)
+        with self._host_slot(url):
+            try:
+                r = None
+                if self._head_support.get(host) is not False:
+                    r = self.session.head(url, allow_redirects=True, timeout=timeout, headers=headers)
+                if r is None or self._status(r) not in self.allowed:
+                    head = r
+                    r = self._get(url, timeout, headers)
+                    if head is not None:
+                        head.close()
+                        if self._status(r) in self.allowed and host not in self._head_support:
+                            self._head_support[host] = False
+                            print(f"[links] {host}: HEAD returned {head.status_code}, GET works; GET only from now on")
+                else:
+                    self._head_support.setdefault(host, True)
+                ttfb = r.elapsed.total_seconds()
+                if r.status_code == 206 and r.headers.get("Content-Length") == "1":
+                    r.content       # read the single byte so the keep-alive connection goes back to the pool
+                r.close()   # status is all we need; an unread body is dropped with the connection
+            except requests.RequestException as e:
+                return LinkResult(url, False, None, [], time.monotonic() - start, type(e).__name__)
+        self.ttfb[url] = ttfb
+        status = self._status(r)
+        hops = [(h.url, h.status_code) for h in r.history]
+        if self.login_path and hops and urlsplit(r.url).path.rstrip("/") == self.login_path.rstrip("/"):
+            # Authenticated, yet bounced to the login page: the target rejected the session
+            return LinkResult(url, False, status, hops, time.monotonic() - start, "redirected to login", ttfb)
+        return LinkResult(url, status in self.allowed, status, hops, time.monotonic() - start, None, ttfb)
+
+    def check(self, urls):
+        """LinkResult per distinct URL, in input order. Wall time ~ the slowest URL, capped by deadline."""
+        urls = list(dict.fromkeys(urls))
+        results = {}
+        todo = []
+        for u in urls:
+            hit = self.cache.get(u, self.scope) if self.cache else None
+            if hit is not None:
+                hops = [tuple(h) for h in hit.get("redirects", [])]
+                results[u] = LinkResult(u, True, hit.get("status"), hops, 0.0, None)
+            else:
+                todo.append(u)
+        if todo:
+            self._check_all(todo, results)
+            if self.cache:
+                for u in todo:
+                    if results[u].ok:
+                        self.cache.put(u, results[u].status, results[u].redirects, self.scope)
+                self.cache.save()
+        return [results[u] for u in urls]
+
+    def _check_all(self, urls, results):
+        ends = time.monotonic() + self.deadline if self.deadline else None
+        ex = ThreadPoolExecutor(max_workers=min(self.max_workers, len(urls)), thread_name_prefix="links")
+        try:
+            pending = {ex.submit(self.check_one, u): u for u in urls}
+            while pending:
+                left = None if ends is None else ends - time.monotonic()
+                if left is not None and left <= 0:
+                    break
+                done, _ = wait(pending, timeout=left, return_when=FIRST_COMPLETED)
+                for f in done:
+                    res = f.result()
+                    results[res.url] = res
+                    pending.pop(f)
+            for u in pending.values():
+                results[u] = LinkResult(u, False, None, [], self.deadline, "deadline exceeded")
+        finally:
+            # Don't wait for stragglers past the deadline; their requests time out on their own
+            ex.shutdown(wait=False, cancel_futures=True)
+
+    def broken(self, urls):
+        """[(url, status)] of the URLs that failed - the shape the link tests report."""
+        return [(r.url, r.status) for r in self.check(urls) if not r.ok]
+
+    def slowest(self, n=5):
+        """[(url, ttfb)] of the n slowest links probed so far (cached links are not probed)."""
+        return sorted(self.ttfb.items(), key=lambda kv: kv[1], reverse=True)[:n]
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,167 @@
+# utils/locator_cache.py
+"""
+Which fallback locator actually works, per page object and logical element, kept across runs.
+
+    python -m utils.locator_cache [--min-attempts 3]     # print winners, dead locators, time lost
+"""
+import os
+import re
+import sys
+import argparse
+import threading
+
+from utils.jsonstore import atomic_merge_save, read_json
+
+LOCATOR_CACHE_PATH = os.path.join(".cache", "locators", "stats.json")
+_POSITION = re.compile(r"\[\d+\]")
+
+
+def locator_id(locator):
+    """
+    Stable id of a (By, selector) pair - candidates are matched by value, not list position.
+    Positional predicates are normalized (tr[3] -> tr[n]) so row-parametrized locators share stats.
+    """
+    by, sel = locator
+    return f"{by}|{_POSITION.sub('[n]', sel)}"
+
+
+class LocatorStats:
+    """
+    Per element key ("SessionPage.save"):
+      {"last": <locator id of the last winner>, "resolved": n, "timeouts": n, "seconds_lost": s,
+       "candidates": {<locator id>: {"wins": n, "hits": n, "misses": n, "win_seconds": s}}}
+    hits/misses: whether the candidate matched at the moment the element was resolved (a
+    candidate that never matches is dead weight); wins/win_seconds: how often and how fast it
+    was the one clicked. order() puts the last winner first so it takes precedence when
+    several candidates match.
+    Counters are added to the file on save (merging with other workers; utils.jsonstore).
+    """
+    def __init__(self, path=LOCATOR_CACHE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._data = self._read()
+        self._delta = {}
+        self.touched = set()        # keys resolved in this process
+
+    def _read(self):
+        return read_json(self.path, "elements")
+
+    def order(self, key, candidates):
+        """candidates with the last recorded winner moved to the front."""
+        with self._lock:
+            last = self._data.get(key, {}).get("last")
+        if not last:
+            return list(candidates)
+        first = [c for c in candidates if locator_id(c) == last]
+        return first + [c for c in candidates if locator_id(c) != last]
+
+    def record(self, key, candidates, winner=None, matched=(), seconds=0.0):
+        """
+        One resolution of `key`: winner = index into candidates (None on timeout), matched =
+        indices that were available at that moment, seconds = time spent resolving.
+        """
+        with self._lock:
+            self.touched.add(key)
+            for target in (self._data, self._delta):
+                entry = target.setdefault(key, {})
+                cands = entry.setdefault("candidates", {})
+                for i, c in enumerate(candidates):
+                    stats = cands.setdefault(locator_id(c), {})
+                    field = "hits" if i in matched else "misses"
+                    stats[field] = stats.get(field, 0) + 1
+                if winner is None:
+                    entry["timeouts"] = entry.get("timeouts", 0) + 1
+                    entry["seconds_lost"] = entry.get("seconds_lost", 0.0) + seconds
+                else:
+                    stats = cands[locator_id(candidates[winner])]
+                    stats["wins"] = stats.get("wins", 0) + 1
+                    stats["win_seconds"] = stats.get("win_seconds", 0.0) + seconds
+                    entry["resolved"] = entry.get("resolved", 0) + 1
+                    entry["last"] = locator_id(candidates[winner])
+
+    def save(self):
+        with self._lock:
+            if not self._delta:
+                return
+
+            def merge(current):
+                merged = current.get("elements", {})     # counts other workers / runs saved meanwhile
+                for key, delta in self._delta.items():
+                    entry = merged.setdefault(key, {})
+                    for field in ("resolved", "timeouts", "seconds_lost"):
+                        if field in delta:
+                            entry[field] = entry.get(field, 0) + delta[field]
+                    if "last" in delta:
+                        entry["last"] = delta["last"]
+                    for cid, stats in delta.get("candidates", {}).items():
+                        mine = entry.setdefault("candidates", {}).setdefault(cid, {})
+                        for field, value in stats.items():
+                            mine[field] = mine.get(field, 0) + value
+                return {"elements": merged}
+
+            self._data = atomic_merge_save(self.path, merge, indent=1)["elements"]
+            self._delta = {}
+
+    # ---------- Reporting ----------
+    def _entries(self, keys):
+        return sorted((k, e) for k, e in self._data.items() if keys is None or k in keys)
+
+    def dead(self, min_attempts=3, keys=None):
+        """[(key, locator id, misses)] of candidates that have never matched in min_attempts+ resolutions."""
+        out = []
+        for key, entry in self._entries(keys):
+            for cid, stats in entry.get("candidates", {}).items():
+                if not stats.get("hits") and stats.get("misses", 0) >= min_attempts:
+                    out.append((key, cid, stats["misses"]))
+        return out
+
+    def summary_lines(self, min_attempts=3, keys=None):
+        """One line per element (winner, wins, timeouts and time lost), then the dead locators."""
+        lines = []
+        for key, entry in self._entries(keys):
+            cands = entry.get("candidates", {})
+            last = entry.get("last")
+            won = cands.get(last, {})
+            avg = won.get("win_seconds", 0.0) / won["wins"] if won.get("wins") else 0.0
+            lines.append(f"{key}: winner {last.split('|', 1)[1] if last else '-'} "
+                         f"({won.get('wins', 0)}/{entry.get('resolved', 0)} wins, avg {avg:.2f}s)"
+                         + (f", {entry['timeouts']} timeouts ({entry.get('seconds_lost', 0.0):.1f}s lost)"
+                            if entry.get("timeouts") else ""))
+        dead = self.dead(min_attempts, keys)
+        if dead:
+            lines.append(f"Dead locators (never matched in {min_attempts}+ attempts):")
+            lines.extend(f"  {key}: {cid.split('|', 1)[1]} ({misses} misses)" for key, cid, misses in dead)
+        return lines
+
+
+_stats = None
+_stats_lock = threading.Lock()
+
+
+def locator_stats():
+    """The process-wide LocatorStats (loaded on first use)."""
+    global _stats
+    with _stats_lock:
+        if _stats is None:
+            _stats = LocatorStats()
+        return _stats
+
+
+def save_locator_stats():
+    """Persist the counters if locators were resolved in this process."""
+    if _stats is not None:
+        _stats.save()
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Show which fallback locators win and which are dead.")
+    ap.add_argument("--path", default=LOCATOR_CACHE_PATH)
+    ap.add_argument("--min-attempts", type=int, default=3, help="Resolutions before a never-matching locator counts as dead")
+    args = ap.parse_args(argv)
+    lines = LocatorStats(args.path).summary_lines(args.min_attempts)
+    print("\n".join(lines) if lines else f"No locator statistics in {args.path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
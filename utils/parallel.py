@@ -0,0 +1,168 @@
+# utils/parallel.py
+import os
+import sys
+import json
+import subprocess
+
+from utils.report_render import render
+
+WORKER_ENV = "PYTEST_WORKER_INDEX"
+SHARD_ENV = "PYTEST_SHARD_FILE"
+JOURNAL_NAME = "report_journal.jsonl"
+RESULTS_NAME = "results.jsonl"
+
+
+def worker_index():
+    """Index of this worker process, or None in the controller / a normal serial run."""
+    value = os.getenv(WORKER_ENV)
+    return int(value) if value not in (None, "") else None
+
+
+def worker_dir(index, root="artifacts"):
+    return os.path.join(root, f"worker-{index}")
+
+
+def shard(nodeids, workers):
+    """Round-robin split that keeps each worker's tests in collection order."""
+    return [nodeids[i::workers] for i in range(workers)]
+
+
+def _worker_args(invocation_args):
+    """Controller CLI args minus the --workers option (workers run serially)."""
+    out, skip = [], False
+    for arg in invocation_args:
+        if skip:
+            skip = False
+            continue
+        if arg == "--workers":
+            skip = True
+            continue
+        if arg.startswith("--workers="):
+            continue
+        out.append(arg)
+    return out
+
+
+def keep_shard_items(config, items):
+    """Worker side: deselect every collected test that is not in this worker's shard file."""
+    path = os.getenv(SHARD_ENV)
+    if not path:
+        return
+    with open(path, encoding="utf-8") as f:
+        wanted = {line.strip() for line in f if line.strip()}
+    keep = [it for it in items if it.nodeid in wanted]
+    dropped = [it for it in items if it.nodeid not in wanted]
+    if dropped:
+        config.hook.pytest_deselected(items=dropped)
+    items[:] = keep
+
+
+class ResultLog:
+    """Worker side: every test report, serialized as pytest-xdist does, one JSON line each."""
+    def __init__(self, config, path):
+        self.config = config
+        self.file = open(path, "w", encoding="utf-8")
+
+    def pytest_runtest_logreport(self, report):
+        data = self.config.hook.pytest_report_to_serializable(config=self.config, report=report)
+        self.file.write(json.dumps(data) + "\n")
+        self.file.flush()
+
+    def pytest_unconfigure(self, config):
+        self.file.close()
+
+
+def start_result_log(config):
+    """Register the worker's ResultLog (artifacts/worker-N/results.jsonl) for the controller to replay."""
+    wdir = worker_dir(worker_index())
+    os.makedirs(wdir, exist_ok=True)
+    config.pluginmanager.register(ResultLog(config, os.path.join(wdir, RESULTS_NAME)), "parallel-result-log")
+
+
+def _replay_results(config, path, worker):
+    """
+    Controller side: feed a worker's reports into this session's hooks, so the terminal shows
+    per-test outcomes, FAILURES and the pass/fail counts. Returns (counts, failing nodeids).
+    """
+    counts, failing = {}, []
+    try:
+        with open(path, encoding="utf-8") as f:
+            lines = [ln for ln in f if ln.strip()]
+    except OSError:
+        return counts, failing
+    for line in lines:
+        rep = config.hook.pytest_report_from_serializable(config=config, data=json.loads(line))
+        if isinstance(rep.longrepr, list):
+            rep.longrepr = tuple(rep.longrepr)      # skip reason (path, line, msg); JSON made it a list
+        if rep.when == "setup":
+            config.hook.pytest_runtest_logstart(nodeid=rep.nodeid, location=rep.location)
+        config.hook.pytest_runtest_logreport(report=rep)
+        if rep.when == "call" or not rep.passed:
+            outcome = "error" if rep.failed and rep.when != "call" else rep.outcome
+            counts[outcome] = counts.get(outcome, 0) + 1
+            if rep.failed:
+                failing.append((rep.nodeid, outcome))
+        if rep.when == "teardown":
+            config.hook.pytest_runtest_logfinish(nodeid=rep.nodeid, location=rep.location)
+    print(f"\n[parallel] worker-{worker}: " + (", ".join(f"{n} {k}" for k, n in sorted(counts.items())) or "no results"))
+    for nodeid, outcome in failing:
+        print(f"[parallel] worker-{worker} {outcome.upper()} {nodeid}")
+    return counts, failing
+
+
+def run_parallel(session, workers, root="artifacts", image_width=1200, jpeg_quality=0):
+    """
+    Controller: start one pytest process per shard, each with its own browser and
+    artifacts/worker-N/ folder, wait for all of them, replay their test reports into this
+    session (terminal outcomes, FAILURES, counts, exit status), then merge their report
+    journals into artifacts/TestSummary.pdf/.docx in collection order.
+    """
+    nodeids = [item.nodeid for item in session.items]
+    args = _worker_args(list(session.config.invocation_params.args))
+    procs = []
+    for i, ids in enumerate(shard(nodeids, workers)):
+        if not ids:
+            continue
+        wdir = worker_dir(i, root)
+        os.makedirs(wdir, exist_ok=True)
+        journal = os.path.join(wdir, JOURNAL_NAME)
+        for stale in (journal, os.path.join(wdir, RESULTS_NAME)):
+            if os.path.exists(stale):
+                os.remove(stale)     # left by a previous run: would be merged / replayed twice
+        shard_file = os.path.join(wdir, "shard.txt")
+        with open(shard_file, "w", encoding="utf-8") as f:
+            f.write("\n".join(ids))
+        env = dict(os.environ, **{WORKER_ENV: str(i), SHARD_ENV: os.path.abspath(shard_file)})
+        log = open(os.path.join(wdir, "pytest.log"), "w", encoding="utf-8")
+        cmd = [sys.executable, "-m", "pytest", *args, "-p", "no:cacheprovider"]
+        print(f"[parallel] worker-{i}: {len(ids)} tests -> {wdir}")
+        procs.append((i, subprocess.Popen(cmd, stdout=log, stderr=subprocess.STDOUT, env=env), log, journal))
+
+    crashed = 0
+    journals = []
+    for i, proc, log, journal in procs:
+        code = proc.wait()
+        log.close()
+        journals.append(journal)
+        print(f"[parallel] worker-{i} exit code {code}: {_last_line(log.name)} (log: {log.name})")
+        counts, failing = _replay_results(session.config, os.path.join(os.path.dirname(journal), RESULTS_NAME), i)
+        # 0 = all passed, 5 = nothing collected; a failing exit without failing tests is a crashed worker
+        if code not in (0, 5) and not failing:
+            crashed += 1
+
+    render(journals, test_order=nodeids, root=root, image_width=image_width, jpeg_quality=jpeg_quality)
+    print(f"[report] Merged {len(journals)} worker journals -> {root}/TestSummary.pdf, {root}/TestSummary.docx")
+    # Replayed failures are already counted by the session; crashed workers are added on top
+    session.testsfailed += crashed
+    return True
+
+
+def _last_line(path):
+    # pytest's final "N passed, M failed in Xs" line
+    try:
+        with open(path, encoding="utf-8", errors="replace") as f:
+            lines = [ln.strip() for ln in f if ln.strip()]
+        return lines[-1].strip("= ") if lines else ""
+    except OSError:
+        return ""
+
@@ -1,14 +1,22 @@
+import io
 import os
 import datetime
 from docx import Document
 from docx.shared import Inches
+from docx.oxml.shape import CT_Inline
 from PIL import Image  # noqa: F401  (Pillow required by python-docx for image handling)
 
+from utils.shot_store import ScreenshotStore
+from utils.report_images import ReportImageCache
+from utils.screenshot_writer import write_png
+
 class DocxReport:
-    def __init__(self, out_path="artifacts/TestSummary.docx"):
+    def __init__(self, out_path="artifacts/TestSummary.docx", images=None):
         self.out_path = out_path
         os.makedirs(os.path.dirname(out_path), exist_ok=True)
         self.doc = Document()
+        self.images = images or ReportImageCache()   # shared with PdfReport: decode once, embed rendition
+        self._images = {}   # screenshot path -> (rId, filename, cx, cy); same path = same content
         self._add_meta()
 
     def _add_meta(self):
@@ -23,7 +31,21 @@ class DocxReport:
         if description:
             self.doc.add_paragraph(description)
         if screenshot_path and os.path.exists(screenshot_path):
-            self.doc.add_picture(screenshot_path, width=Inches(6.5))
+            rendition = self.images.get(screenshot_path)
+            if rendition:
+                self._add_picture(screenshot_path, io.BytesIO(rendition.data))
+
+    def _add_picture(self, key, source, width=Inches(6.5)):
+        """Embed a picture; a repeated frame reuses the image part parsed the first time."""
+        cached = self._images.get(key) if key else None
+        if cached is None:
+            rId, img = self.doc.part.get_or_add_image(source)
+            cached = (rId, img.filename, *img.scaled_dimensions(width, None))
+            if key:
+                self._images[key] = cached
+        rId, filename, cx, cy = cached
+        inline = CT_Inline.new_pic_inline(self.doc.part.next_id, rId, filename, cx, cy)
+        self.doc.add_paragraph().add_run()._r.add_drawing(inline)
 
     def add_info(self, text):
         self.doc.add_paragraph(text)
@@ -32,19 +54,52 @@ class DocxReport:
         self.doc.save(self.out_path)
 
 class ScreenshotHelper:
-    def __init__(self, driver, report: DocxReport):
+    def __init__(self, driver, report: DocxReport, folder=None, writer=None, store=None, policy=None):
         self.driver = driver
         self.report = report
-        self.folder = os.path.join("artifacts", "screenshots")
+        self.folder = folder or os.path.join("artifacts", "screenshots")
+        self.writer = writer                # ScreenshotWriter: write files off the test thread
+        self.store = store or ScreenshotStore(self.folder)   # content-addressed blobs + name index
+        self.policy = policy                # CapturePolicy or None (= keep every capture)
         os.makedirs(self.folder, exist_ok=True)
 
-    def capture(self, name, add_to_report=True, description=None):
-        safe = "".join([c if c.isalnum() or c in ("_","-") else "_" for c in name])
-        path = os.path.join(
-            self.folder,
-            f"{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}_{safe}.png"
-        )
-        self.driver.save_screenshot(path)
+    def _persist(self, name, png, keep=None):
+        # Identical frames share one blob; only the first occurrence is written. Frames with a
+        # keep() verdict pending all go to the writer, which judges them in capture order.
+        path, is_new = self.store.put(name, png)
+        if keep is not None:
+            self.writer.submit(path, png, keep)
+        elif is_new:
+            if self.writer:
+                self.writer.submit(path, png)
+            else:
+                write_png(path, png)
+        return path
+
+    def capture(self, name, add_to_report=True, description=None, failed=False):
+        """
+        Screenshot + DOCX step. Returns the screenshot path, or None when the capture
+        policy dropped (or buffered) the frame; the step heading is still reported.
+        With a writer, on-visual-change frames are judged on the writer thread: the path is
+        returned, and a frame found unchanged is not written (reports show no image for it,
+        unless the very same frame is already on disk).
+        """
+        frames = []
+        defer = self.writer is not None and self.policy is not None and self.policy.deferred
+        if self.policy is None:
+            frames = [(name, self.driver.get_screenshot_as_png())]
+        elif self.policy.wants_frame(failed):
+            frames = self.policy.admit(name, self.driver.get_screenshot_as_png(), failed, defer=defer)
+
+        path = None
+        if frames:
+            # Any earlier frames were held in memory until this failure (last-K-before-failure)
+            for frame_name, frame_png in frames[:-1]:
+                frame_path = self._persist(frame_name, frame_png)
+                if add_to_report:
+                    self.report.add_step(title=f"{frame_name} (before failure)", screenshot_path=frame_path)
+            keep = (lambda png: self.policy.keep_changed(png, failed)) if defer else None
+            path = self._persist(name, frames[-1][1], keep)
         if add_to_report:
             self.report.add_step(title=name, description=description, screenshot_path=path)
         return path
@@ -0,0 +1,83 @@
+# utils/report_images.py
+import io
+import os
+from collections import OrderedDict, namedtuple
+
+from PIL import Image
+
+# data: encoded bytes ready to embed; width/height: pixel size of the rendition
+Rendition = namedtuple("Rendition", "data width height")
+
+
+class ReportImageCache:
+    """
+    Decode each screenshot once and produce the report-sized rendition both renderers embed.
+    PdfReport and DocxReport share one instance, so a step's image is read and decoded a single
+    time instead of once per report, and both documents carry the smaller rendition.
+      max_width    - downscale wider frames (report pages are ~6.5in wide; 1200px is plenty)
+      jpeg_quality - 0 keeps PNG; 1..95 re-encodes as JPEG (much smaller, slightly softer text)
+      folder       - optional on-disk rendition cache, so renderers in other processes reuse the
+                     work instead of decoding the full-size screenshot again
+    """
+    def __init__(self, max_width=1200, jpeg_quality=0, max_entries=128, folder=None):
+        self.max_width = int(max_width or 0)
+        self.jpeg_quality = int(jpeg_quality or 0)
+        self.max_entries = max_entries
+        self.folder = folder
+        self.decoded = 0
+        self._cache = OrderedDict()     # key -> Rendition (LRU)
+
+    def _render(self, source):
+        img = Image.open(source)
+        img.load()
+        self.decoded += 1
+        if self.max_width and img.width > self.max_width:
+            img = img.resize((self.max_width, img.height * self.max_width // img.width), Image.LANCZOS)
+        out = io.BytesIO()
+        if self.jpeg_quality:
+            img.convert("RGB").save(out, format="JPEG", quality=self.jpeg_quality, optimize=True)
+        else:
+            img.save(out, format="PNG")
+        return Rendition(out.getvalue(), img.width, img.height)
+
+    def _disk_path(self, key):
+        stem = os.path.splitext(os.path.basename(key))[0]
+        ext = "jpg" if self.jpeg_quality else "png"
+        return os.path.join(self.folder, f"{stem}_w{self.max_width}_q{self.jpeg_quality}.{ext}")
+
+    def _load_disk(self, path):
+        with open(path, "rb") as f:
+            data = f.read()
+        with Image.open(io.BytesIO(data)) as img:      # header only, no pixel decode
+            return Rendition(data, img.width, img.height)
+
+    def _store_disk(self, path, rendition):
+        os.makedirs(self.folder, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.part"
+        with open(tmp, "wb") as f:
+            f.write(rendition.data)
+        os.replace(tmp, path)
+
+    def get(self, screenshot_path):
+        """Rendition of the screenshot at screenshot_path; None if it is missing or unreadable."""
+        key = screenshot_path
+        if not key:
+            return None
+        hit = self._cache.get(key)
+        if hit is not None:
+            self._cache.move_to_end(key)
+            return hit
+        disk = self._disk_path(key) if self.folder else None
+        try:
+            if disk and os.path.exists(disk):
+                rendition = self._load_disk(disk)
+            else:
+                rendition = self._render(screenshot_path)
+                if disk:
+                    self._store_disk(disk, rendition)
+        except (OSError, ValueError):
+            return None
+        self._cache[key] = rendition
+        if len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+        return rendition
@@ -0,0 +1,112 @@
+# utils/report_journal.py
+import os
+import json
+import time
+import threading
+
+
+class StepJournal:
+    """
+    Drop-in stand-in for PdfReport/DocxReport (add_title/add_step/add_info/save) that appends
+    one JSON record per call to a JSONL file instead of laying out a document. Step records
+    also carry the step's status, start time and duration as fields (rendered into the heading
+    on replay), so journals can be queried without parsing titles.
+    Records carry the running test's nodeid and a sequence number, so journals written by
+    several processes can be merged in a stable order and replayed into the real reports.
+    """
+    current_test = None          # nodeid of the running test (set from the runtest hook)
+    _seq = 0
+    _lock = threading.Lock()
+
+    def __init__(self, path, target):
+        self.path = path
+        self.target = target     # "pdf" or "docx"
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    def _append(self, kind, **fields):
+        with StepJournal._lock:
+            StepJournal._seq += 1
+            rec = {"seq": StepJournal._seq, "test": StepJournal.current_test,
+                   "target": self.target, "kind": kind, **fields}
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(rec) + "\n")
+
+    def add_title(self, text):
+        self._append("title", text=text)
+
+    def add_step(self, title, description=None, screenshot_path=None, status=None, ts=None, duration=None):
+        """
+        status: "PASSED"/"FAILED" (None for plain notes); ts: wall-clock start (epoch seconds);
+        duration: seconds the step took. The screenshot is journaled by path; the screenshot
+        writer is flushed before the journal is replayed.
+        """
+        self._append("step", title=title, description=description, screenshot=screenshot_path,
+                     status=status, ts=ts if ts is not None else time.time(), duration=duration)
+
+    def add_info(self, text):
+        self._append("info", text=text)
+
+    def save(self):
+        # Records are written as they happen; nothing is buffered
+        pass
+
+
+def read_journal(path):
+    records = []
+    try:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue        # torn last line of a killed worker
+    except OSError:
+        pass
+    return records
+
+
+def merge_journals(paths, test_order):
+    """
+    Merge records of several journals. Test records follow `test_order` (collection order),
+    then their own sequence; records written outside any test go last, per journal.
+    """
+    rank = {nodeid: i for i, nodeid in enumerate(test_order)}
+    tail = len(rank)
+    merged = []
+    for j, path in enumerate(paths):
+        for rec in read_journal(path):
+            test = rec.get("test")
+            key = (rank.get(test, tail), j if test not in rank else 0, rec.get("seq", 0))
+            merged.append((key, rec))
+    merged.sort(key=lambda kv: kv[0])
+    return [rec for _, rec in merged]
+
+
+def step_heading(rec):
+    """Report heading of a step record: "PASSED: Title (1.2 s)"."""
+    title = rec.get("title", "")
+    if rec.get("status"):
+        title = f"{rec['status']}: {title}"
+    if rec.get("duration") is not None:
+        title = f"{title} ({rec['duration']:.1f} s)"
+    return title
+
+
+def replay(records, report_pdf=None, report_docx=None, skip_titles=True):
+    """Feed journal records into real report objects."""
+    targets = {"pdf": report_pdf, "docx": report_docx}
+    for rec in records:
+        report = targets.get(rec.get("target"))
+        if report is None:
+            continue
+        kind = rec.get("kind")
+        if kind == "title":
+            if not skip_titles:
+                report.add_title(rec.get("text", ""))
+        elif kind == "step":
+            report.add_step(step_heading(rec), rec.get("description"), screenshot_path=rec.get("screenshot"))
+        elif kind == "info":
+            report.add_info(rec.get("text", ""))
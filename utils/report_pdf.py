@@ -5,19 +5,69 @@ from reportlab.lib.pagesizes import A4
 from reportlab.lib.utils import ImageReader
 from reportlab.pdfgen import canvas
 from reportlab.lib.units import cm
+from reportlab.pdfbase.pdfmetrics import stringWidth
+
+from utils.report_images import ReportImageCache
+
+def _split_token(token, max_width, width_of):
+    """Hard-break a token wider than the line (URL, file path) at character boundaries."""
+    pieces, start, acc = [], 0, 0.0
+    for i, ch in enumerate(token):
+        cw = width_of(ch)
+        if acc + cw > max_width and i > start:
+            pieces.append(token[start:i])
+            start, acc = i, 0.0
+        acc += cw
+    pieces.append(token[start:])
+    return pieces
+
+
+def wrap_lines(text, max_width, width_of):
+    """
+    Greedy word wrap in linear time: each word is measured once (width_of is cached per word)
+    and the line width is built up incrementally. Line breaks in `text` are kept, so
+    tracebacks stay readable; tokens wider than max_width are split.
+    """
+    space = width_of(" ")
+    lines = []
+    for para in (text or "").splitlines():
+        line, line_w = [], 0.0
+        for word in para.split():
+            w = width_of(word)
+            if w > max_width:
+                if line:
+                    lines.append(" ".join(line))
+                    line, line_w = [], 0.0
+                *full, word = _split_token(word, max_width, width_of)
+                lines.extend(full)
+                w = width_of(word)
+            extra = w + space if line else w
+            if line and line_w + extra > max_width:
+                lines.append(" ".join(line))
+                line, line_w = [word], w
+            else:
+                line.append(word)
+                line_w += extra
+        if line:
+            lines.append(" ".join(line))
+    return lines
+
 
 class PdfReport:
     """
     Simple PDF report with a consistent API: add_title(), add_step(), add_info(), save()
     Output: artifacts/TestSummary.pdf
     """
-    def __init__(self, out_path="artifacts/TestSummary.pdf"):
+    def __init__(self, out_path="artifacts/TestSummary.pdf", images=None):
         self.out_path = out_path
         os.makedirs(os.path.dirname(out_path), exist_ok=True)
         self.buffer = io.BytesIO()
         self.c = canvas.Canvas(self.buffer, pagesize=A4)
         self.width, self.height = A4
         self.cursor_y = self.height - 2*cm
+        self.images = images or ReportImageCache()   # shared with DocxReport: decode once, embed rendition
+        self._images = {}   # screenshot path -> ImageReader; same path = same content
+        self._widths = {}   # (font, size) -> {word: width}
         self._add_header_meta()
 
     def _add_header_meta(self):
@@ -29,27 +79,26 @@ class PdfReport:
         self.c.showPage()
         self.cursor_y = self.height - 2*cm
 
+    def _width_of(self, font, size):
+        """Cached stringWidth for one font/size (widths are additive for the standard fonts)."""
+        cache = self._widths.setdefault((font, size), {})
+        def width_of(s):
+            w = cache.get(s)
+            if w is None:
+                w = cache[s] = stringWidth(s, font, size)
+            return w
+        return width_of
+
     def _write_wrapped(self, text, font="Helvetica", size=11, leading=14, max_width=None):
-        self.c.setFont(font, size)
         if max_width is None:
             max_width = self.width - 4*cm
-        words = text.split()
-        line = ""
-        for w in words:
-            candidate = (line + " " + w).strip()
-            if self.c.stringWidth(candidate, font, size) <= max_width:
-                line = candidate
-            else:
-                self.c.drawString(2*cm, self.cursor_y, line)
-                self.cursor_y -= leading
-                if self.cursor_y < 3*cm:
-                    self._flush_page()
-                line = w
-        if line:
+        self.c.setFont(font, size)
+        for line in wrap_lines(text, max_width, self._width_of(font, size)):
             self.c.drawString(2*cm, self.cursor_y, line)
             self.cursor_y -= leading
             if self.cursor_y < 3*cm:
                 self._flush_page()
+                self.c.setFont(font, size)   # showPage() resets the graphics state
 
     def add_title(self, text):
         self.c.setFont("Helvetica-Bold", 16)
@@ -72,7 +121,14 @@ class PdfReport:
         # Screenshot
         if screenshot_path and os.path.exists(screenshot_path):
             try:
-                img = ImageReader(screenshot_path)
+                img = self._images.get(screenshot_path)
+                if img is None:
+                    # Decoded once per distinct frame; reportlab also stores the pixels once per file
+                    rendition = self.images.get(screenshot_path)
+                    if rendition is None:
+                        return
+                    img = ImageReader(io.BytesIO(rendition.data))
+                    self._images[screenshot_path] = img
                 # Fit width to page with margins, keep aspect
                 img_w, img_h = img.getSize()
                 max_w = self.width - 4*cm
@@ -0,0 +1,100 @@
+# utils/report_render.py
+"""
+Build TestSummary.pdf / TestSummary.docx from step journals (JSONL written by StepJournal).
+
+Runs at session end from conftest, after a --workers run from the controller, or standalone
+(e.g. after a killed run - the journal on disk is complete up to the last step):
+
+    python -m utils.report_render artifacts/report_journal.jsonl
+    python -m utils.report_render artifacts/worker-*/report_journal.jsonl --jpeg-quality 80
+"""
+import os
+import sys
+import glob
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+from utils.report_pdf import PdfReport
+from utils.report import DocxReport
+from utils.report_images import ReportImageCache
+from utils.report_journal import merge_journals, replay
+
+PDF_TITLE = "School Manager – Automated Test Report (PDF)"
+DOCX_TITLE = "School Manager – Automated Test Report (DOCX)"
+
+
+def _images(root, image_width, jpeg_quality):
+    # On-disk renditions: whichever process renders a frame first, the others reuse it
+    return ReportImageCache(max_width=image_width, jpeg_quality=jpeg_quality,
+                            folder=os.path.join(root, ".renditions"))
+
+
+def _prepare_rendition(args):
+    path, root, image_width, jpeg_quality = args
+    _images(root, image_width, jpeg_quality).get(path)
+
+
+def render_pdf(records, root="artifacts", image_width=1200, jpeg_quality=0):
+    out = os.path.join(root, "TestSummary.pdf")
+    pdf = PdfReport(out_path=out, images=_images(root, image_width, jpeg_quality))
+    pdf.add_title(PDF_TITLE)
+    replay(records, report_pdf=pdf)
+    pdf.save()
+    return out
+
+
+def render_docx(records, root="artifacts", image_width=1200, jpeg_quality=0):
+    out = os.path.join(root, "TestSummary.docx")
+    docx = DocxReport(out_path=out, images=_images(root, image_width, jpeg_quality))
+    docx.add_title(DOCX_TITLE)
+    replay(records, report_docx=docx)
+    docx.save()
+    return out
+
+
+def render(journals, test_order=(), root="artifacts", image_width=1200, jpeg_quality=0, processes=True):
+    """
+    Merge journals and write both reports. With processes=True the distinct screenshots are
+    downscaled in a process pool first, then PDF and DOCX are laid out in two parallel processes.
+    """
+    records = merge_journals(journals, list(test_order))
+    shots = sorted({r["screenshot"] for r in records
+                    if r.get("kind") == "step" and r.get("screenshot") and os.path.exists(r["screenshot"])})
+    opts = (root, image_width, jpeg_quality)
+    if processes:
+        try:
+            with ProcessPoolExecutor() as ex:
+                list(ex.map(_prepare_rendition, [(p, *opts) for p in shots], chunksize=8))
+                pdf = ex.submit(render_pdf, records, *opts)
+                docx = ex.submit(render_docx, records, *opts)
+                return [pdf.result(), docx.result()]
+        except OSError as e:
+            # e.g. no fork/spawn permitted on the agent - fall back to in-process rendering
+            print(f"[report] Parallel rendering unavailable ({e}); rendering in-process")
+    return [render_pdf(records, *opts), render_docx(records, *opts)]
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Render PDF/DOCX test reports from step journals.")
+    ap.add_argument("journals", nargs="*", help="Journal files (default: artifacts/report_journal.jsonl)")
+    ap.add_argument("--out", default="artifacts", help="Output folder for TestSummary.pdf/.docx")
+    ap.add_argument("--image-width", type=int, default=1200, help="Embedded screenshot width in px (0 = full)")
+    ap.add_argument("--jpeg-quality", type=int, default=0, help="Embed screenshots as JPEG (0 = PNG)")
+    ap.add_argument("--serial", action="store_true", help="Render in this process only")
+    args = ap.parse_args(argv)
+
+    journals = []
+    for pattern in args.journals or [os.path.join("artifacts", "report_journal.jsonl")]:
+        journals.extend(sorted(glob.glob(pattern)) or [pattern])
+    missing = [j for j in journals if not os.path.exists(j)]
+    if missing:
+        print(f"Journal not found: {', '.join(missing)}")
+        return 2
+    for out in render(journals, root=args.out, image_width=args.image_width,
+                      jpeg_quality=args.jpeg_quality, processes=not args.serial):
+        print(f"[report] Saved {out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
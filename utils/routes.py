@@ -0,0 +1,165 @@
+# utils/routes.py
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from utils.links import LinkResult
+from utils.tabs import TabLoader
+
+# Paths served by the backend (plain HTTP checks), not by the SPA router
+API_PREFIXES = ("/api/", "/storage/", "/uploads/")
+NOT_FOUND_TEXT = r"\b404\b|page not found|not found|does not exist"
+
+# "not found" | "ok:<text length>" | null (not rendered yet)
+_ROUTE_STATE_JS = """
+const re = new RegExp(arguments[0], 'i'), sel = arguments[1];
+if (sel && document.querySelector(sel)) return 'not found';
+const heads = [document.title].concat(Array.from(
+  document.querySelectorAll('h1, h2, h3, [class*="not-found"], [class*="notfound"], [class*="error-page"]'),
+  e => e.innerText || ''));
+if (heads.some(t => re.test(t))) return 'not found';
+const body = document.body ? (document.body.innerText || '').trim() : '';
+return body.length ? 'ok:' + body.length : null;
+"""
+
+
+def split_links(urls, origin, api_prefixes=API_PREFIXES):
+    """
+    (routes, http_urls): same-origin URLs without a file extension (and outside the API
+    prefixes) are client-side routes; assets, API endpoints and other hosts are plain HTTP.
+    """
+    origin = origin.rstrip("/")
+    host = urlsplit(origin).netloc
+    routes, http = [], []
+    for u in dict.fromkeys(urls):
+        parts = urlsplit(u)
+        path = parts.path or "/"
+        is_route = (parts.netloc == host and not path.startswith(api_prefixes)
+                    and not os.path.splitext(path.rstrip("/"))[1])
+        (routes if is_route else http).append(u)
+    return routes, http
+
+
+class RouteValidator:
+    """
+    Resolves SPA routes in background tabs of the logged-in browser - an anonymous HTTP
+    request only ever sees the app shell. A route is broken when it lands on the login page,
+    renders a "not found" state (NOT_FOUND_TEXT in the title/headings, or not_found_selector),
+    or renders nothing within render_timeout. The page is read once its text stays the same
+    for one poll, so a layout rendered before the route content does not count as ok.
+    Results are kept for the validator's lifetime; healthy ones also go to the optional
+    LinkStatusCache (scope "route"). Uses the driver: call it from the test thread only.
+    """
+    def __init__(self, driver, tabs=2, page_timeout=30, render_timeout=5, poll=0.25,
+                 not_found_text=NOT_FOUND_TEXT, not_found_selector=None, login_path="/login", cache=None):
+        self.driver = driver
+        self.tabs = tabs
+        self.page_timeout = page_timeout
+        self.render_timeout = render_timeout
+        self.poll = poll
+        self.not_found_text = not_found_text
+        self.not_found_selector = not_found_selector
+        self.login_path = login_path
+        self.cache = cache
+        self._results = {}
+
+    def _state(self):
+        end = time.monotonic() + self.render_timeout
+        last = None
+        while True:
+            state = self.driver.execute_script(_ROUTE_STATE_JS, self.not_found_text, self.not_found_selector)
+            if state == "not found" or (state is not None and state == last):
+                return state
+            if time.monotonic() >= end:
+                return state if state else None
+            last = state
+            time.sleep(self.poll)
+
+    def _verdict(self, url, final_url, seconds, error):
+        if error:
+            return LinkResult(url, False, "not loaded", [], seconds, error)
+        hops = [(final_url, None)] if final_url.split("#")[0] != url.split("#")[0] else []
+        login = self.login_path and self.login_path.rstrip("/")
+        if login and urlsplit(final_url).path.rstrip("/") == login != urlsplit(url).path.rstrip("/"):
+            return LinkResult(url, False, "login", hops, seconds, "redirected to login")
+        state = self._state()
+        if state is None:
+            return LinkResult(url, False, "empty", hops, seconds, f"nothing rendered after {self.render_timeout}s")
+        if state == "not found":
+            return LinkResult(url, False, "not found", hops, seconds, "not found page")
+        return LinkResult(url, True, "ok", hops, seconds, None)
+
+    def observe(self, url, final_url, seconds, error=None):
+        """
+        Verdict for a route the caller has just loaded itself, with the driver on its tab
+        (e.g. a crawled page). Kept like check() results, so the route is not loaded again.
+        """
+        result = self._verdict(url, final_url, seconds, error)
+        self._results[url] = result
+        if self.cache and result.ok:
+            self.cache.put(url, "ok", result.redirects, "route")
+        return result
+
+    def check(self, urls):
+        """LinkResult per distinct route, in input order."""
+        urls = list(dict.fromkeys(urls))
+        todo = []
+        for u in urls:
+            if u in self._results:
+                continue
+            hit = self.cache.get(u, "route") if self.cache else None
+            if hit is not None:
+                self._results[u] = LinkResult(u, True, "ok", [tuple(h) for h in hit.get("redirects", [])], 0.0, None)
+            else:
+                todo.append(u)
+        if todo:
+            pending = iter(todo)
+
+            def next_route():
+                u = next(pending, None)
+                return (u, u) if u else None
+
+            current = self.driver.current_window_handle
+            try:
+                with TabLoader(self.driver, tabs=min(self.tabs, len(todo)), page_timeout=self.page_timeout,
+                               background=True) as loader:
+                    for url, final_url, seconds, error in loader.load(next_route):
+                        self._results[url] = self._verdict(url, final_url, seconds, error)
+            finally:
+                self.driver.switch_to.window(current)
+            if self.cache:
+                for u in todo:
+                    if self._results[u].ok:
+                        self.cache.put(u, "ok", self._results[u].redirects, "route")
+        if self.cache:
+            self.cache.save()       # also persists observe()d routes; no-op when nothing changed
+        return [self._results[u] for u in urls]
+
+    def broken(self, urls):
+        """[(url, reason)] of the routes that failed - same shape as LinkChecker.broken()."""
+        return [(r.url, r.status) for r in self.check(urls) if not r.ok]
+
+
+class SiteLinkChecker:
+    """
+    Broken links of a logged-in app: SPA routes through the RouteValidator (browser), every
+    other URL through the authenticated LinkChecker (HTTP). The HTTP checks run in a
+    background thread while the routes resolve.
+    """
+    def __init__(self, checker, validator, origin):
+        self.checker = checker
+        self.validator = validator
+        self.origin = origin
+
+    def split(self, urls):
+        return split_links(urls, self.origin)
+
+    def broken(self, urls):
+        routes, http = self.split(urls)
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="site-links") as ex:
+            http_job = ex.submit(self.checker.broken, http) if http else None
+            bad = dict(self.validator.broken(routes)) if routes else {}
+            if http_job:
+                bad.update(http_job.result())
+        return [(u, bad[u]) for u in dict.fromkeys(urls) if u in bad]
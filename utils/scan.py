@@ -0,0 +1,177 @@
+# utils/scan.py
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing.util import Finalize
+
+from utils.dom import collect_anchors, get_table_cells, get_visible_text_refs, highlight_words
+from utils.lexicon import lexicon
+from utils.routes import split_links
+from utils.spell import analyze_incremental, save_engine, spell_engine
+from utils.tabs import TabLoader
+
+
+def _spell_worker_init():
+    # Pool process: load the dictionary up front; save the memo once, when the pool shuts down
+    spell_engine()
+    Finalize(None, save_engine, exitpriority=10)
+
+
+def _spell_job(text, prev=None, learned=()):
+    # Runs in a pool process (or in-process with processes=0)
+    lexicon().learn(learned)
+    return analyze_incremental(text, prev)
+
+
+class PageScan:
+    def __init__(self, title, route, url):
+        self.title = title
+        self.route = route
+        self.url = url
+        self.final_url = None
+        self.load_seconds = None
+        self.error = None
+        self.text = ""
+        self.refs = []              # [(word, element_index)] - see get_visible_text_refs()
+        self.links = []             # http(s) hrefs on the page
+        self.words = []
+        self.misspelled = {}        # word -> suggestion
+        self.spelling = None        # "cached" | "changed" | "new" (None = spelling off)
+        self.broken = []            # [(url, status)]
+
+    def __repr__(self):
+        return f"PageScan({self.route!r}, error={self.error!r})"
+
+
+class ScanRunner:
+    """
+    Read-only scan of several routes in one logged-in browser:
+      - pages load concurrently in `tabs` tabs (TabLoader)
+      - as soon as a page is ready its text and links are read and the page is handed off:
+        spelling goes to a pool of `processes` worker processes (CPU-bound), link checks to
+        the LinkChecker (network-bound) - both run while the next pages are still loading
+      - on_page(scan) is called with the driver on that page's tab (e.g. for a screenshot)
+    With a PageSpellStore, unchanged pages are answered from the store without analysis.
+    Recurring capitalized words in table cells (subject names, class codes) are learned into
+    the lexicon before a page is checked (harvest=False turns that off).
+    processes=0 runs spelling in this process instead.
+    With a RouteValidator, same-origin SPA routes are resolved in the browser after all pages
+    are read (once per route for the whole run) and only the remaining URLs go over HTTP.
+    """
+    def __init__(self, driver, base_url, tabs=3, spelling=True, link_checker=None, store=None,
+                 processes=2, page_timeout=30, harvest=True, route_validator=None):
+        self.driver = driver
+        self.base_url = base_url.rstrip("/")
+        self.tabs = tabs
+        self.spelling = spelling
+        self.link_checker = link_checker
+        self.store = store
+        self.processes = processes
+        self.page_timeout = page_timeout
+        self.harvest = harvest
+        self.route_validator = route_validator
+
+    def _spell_pool(self):
+        if not self.spelling or self.processes <= 0:
+            return None
+        try:
+            # spawn, not fork: the test process has threads running (dictionary prewarm, screenshot
+            # writer) and a forked child could inherit a lock one of them holds, e.g. _engine_lock
+            return ProcessPoolExecutor(max_workers=self.processes, initializer=_spell_worker_init,
+                                       mp_context=multiprocessing.get_context("spawn"))
+        except (OSError, NotImplementedError) as e:
+            print(f"[scan] Process pool unavailable ({e}); spelling in-process")
+            return None
+
+    def _submit_spelling(self, pool, scan):
+        prev = None
+        if self.store is not None:
+            digest, prev = self.store.lookup(scan.route, scan.text)
+            if prev and prev.get("hash") == digest:
+                scan.words, scan.spelling = prev["words"], "cached"
+                scan.misspelled = lexicon().drop_known(prev["misspelled"])
+                return None
+        learned = sorted(lexicon().learned)
+        if pool is not None:
+            try:
+                return pool.submit(_spell_job, scan.text, prev, learned)
+            except (BrokenProcessPool, RuntimeError):
+                pass
+        return _spell_job(scan.text, prev)
+
+    def _finish_spelling(self, scan, job):
+        if job is None:
+            return
+        if not isinstance(job, tuple):
+            try:
+                job = job.result()
+            except BrokenProcessPool:
+                job = _spell_job(scan.text, None, sorted(lexicon().learned))
+        scan.words, scan.misspelled, scan.spelling = job
+        if self.store is not None:
+            self.store.record(scan.route, self.store.text_hash(scan.text), scan.words, scan.misspelled)
+
+    def run(self, pages, on_page=None):
+        """pages: [(title, route)] -> [PageScan] in the same order."""
+        scans = [PageScan(title, route, f"{self.base_url}{route}") for title, route in pages]
+        pending = iter(scans)
+        spell_jobs, link_jobs, routes = {}, {}, {}
+        pool = self._spell_pool()
+        links = ThreadPoolExecutor(max_workers=2, thread_name_prefix="scan-links") if self.link_checker else None
+
+        def next_page():
+            scan = next(pending, None)
+            return (scan.url, scan) if scan else None
+
+        try:
+            with TabLoader(self.driver, tabs=self.tabs, page_timeout=self.page_timeout) as loader:
+                for scan, final_url, seconds, error in loader.load(next_page):
+                    scan.final_url, scan.load_seconds, scan.error = final_url, seconds, error
+                    if error:
+                        continue
+                    scan.text, scan.refs = get_visible_text_refs(self.driver)
+                    scan.links = sorted({a["href"] for a in collect_anchors(self.driver)
+                                         if a["href"].startswith("http")})
+                    if links:
+                        http = scan.links
+                        if self.route_validator:
+                            routes[scan], http = split_links(scan.links, self.base_url)
+                        link_jobs[scan] = links.submit(self.link_checker.broken, http)
+                    if self.spelling:
+                        if self.harvest:
+                            learned = lexicon().harvest(get_table_cells(self.driver))
+                            if learned:
+                                print(f"[scan] {scan.route}: learned {', '.join(learned)}")
+                        spell_jobs[scan] = self._submit_spelling(pool, scan)
+                    if on_page:
+                        on_page(scan)
+            bad_routes = {}
+            if routes:
+                bad_routes = dict(self.route_validator.broken([u for r in routes.values() for u in r]))
+            for scan in scans:
+                if scan in spell_jobs:
+                    self._finish_spelling(scan, spell_jobs[scan])
+                if scan in link_jobs:
+                    bad = dict(link_jobs[scan].result())
+                    bad.update((u, bad_routes[u]) for u in routes.get(scan, ()) if u in bad_routes)
+                    scan.broken = [(u, bad[u]) for u in scan.links if u in bad]
+        finally:
+            if self.spelling and self.harvest:
+                lexicon().save_learned()
+            if pool:
+                pool.shutdown(cancel_futures=True)     # waits: each worker saves its memo on exit
+            if self.spelling:
+                save_engine()                          # in-process spelling (processes=0 / fallback)
+            if links:
+                links.shutdown(cancel_futures=True)
+        return scans
+
+    def highlight(self, scan, words=None):
+        """Mark a scanned page's misspellings, or just `words` (re-opened unless it is still the current page)."""
+        words = scan.misspelled if words is None else words
+        if not words:
+            return 0
+        if self.driver.current_url != scan.final_url:
+            self.driver.get(scan.url)
+        _, refs = get_visible_text_refs(self.driver)
+        return highlight_words(self.driver, refs, words)
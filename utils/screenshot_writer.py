@@ -0,0 +1,74 @@
+# utils/screenshot_writer.py
+import io
+import os
+import queue
+import threading
+
+from PIL import Image
+
+
+def encode_png(png, max_width=0):
+    """Downscale PNG bytes wider than max_width (0 = unchanged)."""
+    if not max_width:
+        return png
+    img = Image.open(io.BytesIO(png))
+    if img.width <= max_width:
+        return png
+    img.thumbnail((max_width, max_width * img.height // img.width))
+    out = io.BytesIO()
+    img.save(out, format="PNG")
+    return out.getvalue()
+
+
+def write_png(path, png, max_width=0):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".part"
+    with open(tmp, "wb") as f:
+        f.write(encode_png(png, max_width))
+    os.replace(tmp, path)       # readers never see a half-written PNG
+
+
+class ScreenshotWriter:
+    """
+    Background writer for screenshots grabbed as raw PNG bytes (driver.get_screenshot_as_png()).
+    Decoding, optional downscaling and disk I/O run on one worker thread; the bounded queue
+    applies back-pressure so a slow disk cannot make memory grow without limit.
+    Call flush() before anything reads the files back (report save, worker exit).
+    A job may carry keep(png): judged here, off the test thread; False drops the frame unwritten.
+    """
+    def __init__(self, max_queue=16, max_width=0):
+        self.max_width = int(max_width or 0)     # 0 = keep the browser's resolution
+        self.errors = 0
+        self.dropped = 0
+        self._q = queue.Queue(maxsize=max_queue)
+        self._thread = threading.Thread(target=self._run, name="screenshot-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, path, png, keep=None):
+        """Queue PNG bytes for `path`; blocks only while the queue is full."""
+        self._q.put((path, png, keep))
+
+    def _run(self):
+        while True:
+            item = self._q.get()
+            try:
+                if item is None:
+                    return
+                path, png, keep = item
+                if keep is not None and not keep(png):
+                    self.dropped += 1
+                    continue
+                write_png(path, png, self.max_width)
+            except Exception as e:
+                self.errors += 1
+                print(f"[shots] Write failed for {item[0]}: {e}")
+            finally:
+                self._q.task_done()
+
+    def flush(self):
+        self._q.join()
+
+    def close(self):
+        self.flush()
+        self._q.put(None)
+        self._thread.join()
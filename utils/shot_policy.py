@@ -0,0 +1,83 @@
+# utils/shot_policy.py
+import io
+from collections import deque
+
+from PIL import Image
+
+MODES = ("always", "failures-only", "every-Nth-step", "on-visual-change", "last-K-before-failure")
+
+
+def frame_thumb(png, size=16):
+    """
+    Tiny grayscale thumbnail (size*size bytes) - a visual fingerprint of the frame. The PNG
+    still has to be decoded in full (~20 ms for 1440x900; PNG has no reduced-size decode),
+    which is why ScreenshotHelper runs it on the screenshot writer thread when there is one.
+    """
+    return Image.open(io.BytesIO(png)).convert("L").resize((size, size)).tobytes()
+
+
+def frame_distance(a, b):
+    """Mean absolute per-pixel difference of two thumbnails (0..255)."""
+    return sum(abs(x - y) for x, y in zip(a, b)) / len(a)
+
+
+class CapturePolicy:
+    """
+    Decides which screenshots are persisted (disk + reports). One instance per test.
+      always                 - every capture (previous behaviour)
+      failures-only          - only captures made for a failure
+      every-Nth-step         - every Nth capture, plus failures
+      on-visual-change       - captures that visibly differ from the last kept frame, plus failures
+      last-K-before-failure  - keep the last K frames in memory; write them only when something fails
+    """
+    def __init__(self, mode="always", every_n=5, keep_last=3, change_threshold=2.0):
+        if mode not in MODES:
+            raise ValueError(f"Unknown screenshot policy '{mode}'. Choose one of: {', '.join(MODES)}")
+        self.mode = mode
+        self.every_n = max(1, int(every_n))
+        self.change_threshold = change_threshold    # min. mean thumbnail difference that counts as a change
+        self._count = 0
+        self._last_thumb = None
+        self._ring = deque(maxlen=max(1, int(keep_last)))
+
+    def wants_frame(self, failed=False):
+        """False when the frame would be dropped anyway - saves the browser round trip."""
+        self._count += 1
+        if failed:
+            return True
+        if self.mode == "failures-only":
+            return False
+        if self.mode == "every-Nth-step":
+            return (self._count - 1) % self.every_n == 0
+        return True
+
+    @property
+    def deferred(self):
+        """on-visual-change can be judged later, off the test thread (see keep_changed)."""
+        return self.mode == "on-visual-change"
+
+    def admit(self, name, png, failed=False, defer=False):
+        """
+        Return the (name, png) frames to persist now, oldest first (may be empty).
+        With defer, an on-visual-change frame is returned as is and the caller must run
+        keep_changed() on it - in capture order - before writing it.
+        """
+        if self.mode == "last-K-before-failure":
+            if not failed:
+                self._ring.append((name, png))
+                return []
+            frames = list(self._ring) + [(name, png)]
+            self._ring.clear()
+            return frames
+        if self.mode == "on-visual-change" and not defer and not self.keep_changed(png, failed):
+            return []
+        return [(name, png)]
+
+    def keep_changed(self, png, failed=False):
+        """on-visual-change: True if png visibly differs from the last kept frame (or failed)."""
+        thumb = frame_thumb(png)
+        changed = self._last_thumb is None or frame_distance(thumb, self._last_thumb) >= self.change_threshold
+        if not (changed or failed):
+            return False
+        self._last_thumb = thumb
+        return True
@@ -0,0 +1,42 @@
+# utils/shot_store.py
+import os
+import json
+import hashlib
+import datetime
+import threading
+
+
+class ScreenshotStore:
+    """
+    Content-addressed screenshot storage.
+      - blobs: <folder>/<sha256 of the PNG>.png, written once no matter how often the frame repeats
+      - index: <folder>/index.jsonl, one line per capture mapping the step name to its blob
+    Because identical frames resolve to the same path, reports can key their image caches by path.
+    """
+    def __init__(self, folder):
+        self.folder = folder
+        self.index_path = os.path.join(folder, "index.jsonl")
+        self.captures = 0
+        self.duplicates = 0
+        self._known = set()         # digests stored (or queued) during this run
+        self._lock = threading.Lock()
+        os.makedirs(folder, exist_ok=True)
+
+    def blob_path(self, digest):
+        return os.path.join(self.folder, f"{digest}.png")
+
+    def put(self, name, png):
+        """Register a capture. Returns (path, is_new); only new blobs need to be written."""
+        digest = hashlib.sha256(png).hexdigest()
+        path = self.blob_path(digest)
+        with self._lock:
+            is_new = digest not in self._known and not os.path.exists(path)
+            self._known.add(digest)
+            self.captures += 1
+            if not is_new:
+                self.duplicates += 1
+            entry = {"time": datetime.datetime.now().isoformat(timespec="seconds"),
+                     "name": name, "blob": digest}
+            with open(self.index_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry) + "\n")
+        return path, is_new
@@ -1,39 +1,264 @@
 # utils/spell.py
 import os
 import re
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from importlib.metadata import version, PackageNotFoundError
+
 from spellchecker import SpellChecker
 
-# Add/adjust to your domain
-WHITELIST = {
-    "Devant", "SN25", "SHT", "SHA", "PN", "Ben1234", "Bengali",
-    "SRU", "WhatsApp", "Kiwi", "Academics", "Signin", "svg",
-    "Dashboard", "Session", "Sessions", "Check", "Checkingv",
-    "EN", "English", "Subject", "Subjects"
-}
+from utils.jsonstore import atomic_merge_save, read_json
+from utils.lexicon import lexicon
+
+SPELL_CACHE_PATH = os.path.join(".cache", "spell", "memo.json")
+PAGE_STORE_PATH = os.path.join(".cache", "spell", "pages.json")
+BASELINE_PATH = os.path.join("data", "spelling_baseline.json")
 
 def tokenize_visible_text(text: str):
-    """Return list of English-like words, stripping numbers/punctuation; respects WHITELIST."""
-    words = re.findall(r"[A-Za-z]{3,}", text or "")
-    wl = {w.lower() for w in WHITELIST}
-    # keep words but mark misspellings later; whitelist only affects 'miss' set
-    return words, wl
+    """Return (words, lexicon): English-like words minus ID/code tokens; the lexicon only affects the 'miss' set."""
+    lex = lexicon()
+    return lex.words_in(text), lex
+
+class SpellEngine:
+    """
+    One SpellChecker per process (the frequency dictionary is parsed once) with a memo of
+    per-word results - known/unknown and the best suggestion - kept as an LRU and saved to
+    .cache/spell/memo.json so later runs skip words they have already seen.
+    Suggestions: edit distance 1 first; edit distance 2 only for words up to
+    max_e2_length letters and within suggest_budget seconds per word, so a long garbage
+    token cannot stall a scan. Suggestions cut short by the budget are not persisted.
+    """
+    def __init__(self, cache_path=SPELL_CACHE_PATH, max_entries=20000, suggest_budget=0.25, max_e2_length=12):
+        self.cache_path = cache_path
+        self.max_entries = max_entries
+        self.suggest_budget = suggest_budget
+        self.max_e2_length = max_e2_length
+        self.speller = SpellChecker()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._memo = OrderedDict()      # word -> {"known": bool, "suggestion": str|None, "partial": bool}
+        self._dirty = False
+        try:
+            self._tag = version("pyspellchecker")    # a new dictionary invalidates the memo
+        except PackageNotFoundError:
+            self._tag = "unknown"
+        self._load()
+
+    def _words(self, doc):
+        # Memo entries are only valid for the dictionary they were computed with
+        words = doc.get("words", {}) if doc.get("dictionary") == self._tag else {}
+        return words if isinstance(words, dict) else {}
+
+    def _read(self):
+        return self._words(read_json(self.cache_path))
+
+    def _load(self):
+        self._memo.update(self._read())
+
+    def _entry(self, word):
+        entry = self._memo.get(word)
+        if entry is not None:
+            self._memo.move_to_end(word)
+            self.hits += 1
+        return entry
+
+    def _remember(self, word, entry):
+        self._memo[word] = entry
+        self._memo.move_to_end(word)
+        self._dirty = True
+        while len(self._memo) > self.max_entries:
+            self._memo.popitem(last=False)
+
+    def unknown(self, words):
+        """Set of lower-cased words not in the dictionary (same contract as SpellChecker.unknown)."""
+        result = set()
+        with self._lock:
+            todo = []
+            for w in {w.lower() for w in words}:
+                entry = self._entry(w)
+                if entry is None:
+                    todo.append(w)
+                elif not entry["known"]:
+                    result.add(w)
+            if todo:
+                self.misses += len(todo)
+                miss = self.speller.unknown(todo)
+                for w in todo:
+                    self._remember(w, {"known": w not in miss})
+                result |= miss
+        return result
+
+    def _suggest(self, word):
+        known, freq = self.speller.known, self.speller.__getitem__
+        found = known(self.speller.edit_distance_1(word))
+        partial = False
+        if not found and len(word) <= self.max_e2_length:
+            ends = time.monotonic() + self.suggest_budget
+            for e1 in self.speller.edit_distance_1(word):
+                found |= known(self.speller.edit_distance_1(e1))
+                if time.monotonic() > ends:
+                    partial = True
+                    break
+        return (max(sorted(found), key=freq) if found else None), partial
+
+    def suggestion(self, word):
+        """Most frequent dictionary word within edit distance 1 (else 2), or None (always None for ID/code tokens)."""
+        if lexicon().is_code(word):
+            return None
+        w = word.lower()
+        with self._lock:
+            entry = self._entry(w)
+            if entry is not None and "suggestion" in entry:
+                return entry["suggestion"]
+            if entry is None:
+                self.misses += 1
+                entry = {"known": not self.speller.unknown([w])}
+            if entry["known"]:
+                entry["suggestion"] = w
+            else:
+                entry["suggestion"], partial = self._suggest(w)
+                if partial:
+                    entry["partial"] = True
+            self._remember(w, entry)
+            return entry["suggestion"]
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            def merge(current):
+                # Merge with what other workers saved; results are deterministic, so union is fine
+                merged = OrderedDict(self._words(current))
+                for w, entry in self._memo.items():
+                    if not entry.get("partial"):
+                        merged[w] = entry
+                        merged.move_to_end(w)
+                while len(merged) > self.max_entries:
+                    merged.popitem(last=False)
+                return {"dictionary": self._tag, "words": merged}
+
+            atomic_merge_save(self.cache_path, merge)
+            self._dirty = False
+
+
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def spell_engine():
+    """The process-wide SpellEngine (created on first use)."""
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = SpellEngine()
+        return _engine
+
+
+def prewarm():
+    """Load the dictionary in the background (e.g. while the first browser starts)."""
+    threading.Thread(target=spell_engine, name="spell-prewarm", daemon=True).start()
+
+
+def save_engine():
+    """Persist the memo if the engine was used in this process."""
+    if _engine is not None:
+        _engine.save()
+
+
+def _misspelled(words, lex):
+    """{word: suggestion} for the words (original case) the dictionary does not know."""
+    speller = spell_engine()
+    # miss: exclude lexicon words
+    miss = speller.unknown([w.lower() for w in words if w not in lex])
+    # best-effort single suggestion (memoized, time-bounded)
+    return {w: speller.suggestion(w.lower()) for w in words if w.lower() in miss}
 
 def analyze_text(text: str):
     """Return (unique_words_sorted, misspelled_map) where misspelled_map[w] = suggestion."""
-    speller = SpellChecker()
-    words, whitelist = tokenize_visible_text(text)
+    words, lex = tokenize_visible_text(text)
     uniq = sorted({w for w in words}, key=lambda s: (s.lower(), s))
-    # miss: exclude whitelisted words
-    lowers = [w.lower() for w in uniq if w.lower() not in whitelist]
-    miss = speller.unknown(lowers)
-    miss_map = {}
-    for w in uniq:
-        wl = w.lower()
-        if wl in miss:
-            # best-effort single suggestion
-            cand = next(iter(speller.candidates(wl)), None)
-            miss_map[w] = cand
-    return uniq, miss_map
+    return uniq, _misspelled(uniq, lex)
+
+
+def analyze_incremental(text, prev=None):
+    """
+    analyze_text() that reuses a previous PageSpellStore entry of the same page: misspellings
+    depend on the word only, so those still on the page are kept and only new words are
+    checked. Returns (unique_words_sorted, misspelled_map, "changed" | "new").
+    """
+    words, lex = tokenize_visible_text(text)
+    uniq = sorted({w for w in words}, key=lambda s: (s.lower(), s))
+    if not prev:
+        return uniq, _misspelled(uniq, lex), "new"
+    old = set(prev.get("words", []))
+    keep = set(uniq)
+    miss_map = {w: s for w, s in lex.drop_known(prev.get("misspelled", {})).items() if w in keep}
+    miss_map.update(_misspelled([w for w in uniq if w not in old], lex))
+    return uniq, {w: miss_map[w] for w in uniq if w in miss_map}, "changed"
+
+
+class PageSpellStore:
+    """
+    Per-route spelling results from earlier runs (.cache/spell/pages.json), keyed by route:
+      {"hash": sha256 of the normalized visible text, "words": [...], "misspelled": {...}, "report": path}
+    analyze() returns the stored result when the page text is unchanged ("cached"); for a
+    changed page only words that were not on it before are checked ("changed"); routes seen
+    for the first time are analyzed in full ("new"). The hash also covers data/lexicon.txt, so
+    editing the lexicon re-checks every page; words learned later are dropped from stored results.
+    """
+    def __init__(self, path=PAGE_STORE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._pages = self._read()
+        self._touched = set()
+
+    def _read(self):
+        return read_json(self.path, "pages")
+
+    @staticmethod
+    def text_hash(text):
+        h = hashlib.sha256(lexicon().fingerprint.encode("utf-8"))
+        h.update(b"\0" + " ".join((text or "").split()).encode("utf-8"))
+        return h.hexdigest()
+
+    def lookup(self, route, text):
+        """(digest, previous_entry or None); the entry is current when its hash equals digest."""
+        with self._lock:
+            return self.text_hash(text), self._pages.get(route)
+
+    def record(self, route, digest, words, miss_map):
+        with self._lock:
+            self._pages[route] = {"hash": digest, "words": words, "misspelled": miss_map}
+            self._touched.add(route)
+
+    def analyze(self, route, text):
+        """(unique_words_sorted, misspelled_map, status, previous_report_path)"""
+        digest, prev = self.lookup(route, text)
+        if prev and prev.get("hash") == digest:
+            return prev["words"], lexicon().drop_known(prev["misspelled"]), "cached", prev.get("report")
+        words, miss_map, status = analyze_incremental(text, prev)
+        self.record(route, digest, words, miss_map)
+        return words, miss_map, status, None
+
+    def set_report(self, route, path):
+        """Remember the TXT artifact written for route, so a cached page can reuse it."""
+        with self._lock:
+            if route in self._pages:
+                self._pages[route]["report"] = path
+                self._touched.add(route)
+
+    def save(self):
+        with self._lock:
+            if not self._touched:
+                return
+            mine = {r: self._pages[r] for r in self._touched}
+            # keeps routes other workers stored meanwhile
+            atomic_merge_save(self.path, lambda current: {"pages": {**current.get("pages", {}), **mine}})
+            self._touched.clear()
 
 def write_txt_report(path: str, page_title: str, url: str, words: list[str], miss_map: dict[str, str]):
     """Write a TXT report with All Words and Misspelled+suggestion sections."""
@@ -60,3 +285,79 @@ def write_txt_report(path: str, page_title: str, url: str, words: list[str], mis
     with open(path, "w", encoding="utf-8") as f:
         f.write("\n".join(lines))
     return path
+
+def element_refs(refs, words, context=8):
+    """
+    {word: [{"element": i, "context": "..."}]} for `words`, from get_visible_text_refs() refs:
+    the index of each source element plus a few words around the first hit as context.
+    """
+    wanted = {w: set() for w in words}
+    by_element = {}
+    for pos, (token, i) in enumerate(refs or []):
+        by_element.setdefault(i, []).append(pos)
+        for w in re.findall(r"[A-Za-z]{3,}", token):
+            if w in wanted:
+                wanted[w].add(i)
+    out = {}
+    for w, elements in wanted.items():
+        out[w] = []
+        for i in sorted(elements):
+            positions = by_element[i]
+            ctx = " ".join(refs[p][0] for p in positions[:context])
+            out[w].append({"element": i, "context": ctx + (" ..." if len(positions) > context else "")})
+    return out
+
+def write_json_report(path: str, page_title: str, url: str, words: list[str], miss_map: dict[str, str],
+                      refs=None, new_words=None):
+    """Machine-readable twin of write_txt_report (one JSON object per page)."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    elements = element_refs(refs, miss_map) if refs else {}
+    data = {
+        "page": page_title,
+        "url": url,
+        "word_count": len(words),
+        "misspelled_count": len(miss_map),
+        "misspelled": [
+            {"word": w, "suggestion": miss_map[w], "elements": elements.get(w, []),
+             **({"new": w.lower() in new_words} if new_words is not None else {})}
+            for w in sorted(miss_map, key=lambda s: s.lower())
+        ],
+        "words": words,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    return path
+
+
+class SpellingBaseline:
+    """
+    Reviewed, known misspellings per route (data/spelling_baseline.json, kept in git):
+      {"routes": {"/session": {"word": "suggestion", ...}}}
+    diff() separates a page's misspellings into new ones (not in the baseline) and known
+    ones, and lists baseline words that are gone (fixed). update() + save() accept the
+    current results as the new baseline.
+    """
+    def __init__(self, path=BASELINE_PATH):
+        self.path = path
+        try:
+            with open(path, encoding="utf-8") as f:
+                self.routes = json.load(f).get("routes", {})
+        except (OSError, ValueError, AttributeError):
+            self.routes = {}
+
+    def diff(self, route, miss_map):
+        """(new {word: suggestion}, known {word: suggestion}, fixed [word])"""
+        known = self.routes.get(route, {})
+        current = {w.lower() for w in miss_map}
+        new = {w: s for w, s in miss_map.items() if w.lower() not in known}
+        old = {w: s for w, s in miss_map.items() if w.lower() in known}
+        return new, old, sorted(w for w in known if w not in current)
+
+    def update(self, route, miss_map):
+        self.routes[route] = {w.lower(): s for w, s in sorted(miss_map.items(), key=lambda kv: kv[0].lower())}
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"routes": dict(sorted(self.routes.items()))}, f, indent=2)
+            f.write("\n")
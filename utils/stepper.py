@@ -1,3 +1,4 @@
+import time
 import traceback
 
 class Stepper:
@@ -12,29 +13,35 @@ class Stepper:
         self.report_pdf = report_pdf        # PdfReport or None
         self.report_docx = report_docx      # DocxReport or None
 
-    def _write_reports(self, title, description=None, screenshot_path=None, passed=True):
+    def _write_reports(self, title, description=None, screenshot_path=None, passed=True, ts=None, duration=None):
         status = "PASSED" if passed else "FAILED"
         # DOCX is already updated by ScreenshotHelper via shots.capture()
         # Add a line to PDF report as well
         if self.report_pdf:
             body = description or ""
-            self.report_pdf.add_step(f"{status}: {title}", body, screenshot_path=screenshot_path)
+            self.report_pdf.add_step(title, body, screenshot_path=screenshot_path,
+                                     status=status, ts=ts, duration=duration)
 
     def step(self, title, action=None, description=None):
         """
         Run an action and capture a screenshot (even on failure).
         Returns the action result (if any). Re-raises exceptions after logging.
         """
+        ts, t0 = time.time(), time.monotonic()
         try:
             result = action() if action else None
+            duration = time.monotonic() - t0
             shot = self.shots.capture(f"{title}")
-            self._write_reports(title, description=description, screenshot_path=shot, passed=True)
+            self._write_reports(title, description=description, screenshot_path=shot, passed=True,
+                                ts=ts, duration=duration)
             return result
         except Exception as e:
             # Capture failure screenshot + full traceback
+            duration = time.monotonic() - t0
             tb = traceback.format_exc()
-            shot = self.shots.capture(f"FAILED - {title}")
+            shot = self.shots.capture(f"FAILED - {title}", failed=True)
             # Add detailed info to PDF/DOCX
             fail_desc = (description + "\n\n" if description else "") + f"ERROR: {e}\n\n{tb}"
-            self._write_reports(title, description=fail_desc, screenshot_path=shot, passed=False)
+            self._write_reports(title, description=fail_desc, screenshot_path=shot, passed=False,
+                                ts=ts, duration=duration)
             raise
\ No newline at end of file
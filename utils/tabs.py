@@ -0,0 +1,95 @@
+# utils/tabs.py
+import time
+from collections import deque
+
+# Set on the old document before navigating; gone once the new document is live. A URL that
+# differs only by its #fragment navigates within the same document, which would keep the
+# flag forever: those get no flag and count as loaded right away.
+_NAVIGATE_JS = """
+const target = new URL(arguments[0], window.location.href).href;
+const sameDocument = target.includes('#') && target.split('#')[0] === window.location.href.split('#')[0];
+if (!sameDocument) window.__tabPending = true;
+window.location.href = target;
+"""
+_LOADED_JS = "return !window.__tabPending && document.readyState === 'complete' ? window.location.href : null;"
+
+
+class TabLoader:
+    """
+    Load pages concurrently in several tabs of one browser (same cookies/session).
+    load() keeps every tab busy: a page is handed to the caller as soon as it is ready,
+    with the driver switched to its tab, and that tab starts the next URL as soon as the
+    caller is done with it - so reading one page overlaps with the others loading.
+        with TabLoader(driver, tabs=3) as tabs:
+            for item, final_url, seconds, error in tabs.load(next_item):
+                ...
+    Extra tabs are closed on exit and the driver is switched back to the original one.
+    background=True leaves the original tab alone (its page stays as it is) and loads only
+    in new tabs.
+    """
+    def __init__(self, driver, tabs=3, page_timeout=30, poll=0.1, background=False):
+        self.driver = driver
+        self.tabs = max(1, int(tabs))
+        self.page_timeout = page_timeout
+        self.poll = poll
+        self.background = background
+        self.home = None
+        self.handles = []
+
+    def __enter__(self):
+        self.home = self.driver.current_window_handle
+        self.handles = [] if self.background else [self.home]
+        while len(self.handles) < self.tabs:
+            self.driver.switch_to.new_window("tab")
+            self.handles.append(self.driver.current_window_handle)
+        self.driver.switch_to.window(self.home)
+        return self
+
+    def __exit__(self, *exc):
+        for handle in self.handles:
+            if handle != self.home:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+        self.driver.switch_to.window(self.home)
+        self.handles = []
+
+    def _start(self, handle, url):
+        self.driver.switch_to.window(handle)
+        self.driver.execute_script(_NAVIGATE_JS, url)
+        return time.monotonic()
+
+    def _wait(self, started):
+        ends = started + self.page_timeout
+        while time.monotonic() < ends:
+            url = self.driver.execute_script(_LOADED_JS)
+            if url:
+                return url
+            time.sleep(self.poll)
+        return None
+
+    def load(self, next_item):
+        """
+        next_item() -> (url, item) for the next page, or None when there is nothing to start
+        right now (it is asked again after every page, so the caller may add work meanwhile).
+        Yields (item, final_url, seconds, error) in completion order.
+        """
+        idle = list(self.handles)
+        busy = deque()
+
+        def fill():
+            while idle:
+                nxt = next_item()
+                if nxt is None:
+                    return
+                handle = idle.pop(0)
+                busy.append((handle, nxt[1], self._start(handle, nxt[0])))
+
+        fill()
+        while busy:
+            handle, item, started = busy.popleft()
+            self.driver.switch_to.window(handle)
+            final_url = self._wait(started)
+            error = None if final_url else f"not loaded after {self.page_timeout}s"
+            yield item, final_url, time.monotonic() - started, error
+            idle.append(handle)
+            fill()